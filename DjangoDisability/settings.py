@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 
 import os
 from pathlib import Path
+from corsheaders.defaults import default_headers
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -32,6 +33,9 @@ DEBUG = os.environ.get('DEBUG', 'True') == 'True'
 
 ALLOWED_HOSTS = os.environ.get('ALLOWED_HOSTS', '').split(',') if os.environ.get('ALLOWED_HOSTS') else []
 CORS_ALLOW_ALL_ORIGINS = True
+# Browsers may only send/read these once CORS allows them
+CORS_ALLOW_HEADERS = (*default_headers, 'idempotency-key')
+CORS_EXPOSE_HEADERS = ['Idempotent-Replayed']
 
 
 # Application definition
@@ -54,6 +58,15 @@ INSTALLED_APPS = [
     'location',
     'users',  # Add users app
     'transfer',  # Add transfer app
+    'core',  # Cross-cutting infrastructure
+    'search',  # Full-text search index
+    'dashboard',  # Aggregated dashboard summary
+    'snapshots',  # Daily inventory snapshots
+    'sync',  # Change feed for offline devices
+    'inventory',  # Double-entry stock ledger
+    'warranties',  # Warranty expiry reports and digest
+    'labels',  # Barcode label rendering
+    'images',  # Resized variants of uploaded images
 ]
 
 # Custom user model
@@ -68,8 +81,49 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # Query-parameter filters/ordering declared per viewset via `filterset_class`
+    'DEFAULT_FILTER_BACKENDS': [
+        'core.filters.IndexedFilterBackend',
+    ],
+    # orjson-backed JSON; same media type and output as DRF's JSON classes
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'core.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    # Token buckets per user ('<scope>') and per branch ('<scope>.branch'),
+    # see core/throttling.py
+    'DEFAULT_THROTTLE_CLASSES': [
+        'core.throttling.TokenBucketThrottle',
+    ],
+    'DEFAULT_THROTTLE_RATES': {
+        'read': os.environ.get('THROTTLE_READ', '600/min'),
+        'read.branch': os.environ.get('THROTTLE_READ_BRANCH', '3000/min'),
+        'write': os.environ.get('THROTTLE_WRITE', '120/min'),
+        'write.branch': os.environ.get('THROTTLE_WRITE_BRANCH', '600/min'),
+        'analytics': os.environ.get('THROTTLE_ANALYTICS', '30/min'),
+        'analytics.branch': os.environ.get('THROTTLE_ANALYTICS_BRANCH', '120/min'),
+        'auth': os.environ.get('THROTTLE_AUTH', '10/min'),
+        # Requests creating or deleting many rows at once (receipts, list POSTs, cascading deletes)
+        'bulk': os.environ.get('THROTTLE_BULK', '10/min'),
+        'bulk.branch': os.environ.get('THROTTLE_BULK_BRANCH', '30/min'),
+    },
 }
 
+# Throttle buckets, dashboard summaries, coalesced results and replica pins live in the cache;
+# with several workers it must be shared, e.g. Redis.
+if os.environ.get('CACHE_REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['CACHE_REDIS_URL'],
+        }
+    }
+
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -79,6 +133,7 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
 ]
 
 ROOT_URLCONF = 'DjangoDisability.urls'
@@ -105,17 +160,115 @@ WSGI_APPLICATION = 'DjangoDisability.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# Connection reuse:
+# - DB_CONN_MAX_AGE keeps a per-thread connection open across requests
+#   (0 closes it after every request, None keeps it forever).
+# - DB_CONN_HEALTH_CHECKS pings reused connections before the first query.
+# - DB_TEST_NAME names the test database; for SQLite give a file path, as
+#   the default in-memory one can't take writes from concurrent threads.
+# - DB_POOL=True switches to a process-wide bounded pool shared by all threads;
+#   connections are returned to the pool at the end of every request.
+DB_POOL = os.environ.get('DB_POOL', 'False') == 'True'
+DB_ENGINE = os.environ.get('DB_ENGINE', 'django.db.backends.mysql')
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.mysql',
+        'ENGINE': 'core.db.backends.mysql_pool' if DB_POOL else DB_ENGINE,
         'NAME': os.environ.get('DB_NAME', 'DjangoDisability_db'),
         'USER': os.environ.get('DB_USER', 'root'),
         'PASSWORD': os.environ.get('DB_PASSWORD', 'Lumumba@2020'),
         'HOST': os.environ.get('DB_HOST', 'localhost'),
         'PORT': os.environ.get('DB_PORT', '3306'),
+        'CONN_MAX_AGE': 0 if DB_POOL else int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+        'CONN_HEALTH_CHECKS': os.environ.get('DB_CONN_HEALTH_CHECKS', 'True') == 'True',
+        'POOL': {
+            'MAX_SIZE': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+            'TIMEOUT': float(os.environ.get('DB_POOL_TIMEOUT', 5)),
+            'MAX_IDLE': int(os.environ.get('DB_POOL_MAX_IDLE', 300)),
+        },
+        'TEST': {'NAME': os.environ.get('DB_TEST_NAME') or None},
     }
 }
 
+# Read replicas: comma-separated hosts (database file paths for SQLite).
+# Safe reads are spread across them by core.db.routers.PrimaryReplicaRouter;
+# a client that writes is pinned to the primary for DB_REPLICA_PIN_SECONDS.
+for index, replica in enumerate(filter(None, os.environ.get('DB_REPLICAS', '').split(',')), start=1):
+    replica_key = 'NAME' if 'sqlite' in DATABASES['default']['ENGINE'] else 'HOST'
+    DATABASES[f'replica_{index}'] = {
+        **DATABASES['default'],
+        replica_key: replica.strip(),
+        'REPLICA_OF': 'default',
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['core.db.routers.PrimaryReplicaRouter']
+DB_REPLICA_PIN_SECONDS = int(os.environ.get('DB_REPLICA_PIN_SECONDS', 5))
+
+# What to do with ?ordering= combinations no index can serve: 'reject' (400) or 'warn' (log only)
+FILTERS_UNINDEXED_ORDERING = os.environ.get('FILTERS_UNINDEXED_ORDERING', 'reject')
+
+# How long a branch's /api/dashboard/ summary may be served from cache;
+# writes to assets, items, locations and transfers invalidate it sooner.
+DASHBOARD_CACHE_SECONDS = int(os.environ.get('DASHBOARD_CACHE_SECONDS', 30))
+
+# Coalesced endpoints (core.coalesce): how long a result is fresh, how long
+# after that it is still served while one request recomputes it, and the
+# longest a computation may hold the cross-process lock.
+COALESCE_FRESH_SECONDS = int(os.environ.get('COALESCE_FRESH_SECONDS', 10))
+COALESCE_STALE_SECONDS = int(os.environ.get('COALESCE_STALE_SECONDS', 60))
+COALESCE_LOCK_SECONDS = int(os.environ.get('COALESCE_LOCK_SECONDS', 30))
+
+# How long serialized asset and asset item list rows are cached per row
+# version (core.fragments); 0 serializes every row on every request.
+FRAGMENT_CACHE_SECONDS = int(os.environ.get('FRAGMENT_CACHE_SECONDS', 3600))
+
+# /api/sync/ holds back change log entries younger than this, so a slow
+# transaction can't commit a lower sequence number behind a client's watermark.
+SYNC_SETTLE_SECONDS = int(os.environ.get('SYNC_SETTLE_SECONDS', 2))
+
+# Idempotency-Key on POSTs (core.idempotency): how long responses are kept
+# for replay, and after how long an unfinished claim may be taken over.
+IDEMPOTENCY_TTL_SECONDS = int(os.environ.get('IDEMPOTENCY_TTL_SECONDS', 24 * 60 * 60))
+IDEMPOTENCY_LOCK_SECONDS = int(os.environ.get('IDEMPOTENCY_LOCK_SECONDS', 60))
+
+# Serial numbers each worker reserves per database round trip (assetitem.serials)
+SERIAL_BLOCK_SIZE = int(os.environ.get('SERIAL_BLOCK_SIZE', 100))
+
+# Cascading deletes (core.deletion): rows per DELETE statement and transaction,
+# the largest cascade still deleted within the request (bigger ones are queued
+# for run_deletion_jobs), and when a silent running job may be taken over.
+DELETION_CHUNK_SIZE = int(os.environ.get('DELETION_CHUNK_SIZE', 1000))
+DELETION_INLINE_LIMIT = int(os.environ.get('DELETION_INLINE_LIMIT', 5000))
+DELETION_JOB_STALE_SECONDS = int(os.environ.get('DELETION_JOB_STALE_SECONDS', 300))
+
+# Days a retired asset item stays in the live table before archive_retired_items moves it
+ARCHIVE_RETIRED_AFTER_DAYS = int(os.environ.get('ARCHIVE_RETIRED_AFTER_DAYS', 365))
+
+# Default look-ahead of /api/warranties/expiring/ and build_warranty_digest
+WARRANTY_EXPIRY_DAYS = int(os.environ.get('WARRANTY_EXPIRY_DAYS', 30))
+
+# Queued mail (core.mailer): messages per SMTP connection in send_queued_mail,
+# and how many times a failing message is tried before it is left alone.
+MAIL_BATCH_SIZE = int(os.environ.get('MAIL_BATCH_SIZE', 100))
+MAIL_MAX_ATTEMPTS = int(os.environ.get('MAIL_MAX_ATTEMPTS', 5))
+
+# Barcode labels (labels.pipeline): rendering processes (0: one per CPU), labels
+# per task handed to a process, label size and print resolution, and optional
+# TrueType font and logo image files (Pillow's built-in font when unset).
+LABEL_WORKERS = int(os.environ.get('LABEL_WORKERS', 0))
+LABEL_CHUNK_SIZE = int(os.environ.get('LABEL_CHUNK_SIZE', 64))
+LABEL_WIDTH_MM = float(os.environ.get('LABEL_WIDTH_MM', 50))
+LABEL_HEIGHT_MM = float(os.environ.get('LABEL_HEIGHT_MM', 25))
+LABEL_DPI = int(os.environ.get('LABEL_DPI', 300))
+LABEL_FONT = os.environ.get('LABEL_FONT', '')
+LABEL_LOGO = os.environ.get('LABEL_LOGO', '')
+
+# Bulk user provisioning (users.provisioning): password hashing processes
+# (0: one per CPU) and the most users one request or file may create.
+PROVISION_WORKERS = int(os.environ.get('PROVISION_WORKERS', 0))
+PROVISION_MAX_ROWS = int(os.environ.get('PROVISION_MAX_ROWS', 5000))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -153,6 +306,16 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Uploaded files
+MEDIA_URL = '/media/'
+MEDIA_ROOT = os.environ.get('MEDIA_ROOT') or str(BASE_DIR / 'media')
+
+# Image variants (images.processing): resizing threads, WebP quality, and how
+# long a request for a variant not rendered yet waits before a 503.
+IMAGE_WORKERS = int(os.environ.get('IMAGE_WORKERS', 4))
+IMAGE_QUALITY = int(os.environ.get('IMAGE_QUALITY', 80))
+IMAGE_RENDER_TIMEOUT = float(os.environ.get('IMAGE_RENDER_TIMEOUT', 10))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
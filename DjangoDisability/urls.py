@@ -26,4 +26,13 @@ urlpatterns = [
     path('api/vendors/',include('vendor.urls',namespace='vendors')),
     path('api/users/', include('users.urls')),
     path('api/transfers/', include('transfer.urls', namespace='transfers')),
+    path('api/dashboard/', include('dashboard.urls', namespace='dashboard')),
+    path('api/snapshots/', include('snapshots.urls', namespace='snapshots')),
+    path('api/sync/', include('sync.urls', namespace='sync')),
+    path('api/search/', include('search.urls', namespace='search')),
+    path('api/inventory/', include('inventory.urls', namespace='inventory')),
+    path('api/warranties/', include('warranties.urls', namespace='warranties')),
+    path('api/labels/', include('labels.urls', namespace='labels')),
+    path('api/system/', include('core.urls', namespace='system')),
+    path('media/variants/', include('images.urls', namespace='images')),
 ]
@@ -3,4 +3,8 @@ from django.apps import AppConfig
 
 class AssetConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'asset'
\ No newline at end of file
+    name = 'asset'
+
+    def ready(self):
+        # Invalidate cached list fragments when the names they copy change
+        from . import signals  # noqa: F401
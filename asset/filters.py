@@ -0,0 +1,15 @@
+from core.filters import FilterSet, Filter, RANGE
+from .models import Asset
+
+
+class AssetFilterSet(FilterSet):
+    model = Asset
+    filters = {
+        'category': Filter('category'),
+        'vendor': Filter('vendor'),
+        'location': Filter('location'),
+        'purchase_date': Filter('purchase_date', RANGE),
+        'warranty_date': Filter('warranty_date', RANGE),
+        'price': Filter('price', RANGE),
+    }
+    ordering_fields = ['name', 'price', 'purchase_date', 'warranty_date', 'created_at']
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.1 on 2026-10-19 19:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('asset', '0001_initial'),
+        ('category', '0001_initial'),
+        ('location', '0001_initial'),
+        ('vendor', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(fields=['name'], name='asset_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(fields=['price'], name='asset_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(fields=['purchase_date'], name='asset_purchase_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(fields=['warranty_date'], name='asset_warranty_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(fields=['created_at'], name='asset_created_at_idx'),
+        ),
+    ]
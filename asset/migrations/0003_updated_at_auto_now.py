@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-19 19:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('asset', '0002_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='asset',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-19 19:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('asset', '0003_updated_at_auto_now'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='asset',
+            name='image_digest',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64),
+        ),
+    ]
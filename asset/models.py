@@ -1,5 +1,4 @@
 from django.db import models
-from django.utils import timezone
 
 from category.models import Category
 from location.models import Location
@@ -14,11 +13,23 @@ class Asset(models.Model):
     price = models.FloatField(default=0)
     vendor = models.ForeignKey(Vendor, null=True, blank=True, on_delete=models.SET_NULL)
     image = models.ImageField(upload_to="assets/", null=True, blank=True)
+    # SHA-256 of the image, set by images.signals; names its resized variants
+    image_digest = models.CharField(max_length=64, blank=True, default='', editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
     purchase_date = models.DateField(null=True, blank=True)
     warranty_date = models.DateField(null=True, blank=True)
 
+    class Meta:
+        # Back the filters and orderings declared in asset/filters.py
+        indexes = [
+            models.Index(fields=['name'], name='asset_name_idx'),
+            models.Index(fields=['price'], name='asset_price_idx'),
+            models.Index(fields=['purchase_date'], name='asset_purchase_date_idx'),
+            models.Index(fields=['warranty_date'], name='asset_warranty_date_idx'),
+            models.Index(fields=['created_at'], name='asset_created_at_idx'),
+        ]
+
     def __str__(self):
         return f"{self.name} ({self.quantity})"
 
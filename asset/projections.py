@@ -0,0 +1,47 @@
+from core.projections import Projection, date_repr
+from images.variants import variant_urls
+
+# AssetSerializer fields, in order.
+ASSET_COLUMNS = (
+    'id', 'name', 'description', 'quantity', 'category', 'category__name',
+    'location', 'location__name', 'price', 'vendor', 'vendor__name',
+    'purchase_date', 'warranty_date', 'image_digest',
+)
+
+
+def asset_representation(row):
+    """Build AssetSerializer output from a row of ASSET_COLUMNS."""
+    (pk, name, description, quantity, category_id, category_name,
+     location_id, location_name, price, vendor_id, vendor_name,
+     purchase_date, warranty_date, image_digest) = row
+
+    data = {
+        'id': pk,
+        'name': name,
+        'description': description,
+        'quantity': quantity,
+        'category': category_id,
+        'category_name': category_name,
+        'location': location_id,
+    }
+    # AssetSerializer skips `*_name` when the relation is null.
+    if location_id is not None:
+        data['location_name'] = location_name
+    data['price'] = float(price)
+    data['vendor'] = vendor_id
+    if vendor_id is not None:
+        data['vendor_name'] = vendor_name
+    data['purchase_date'] = date_repr(purchase_date)
+    data['warranty_date'] = date_repr(warranty_date)
+    data['image_variants'] = variant_urls(image_digest)
+    return data
+
+
+class AssetProjection(Projection):
+    """values_list()-based equivalent of AssetSerializer(many=True).data."""
+    columns = ASSET_COLUMNS
+    # image_digest is written with update() by images, outside updated_at
+    version_columns = ('updated_at', 'image_digest')
+
+    def build(self, row):
+        return asset_representation(row)
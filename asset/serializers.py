@@ -3,13 +3,19 @@ from rest_framework import serializers
 from category.serializers import CategorySerializer
 from location.serializers import LocationSerializer
 from vendor.serializers import VendorSerializer
+from core.sparse import SparseFieldsetSerializerMixin
+from images.fields import ImageVariantsField
 
-class AssetSerializer(serializers.ModelSerializer):
+class AssetSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     category_name = serializers.CharField(source='category.name', read_only=True)
     location_name = serializers.CharField(source='location.name', read_only=True)
     vendor_name = serializers.CharField(source='vendor.name', read_only=True)
+    image_variants = ImageVariantsField(source='image_digest')
 
     class Meta:
         model = Asset
         fields = ('id', 'name', 'description', 'quantity', 'category', 'category_name',
-                  'location', 'location_name', 'price', 'vendor', 'vendor_name', 'purchase_date', 'warranty_date')
\ No newline at end of file
+                  'location', 'location_name', 'price', 'vendor', 'vendor_name', 'purchase_date', 'warranty_date',
+                  'image', 'image_variants')
+        # Lists show the resized variants, never the original upload
+        extra_kwargs = {'image': {'write_only': True}}
\ No newline at end of file
@@ -0,0 +1,10 @@
+"""Names the cached Asset list fragments copy from other rows (see core.fragments)."""
+from category.models import Category
+from core.fragments import depends
+from location.models import Location
+from vendor.models import Vendor
+
+from .models import Asset
+
+for related_model in (Category, Location, Vendor):
+    depends(Asset, related_model, ('name',))
@@ -1,20 +1,28 @@
-import time
-
 from django.db import transaction
 from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from assetitem.models import Status
+from assetitem.models import SerialSequence, Status
+from assetitem.serials import allocate_serials
 from assetitem.serializers import AssetItemSerializer
+from .filters import AssetFilterSet
 from .models import Asset
+from .projections import AssetProjection
 from .serializers import AssetSerializer
 from users.views import IsSuperAdmin
+from core.deletion import BulkDeleteMixin
+from core.idempotency import IdempotencyMixin
+from core.sparse import SparseFieldsetMixin
+from core.throttling import BULK
 
 
-class AssetViewSet(viewsets.ModelViewSet):
+class AssetViewSet(IdempotencyMixin, BulkDeleteMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = Asset.objects.all()
     serializer_class = AssetSerializer
     permission_classes = [permissions.IsAuthenticated]
+    filterset_class = AssetFilterSet
+    throttle_scopes = {'receive_asset': BULK, 'bulk_create': BULK, 'destroy': BULK}
 
     def get_queryset(self):
         """
@@ -31,6 +39,12 @@ class AssetViewSet(viewsets.ModelViewSet):
 
         return queryset
 
+    def list(self, request, *args, **kwargs):
+        # Read-only listing is built from values_list() rows; output is
+        # identical to AssetSerializer(many=True).data.
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.list_response(queryset, AssetProjection)
+
     def get_permissions(self):
         """
         Super admins can perform all operations
@@ -45,31 +59,48 @@ class AssetViewSet(viewsets.ModelViewSet):
         return [permission() for permission in permission_classes]
 
     @action(detail=False, methods=['post'], url_path='receive')
-    @transaction.atomic
     def receive_asset(self, request):
         """
         Receive assets: Create one Asset record and multiple AssetItem records.
         """
+        quantity = int(request.data.get('quantity', 0))
+
+        # Get serial number generation preferences. Serials are allocated
+        # before the transaction opens (see assetitem.serials).
+        generate_serials = request.data.get('generateSerialNumbers', False)
+        serial_prefix = request.data.get('serialNumberPrefix', 'ASSET')
+        supplied_serial = request.data.get('serial_number')
+        if generate_serials:
+            serial_numbers = self._allocate_serials('serialNumberPrefix', serial_prefix, quantity)
+        elif supplied_serial and quantity > 1:
+            # One serial for several items is used as their prefix
+            serial_numbers = self._allocate_serials('serial_number', supplied_serial, quantity)
+        else:
+            serial_numbers = None
+
+        return self._create_receipt(request, quantity, serial_numbers)
+
+    def _allocate_serials(self, field, prefix, quantity):
+        max_length = SerialSequence._meta.get_field('prefix').max_length
+        if len(prefix) > max_length:
+            raise ValidationError({field: [f'Ensure this field has no more than {max_length} characters.']})
+        return allocate_serials(prefix, quantity)
+
+    @transaction.atomic
+    def _create_receipt(self, request, quantity, serial_numbers):
         # Create the Asset record
         asset_serializer = self.get_serializer(data=request.data)
         asset_serializer.is_valid(raise_exception=True)
         asset = asset_serializer.save()
 
         # Create AssetItem records based on the quantity
-        quantity = int(request.data.get('quantity', 0))
         asset_items = []
-        
-        # Get serial number generation preferences
-        generate_serials = request.data.get('generateSerialNumbers', False)
-        serial_prefix = request.data.get('serialNumberPrefix', 'ASSET')
-        current_timestamp = str(int(time.time()))
 
         for i in range(quantity):
-            # Generate a serial number based on user preferences
-            if generate_serials:
-                serial_number = f"{serial_prefix}-{current_timestamp}-{i+1}"
+            if serial_numbers:
+                serial_number = serial_numbers[i]
             else:
-                serial_number = request.data.get('serial_number', f"TEMP-{asset.id}-{i+1}")
+                serial_number = request.data.get('serial_number') or f"TEMP-{asset.id}-{i+1}"
 
             asset_item_data = {
             'asset': asset.id,
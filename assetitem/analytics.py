@@ -0,0 +1,91 @@
+"""
+Time-in-status, MTBF and utilisation from the AssetItemEvent log.
+
+roll_up_events() folds events past a checkpoint into AssetStatusRollup, so
+each run only reads the events written since the last one and the live
+asset item table is never scanned. Only closed spans are counted: the status
+an item is in right now starts counting once it changes.
+"""
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.models import Checkpoint
+from .models import AssetItemEvent, AssetStatusRollup, Status
+
+ROLLUP_CHECKPOINT = 'assetitem.status_rollup'
+# Statuses that count as down time for MTBF; entering BROKEN is a failure
+DOWN_STATUSES = (Status.BROKEN, Status.MAINTENANCE)
+IN_USE_STATUSES = (Status.ASSIGNED,)
+
+
+def roll_up_events(batch_size=5000, settle_seconds=60):
+    """
+    Fold new events into the rollup; returns how many were processed.
+    Events younger than ``settle_seconds`` are left for the next run so a
+    slow transaction can't commit a lower id behind the checkpoint.
+    """
+    cutoff = timezone.now() - timedelta(seconds=settle_seconds)
+    Checkpoint.get(ROLLUP_CHECKPOINT)
+    processed = 0
+    while True:
+        with transaction.atomic():
+            checkpoint = Checkpoint.objects.select_for_update().get(name=ROLLUP_CHECKPOINT)
+            events = list(AssetItemEvent.objects.filter(id__gt=checkpoint.position).order_by('id').values_list(
+                'id', 'occurred_at', 'asset_item__asset', 'status', 'previous_status', 'previous_status_seconds',
+            )[:batch_size])
+
+            seconds, entries = defaultdict(int), defaultdict(int)
+            last_id, count = None, 0
+            for event_id, occurred_at, asset_id, status, previous_status, previous_seconds in events:
+                if occurred_at >= cutoff:
+                    break
+                last_id, count = event_id, count + 1
+                if previous_status and status != previous_status:
+                    entries[asset_id, status] += 1
+                if previous_status and previous_seconds is not None:
+                    seconds[asset_id, previous_status] += previous_seconds
+            if last_id is None:
+                return processed
+
+            for asset_id, status in seconds.keys() | entries.keys():
+                AssetStatusRollup.objects.get_or_create(asset_id=asset_id, status=status)
+                AssetStatusRollup.objects.filter(asset_id=asset_id, status=status).update(
+                    seconds=F('seconds') + seconds[asset_id, status],
+                    entries=F('entries') + entries[asset_id, status],
+                )
+            processed += count
+            checkpoint.position = last_id
+            checkpoint.save(update_fields=['position', 'updated_at'])
+
+
+def asset_status_report(asset_ids=None):
+    """Per-asset time in each status, failures, MTBF and utilisation."""
+    rollups = AssetStatusRollup.objects.values_list('asset', 'asset__name', 'status', 'seconds', 'entries')
+    if asset_ids:
+        rollups = rollups.filter(asset__in=asset_ids)
+
+    report = {}
+    for asset_id, asset_name, status, seconds, entries in rollups.order_by('asset'):
+        row = report.setdefault(asset_id, {
+            'asset': asset_id,
+            'asset_name': asset_name,
+            'seconds_by_status': {value: 0 for value in Status.values},
+            'entries_by_status': {value: 0 for value in Status.values},
+        })
+        row['seconds_by_status'][status] = seconds
+        row['entries_by_status'][status] = entries
+
+    for row in report.values():
+        by_status = row['seconds_by_status']
+        total = sum(by_status.values())
+        up = total - sum(by_status[status] for status in DOWN_STATUSES)
+        failures = row['entries_by_status'][Status.BROKEN]
+        row['observed_seconds'] = total
+        row['failures'] = failures
+        row['mtbf_seconds'] = round(up / failures) if failures else None
+        row['utilization'] = round(sum(by_status[s] for s in IN_USE_STATUSES) / total, 4) if total else None
+    return list(report.values())
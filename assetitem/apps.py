@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AssetitemConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'assetitem'
+
+    def ready(self):
+        # Invalidate cached list fragments when the names they copy change
+        from . import signals  # noqa: F401
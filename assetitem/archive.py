@@ -0,0 +1,67 @@
+"""
+Moving long-retired asset items out of the live tables.
+
+archive_batch() copies a batch of retired items, their events and their
+transfers into the Archived* tables with INSERT ... SELECT (ids preserved),
+then deletes the live rows through core.deletion, all in one transaction,
+so a row is always in exactly one of the two places.
+"""
+import datetime
+
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from core.deletion import DeletionPlan
+from transfer.models import ArchivedTransfer, Transfer
+
+from .analytics import roll_up_events
+from .models import ArchivedAssetItem, ArchivedAssetItemEvent, AssetItem, AssetItemEvent
+
+
+def _copy(connection, source, target, column, ids, extra=None):
+    """INSERT INTO target SELECT the same columns FROM source WHERE column IN ids."""
+    qn = connection.ops.quote_name
+    extra = extra or {}
+    columns = [field.column for field in target._meta.concrete_fields if field.column not in extra]
+    placeholders = ', '.join(['%s'] * len(ids))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT INTO {qn(target._meta.db_table)} ({", ".join(qn(c) for c in [*columns, *extra])}) '
+            f'SELECT {", ".join(qn(c) for c in columns)}{", %s" * len(extra)} '
+            f'FROM {qn(source._meta.db_table)} WHERE {qn(column)} IN ({placeholders})',
+            [*extra.values(), *ids],
+        )
+
+
+def retired_before(cutoff):
+    return AssetItem.all_objects.filter(retired_at__lt=cutoff)
+
+
+def archive_batch(ids):
+    """Archive the given retired items; returns how many were moved."""
+    using = router.db_for_write(AssetItem)
+    connection = connections[using]
+    with transaction.atomic(using=using):
+        # Re-check under lock: an item restored meanwhile stays live
+        ids = list(AssetItem.all_objects.using(using).select_for_update()
+                   .filter(pk__in=ids, retired_at__isnull=False).values_list('pk', flat=True))
+        if not ids:
+            return 0
+        archived_at = connection.ops.adapt_datetimefield_value(timezone.now())
+        _copy(connection, AssetItem, ArchivedAssetItem, 'id', ids, {'archived_at': archived_at})
+        _copy(connection, Transfer, ArchivedTransfer, 'asset_item_id', ids)
+        _copy(connection, AssetItemEvent, ArchivedAssetItemEvent, 'asset_item_id', ids)
+        DeletionPlan(AssetItem._base_manager.using(using).filter(pk__in=ids)).execute()
+    return len(ids)
+
+
+def archive_retired(days, batch_size=500):
+    """Archive items retired more than ``days`` ago, ``batch_size`` per transaction."""
+    # Archived events leave the log, so fold them into the rollup first
+    roll_up_events()
+    candidates = retired_before(timezone.now() - datetime.timedelta(days=days)).order_by('pk')
+    archived, last_pk = 0, 0
+    while ids := list(candidates.filter(pk__gt=last_pk).values_list('pk', flat=True)[:batch_size]):
+        archived += archive_batch(ids)
+        last_pk = ids[-1]
+    return archived
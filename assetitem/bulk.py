@@ -0,0 +1,55 @@
+"""
+Creating many asset items at once.
+
+create_items() is the batched counterpart of AssetItem.save() for new
+items: one bulk_create of the items and one of their AssetItemEvents
+(source BULK), one ledger movement per stock bucket, then
+core.bulk.post_bulk_create, so sync, search and the dashboard take the
+batch in once rather than per item. Databases that can't return primary
+keys from a bulk insert get the items saved one by one.
+"""
+from collections import Counter
+
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from core.bulk import post_bulk_create
+from inventory import ledger
+from inventory.models import MovementKind
+
+from .models import AssetItem, AssetItemEvent, EventSource
+
+ITEM_BATCH_SIZE = 1000
+
+
+def create_items(items, using=None):
+    """Insert the unsaved ``items``; returns them with their primary keys set."""
+    items = list(items)
+    using = using or router.db_for_write(AssetItem)
+    if not items:
+        return items
+    if not connections[using].features.can_return_rows_from_bulk_insert:
+        for item in items:
+            item.save(using=using)
+        return items
+
+    now = timezone.now()
+    with transaction.atomic(using=using):
+        for item in items:
+            item.status_changed_at = now
+        AssetItem.objects.using(using).bulk_create(items, batch_size=ITEM_BATCH_SIZE)
+        AssetItemEvent.objects.using(using).bulk_create((
+            AssetItemEvent(asset_item_id=item.pk, occurred_at=now, source=EventSource.BULK,
+                           status=item.status, location_id=item.location_id)
+            for item in items
+        ), batch_size=ITEM_BATCH_SIZE)
+        # One aggregated movement per bucket, not a locked posting per item
+        received = Counter(item._stock_bucket() for item in items if item.retired_at is None)
+        ledger.post(MovementKind.RECEIVE, [
+            ledger.Move(asset_id, ledger.OUTSIDE, (location_id, status), count)
+            for (asset_id, location_id, status), count in received.items()
+        ], using=using)
+        post_bulk_create.send(sender=AssetItem, instances=items, using=using)
+    for item in items:
+        item._remember_state()
+    return items
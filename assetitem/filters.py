@@ -0,0 +1,29 @@
+from core.filters import FilterSet, Filter, EXACT, RANGE, SET
+from .models import ArchivedAssetItem, AssetItem
+
+
+class AssetItemFilterSet(FilterSet):
+    model = AssetItem
+    filters = {
+        'asset': Filter('asset'),
+        'status': Filter('status', SET),
+        'location': Filter('location'),
+        'serial_number': Filter('serial_number'),
+        'vendor': Filter('vendor'),
+        'category': Filter('asset__category', EXACT),
+        'purchase_date': Filter('purchase_date', RANGE),
+        'warranty_expiry_date': Filter('warranty_expiry_date', RANGE),
+        'price': Filter('price', RANGE),
+    }
+    ordering_fields = ['serial_number', 'price', 'purchase_date', 'warranty_expiry_date', 'created_at']
+
+
+class ArchivedAssetItemFilterSet(FilterSet):
+    model = ArchivedAssetItem
+    filters = {
+        'asset': Filter('asset'),
+        'location': Filter('location'),
+        'serial_number': Filter('serial_number'),
+        'archived_at': Filter('archived_at', RANGE),
+    }
+    ordering_fields = ['archived_at']
@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from assetitem.archive import archive_retired
+
+
+class Command(BaseCommand):
+    help = (
+        'Move asset items retired more than --days ago, with their transfers and events, '
+        'to the archive tables (run periodically, e.g. from cron)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.ARCHIVE_RETIRED_AFTER_DAYS)
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        archived = archive_retired(options['days'], batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Archived {archived} retired asset items'))
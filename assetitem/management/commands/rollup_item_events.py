@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from assetitem.analytics import roll_up_events
+
+
+class Command(BaseCommand):
+    help = 'Fold new asset item events into the per-asset status rollup (run periodically, e.g. from cron)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--settle-seconds', type=int, default=60,
+                            help='Leave events younger than this for the next run')
+
+    def handle(self, *args, **options):
+        processed = roll_up_events(batch_size=options['batch_size'], settle_seconds=options['settle_seconds'])
+        self.stdout.write(self.style.SUCCESS(f'Rolled up {processed} events'))
@@ -0,0 +1,59 @@
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from assetitem.models import SerialSequence
+from assetitem.serials import _blocks, allocate_serials
+
+
+class Command(BaseCommand):
+    help = (
+        'Allocate serials from many threads at once and verify none is issued twice. '
+        'Run it from several processes against the same database to cover multiple workers.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8)
+        parser.add_argument('--receipts', type=int, default=500, help='Receipts per thread')
+        parser.add_argument('--quantity', type=int, default=20, help='Serials per receipt')
+        parser.add_argument('--prefix', default='STRESS')
+
+    def handle(self, *args, **options):
+        results, errors = [], []
+        start_barrier = threading.Barrier(options['threads'])
+
+        def worker():
+            try:
+                start_barrier.wait()
+                issued = []
+                for _ in range(options['receipts']):
+                    issued.extend(allocate_serials(options['prefix'], options['quantity']))
+                results.append(issued)
+            except Exception as exc:  # reported below
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(options['threads'])]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        _blocks.pop(options['prefix'], None)
+
+        if errors:
+            raise CommandError(f'{len(errors)} threads failed, first error: {errors[0]!r}')
+        serials = [serial for issued in results for serial in issued]
+        duplicates = len(serials) - len(set(serials))
+        sequence = SerialSequence.objects.get(prefix=options['prefix'])
+        self.stdout.write(
+            f'{len(serials)} serials in {elapsed:.2f}s ({len(serials) / elapsed:,.0f}/s) '
+            f'from {options["threads"]} threads; sequence now at {sequence.next_value}'
+        )
+        if duplicates:
+            raise CommandError(f'{duplicates} duplicate serials issued')
+        self.stdout.write(self.style.SUCCESS('All serials unique'))
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.1 on 2026-10-19 19:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('asset', '0002_filter_indexes'),
+        ('assetitem', '0001_initial'),
+        ('location', '0001_initial'),
+        ('vendor', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assetitem',
+            index=models.Index(fields=['status'], name='assetitem_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetitem',
+            index=models.Index(fields=['location', 'status'], name='assetitem_location_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetitem',
+            index=models.Index(fields=['serial_number'], name='assetitem_serial_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetitem',
+            index=models.Index(fields=['price'], name='assetitem_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetitem',
+            index=models.Index(fields=['purchase_date'], name='assetitem_purchase_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetitem',
+            index=models.Index(fields=['warranty_expiry_date'], name='assetitem_warranty_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetitem',
+            index=models.Index(fields=['created_at'], name='assetitem_created_at_idx'),
+        ),
+    ]
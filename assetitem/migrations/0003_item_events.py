@@ -0,0 +1,62 @@
+# Generated by Django 5.2.1 on 2026-10-19 19:12
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def start_status_spans(apps, schema_editor):
+    # Best available guess for when existing items entered their status
+    AssetItem = apps.get_model('assetitem', 'AssetItem')
+    AssetItem.objects.update(status_changed_at=models.F('updated_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('asset', '0002_filter_indexes'),
+        ('assetitem', '0002_filter_indexes'),
+        ('location', '0001_initial'),
+        ('transfer', '0002_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assetitem',
+            name='status_changed_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunPython(start_status_spans, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='AssetItemEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('occurred_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('source', models.CharField(choices=[('CREATE', 'Created'), ('UPDATE', 'Updated'), ('TRANSFER', 'Transfer'), ('BULK', 'Bulk update')], max_length=10)),
+                ('status', models.CharField(choices=[('AVAILABLE', 'Available'), ('MAINTENANCE', 'Maintenance'), ('BROKEN', 'Broken'), ('NOT AVAILABLE', 'Not Available'), ('ASSIGNED', 'Assigned')], max_length=50)),
+                ('previous_status', models.CharField(blank=True, choices=[('AVAILABLE', 'Available'), ('MAINTENANCE', 'Maintenance'), ('BROKEN', 'Broken'), ('NOT AVAILABLE', 'Not Available'), ('ASSIGNED', 'Assigned')], max_length=50, null=True)),
+                ('previous_status_seconds', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('asset_item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='events', to='assetitem.assetitem')),
+                ('location', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='location.location')),
+                ('previous_location', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='location.location')),
+                ('transfer', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='transfer.transfer')),
+            ],
+            options={
+                'ordering': ['occurred_at', 'id'],
+                'indexes': [models.Index(fields=['asset_item', 'occurred_at'], name='assetitem_event_item_idx'), models.Index(fields=['occurred_at'], name='assetitem_event_time_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='AssetStatusRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('AVAILABLE', 'Available'), ('MAINTENANCE', 'Maintenance'), ('BROKEN', 'Broken'), ('NOT AVAILABLE', 'Not Available'), ('ASSIGNED', 'Assigned')], max_length=50)),
+                ('seconds', models.PositiveBigIntegerField(default=0)),
+                ('entries', models.PositiveIntegerField(default=0)),
+                ('asset', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_rollups', to='asset.asset')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('asset', 'status'), name='asset_status_rollup_uniq')],
+            },
+        ),
+    ]
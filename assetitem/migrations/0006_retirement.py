@@ -0,0 +1,71 @@
+# Generated by Django 5.2.1 on 2026-10-19 19:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('asset', '0003_updated_at_auto_now'),
+        ('assetitem', '0005_serial_sequence'),
+        ('location', '0001_initial'),
+        ('vendor', '0002_updated_at_auto_now'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assetitem',
+            name='retired_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='ArchivedAssetItem',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('serial_number', models.CharField(blank=True, db_index=True, max_length=50, null=True)),
+                ('purchase_date', models.DateField(blank=True, null=True)),
+                ('warranty_expiry_date', models.DateField(blank=True, null=True)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('price', models.FloatField(default=0)),
+                ('status', models.CharField(choices=[('AVAILABLE', 'Available'), ('MAINTENANCE', 'Maintenance'), ('BROKEN', 'Broken'), ('NOT AVAILABLE', 'Not Available'), ('ASSIGNED', 'Assigned')], max_length=50)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('status_changed_at', models.DateTimeField()),
+                ('retired_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField()),
+                ('asset', models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='asset.asset')),
+                ('location', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='location.location')),
+                ('vendor', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='vendor.vendor')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedAssetItemEvent',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('occurred_at', models.DateTimeField()),
+                ('source', models.CharField(choices=[('CREATE', 'Created'), ('UPDATE', 'Updated'), ('TRANSFER', 'Transfer'), ('BULK', 'Bulk update')], max_length=10)),
+                ('status', models.CharField(choices=[('AVAILABLE', 'Available'), ('MAINTENANCE', 'Maintenance'), ('BROKEN', 'Broken'), ('NOT AVAILABLE', 'Not Available'), ('ASSIGNED', 'Assigned')], max_length=50)),
+                ('previous_status', models.CharField(blank=True, choices=[('AVAILABLE', 'Available'), ('MAINTENANCE', 'Maintenance'), ('BROKEN', 'Broken'), ('NOT AVAILABLE', 'Not Available'), ('ASSIGNED', 'Assigned')], max_length=50, null=True)),
+                ('previous_status_seconds', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('asset_item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='events', to='assetitem.archivedassetitem')),
+                ('location', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='location.location')),
+                ('previous_location', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='location.location')),
+            ],
+            options={
+                'ordering': ['occurred_at', 'id'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='assetitem',
+            index=models.Index(condition=models.Q(('retired_at__isnull', True)), fields=['location', 'status'], name='assetitem_active_loc_st_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetitem',
+            index=models.Index(condition=models.Q(('retired_at__isnull', False)), fields=['retired_at'], name='assetitem_retired_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetitem',
+            index=models.Index(fields=['retired_at', 'location', 'status'], name='assetitem_ret_loc_status_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.1 on 2026-10-19 19:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assetitem', '0006_retirement'),
+        ('transfer', '0003_archived_transfers'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedassetitemevent',
+            name='transfer',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='transfer.archivedtransfer'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedassetitem',
+            index=models.Index(fields=['archived_at'], name='archived_item_archived_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.1 on 2026-10-19 19:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('asset', '0003_updated_at_auto_now'),
+        ('assetitem', '0007_archived_event_transfer'),
+        ('location', '0001_initial'),
+        ('vendor', '0002_updated_at_auto_now'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assetitem',
+            index=models.Index(fields=['location', 'warranty_expiry_date'], name='assetitem_loc_warranty_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.1 on 2026-10-19 20:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('asset', '0004_image_digest'),
+        ('assetitem', '0008_location_warranty_index'),
+        ('location', '0001_initial'),
+        ('vendor', '0002_updated_at_auto_now'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assetitem',
+            index=models.Index(fields=['location', 'created_at'], name='assetitem_loc_created_idx'),
+        ),
+    ]
@@ -1,7 +1,9 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 from asset.models import Asset
+from inventory import ledger
+from inventory.models import MovementKind
 from location.models import Location
 from vendor.models import Vendor
 
@@ -13,6 +15,25 @@ class Status(models.TextChoices):
     NOT_AVAILABLE = 'NOT AVAILABLE', 'Not Available'
     ASSIGNED = 'ASSIGNED', 'Assigned'
 
+
+class EventSource(models.TextChoices):
+    CREATE = 'CREATE', 'Created'
+    UPDATE = 'UPDATE', 'Updated'
+    TRANSFER = 'TRANSFER', 'Transfer'
+    BULK = 'BULK', 'Bulk update'
+
+
+def _seconds_since(started, now):
+    return max(int((now - started).total_seconds()), 0) if started else None
+
+
+class ActiveAssetItemManager(models.Manager):
+    """Items in service. Retired ones stay reachable through AssetItem.all_objects."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(retired_at__isnull=True)
+
+
 class AssetItem(models.Model):
     asset = models.ForeignKey(Asset, on_delete=models.CASCADE, related_name="items")
     serial_number = models.CharField(max_length=50, unique=False, blank=True, null=True)
@@ -28,7 +49,237 @@ class AssetItem(models.Model):
     )
     location = models.ForeignKey(Location, on_delete=models.CASCADE,null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
+    # When the current status began; closes the span recorded in AssetItemEvent
+    status_changed_at = models.DateTimeField(default=timezone.now)
+    # Set when the item is taken out of service; archive_retired_items later
+    # moves it to ArchivedAssetItem.
+    retired_at = models.DateTimeField(null=True, blank=True)
+
+    objects = ActiveAssetItemManager()
+    all_objects = models.Manager()
+
+    class Meta:
+        # Back the filters and orderings declared in assetitem/filters.py
+        indexes = [
+            models.Index(fields=['status'], name='assetitem_status_idx'),
+            models.Index(fields=['location', 'status'], name='assetitem_location_status_idx'),
+            models.Index(fields=['serial_number'], name='assetitem_serial_idx'),
+            models.Index(fields=['price'], name='assetitem_price_idx'),
+            models.Index(fields=['purchase_date'], name='assetitem_purchase_date_idx'),
+            models.Index(fields=['warranty_expiry_date'], name='assetitem_warranty_idx'),
+            # A branch's expiring warranties (warranties/expiry.py) as one range scan
+            models.Index(fields=['location', 'warranty_expiry_date'], name='assetitem_loc_warranty_idx'),
+            models.Index(fields=['created_at'], name='assetitem_created_at_idx'),
+            # A branch's items newest first (?location=&ordering=created_at)
+            models.Index(fields=['location', 'created_at'], name='assetitem_loc_created_idx'),
+            # The active set by location and status (what the default manager
+            # and every listing reads), and the retired rows the archive job scans
+            models.Index(fields=['location', 'status'], condition=models.Q(retired_at__isnull=True),
+                         name='assetitem_active_loc_st_idx'),
+            models.Index(fields=['retired_at'], condition=models.Q(retired_at__isnull=False),
+                         name='assetitem_retired_at_idx'),
+            # MySQL skips the two above (no partial indexes); leading with
+            # retired_at serves both the active set and the archive scan there
+            models.Index(fields=['retired_at', 'location', 'status'], name='assetitem_ret_loc_status_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.asset.name} - {self.serial_number} ({self.status})"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_state()
+        return instance
+
+    def _remember_state(self):
+        # Deferred fields are missing from __dict__; save() looks them up
+        self._saved_state = (self.__dict__.get('status'), self.__dict__.get('location_id'))
+        self._saved_asset_id = self.__dict__.get('asset_id')
+        self._saved_serial_number = self.__dict__.get('serial_number', models.DEFERRED)
+
+    def _stock_bucket(self):
+        """Where the inventory ledger counts this item, or None when retired."""
+        return None if self.retired_at else (self.asset_id, self.location_id, self.status)
+
+    def save(self, *args, event_source=None, transfer=None, **kwargs):
+        """
+        Saves and, when status or location changed (or the item is new),
+        appends an AssetItemEvent and posts the move to the inventory ledger,
+        all in the same transaction.
+        """
+        now = timezone.now()
+        with transaction.atomic(using=kwargs.get('using')):
+            previous_asset_id = getattr(self, '_saved_asset_id', None)
+            if self._state.adding:
+                previous = None
+            else:
+                previous = getattr(self, '_saved_state', (None, None))
+                if None in previous or previous_asset_id is None:
+                    previous = AssetItem.all_objects.filter(pk=self.pk).values_list(
+                        'status', 'location_id', 'status_changed_at', 'asset_id').first()
+                    if previous is not None:
+                        self.__dict__.setdefault('status_changed_at', previous[2])
+                        previous_asset_id = previous[3]
+                        previous = previous[:2]
+
+            status_changed = previous is not None and previous[0] != self.status
+            if previous is None or status_changed or previous[1] != self.location_id:
+                event = AssetItemEvent(
+                    occurred_at=now,
+                    source=event_source or (EventSource.CREATE if previous is None else EventSource.UPDATE),
+                    transfer=transfer,
+                    status=self.status,
+                    location_id=self.location_id,
+                )
+                if previous is not None:
+                    event.previous_status, event.previous_location_id = previous
+                if status_changed:
+                    event.previous_status_seconds = _seconds_since(self.status_changed_at, now)
+                if previous is None or status_changed:
+                    self.status_changed_at = now
+                    if kwargs.get('update_fields') is not None:
+                        kwargs['update_fields'] = {*kwargs['update_fields'], 'status_changed_at'}
+            else:
+                event = None
+
+            super().save(*args, **kwargs)
+            if event is not None:
+                event.asset_item = self
+                event.save(using=kwargs.get('using'))
+            if self.retired_at is None:  # retire() and restore() post their own moves
+                ledger.post_item_change(
+                    None if previous is None else (previous_asset_id, previous[1], previous[0]), self._stock_bucket(),
+                    asset_item_id=self.pk, using=kwargs.get('using'),
+                )
+        self._remember_state()
+
+    @transaction.atomic
+    def retire(self):
+        bucket = self._stock_bucket()
+        self.retired_at = timezone.now()
+        self.save(update_fields=['retired_at', 'updated_at'])
+        ledger.post_item_change(bucket, None, asset_item_id=self.pk, kind=MovementKind.RETIRE)
+
+    @transaction.atomic
+    def restore(self):
+        self.retired_at = None
+        self.save(update_fields=['retired_at', 'updated_at'])
+        ledger.post_item_change(None, self._stock_bucket(), asset_item_id=self.pk, kind=MovementKind.RESTORE)
+
+
+class AssetItemEvent(models.Model):
+    """
+    Append-only log of asset item status and location transitions. Rows are
+    never updated; ``previous_status_seconds`` is how long the item spent in
+    ``previous_status``, so each status-changing row is one closed span and
+    analytics can be rolled up incrementally (see assetitem.analytics).
+    """
+    asset_item = models.ForeignKey(AssetItem, on_delete=models.CASCADE, related_name='events')
+    occurred_at = models.DateTimeField(default=timezone.now)
+    source = models.CharField(max_length=10, choices=EventSource.choices)
+    transfer = models.ForeignKey('transfer.Transfer', null=True, blank=True, on_delete=models.SET_NULL,
+                                 related_name='+')
+    status = models.CharField(max_length=50, choices=Status.choices)
+    previous_status = models.CharField(max_length=50, choices=Status.choices, null=True, blank=True)
+    location = models.ForeignKey(Location, null=True, blank=True, on_delete=models.SET_NULL, related_name='+')
+    previous_location = models.ForeignKey(Location, null=True, blank=True, on_delete=models.SET_NULL,
+                                          related_name='+')
+    previous_status_seconds = models.PositiveBigIntegerField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['occurred_at', 'id']
+        indexes = [
+            models.Index(fields=['asset_item', 'occurred_at'], name='assetitem_event_item_idx'),
+            models.Index(fields=['occurred_at'], name='assetitem_event_time_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.asset_item_id}: {self.previous_status} -> {self.status} at {self.occurred_at}"
+
+
+class AssetStatusRollup(models.Model):
+    """
+    Per-asset totals folded in from AssetItemEvent by the rollup_item_events
+    command: closed seconds spent in each status and the number of times
+    items entered it.
+    """
+    asset = models.ForeignKey(Asset, on_delete=models.CASCADE, related_name='status_rollups')
+    status = models.CharField(max_length=50, choices=Status.choices)
+    seconds = models.PositiveBigIntegerField(default=0)
+    entries = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['asset', 'status'], name='asset_status_rollup_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.asset_id} {self.status}: {self.seconds}s / {self.entries}"
+
+
+class SerialSequence(models.Model):
+    """Next unreserved number per serial prefix (see assetitem.serials)."""
+    prefix = models.CharField(max_length=40, unique=True)
+    next_value = models.PositiveBigIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.prefix}: {self.next_value}"
+
+
+class ArchivedAssetItem(models.Model):
+    """
+    A retired AssetItem moved out of the live table by archive_retired_items,
+    under its original id. Relations don't constrain the live tables: the
+    asset, location or vendor may be deleted later.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    asset = models.ForeignKey(Asset, null=True, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    serial_number = models.CharField(max_length=50, blank=True, null=True, db_index=True)
+    purchase_date = models.DateField(null=True, blank=True)
+    warranty_expiry_date = models.DateField(null=True, blank=True)
+    description = models.TextField(null=True, blank=True)
+    price = models.FloatField(default=0)
+    vendor = models.ForeignKey(Vendor, null=True, blank=True, on_delete=models.DO_NOTHING, db_constraint=False,
+                               related_name='+')
+    status = models.CharField(max_length=50, choices=Status.choices)
+    location = models.ForeignKey(Location, null=True, blank=True, on_delete=models.DO_NOTHING, db_constraint=False,
+                                 related_name='+')
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    status_changed_at = models.DateTimeField()
+    retired_at = models.DateTimeField()
+    archived_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['archived_at'], name='archived_item_archived_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.serial_number} (archived {self.archived_at:%Y-%m-%d})"
+
+
+class ArchivedAssetItemEvent(models.Model):
+    """AssetItemEvent rows of archived items, kept for their history."""
+    id = models.BigIntegerField(primary_key=True)
+    asset_item = models.ForeignKey(ArchivedAssetItem, on_delete=models.CASCADE, related_name='events')
+    occurred_at = models.DateTimeField()
+    source = models.CharField(max_length=10, choices=EventSource.choices)
+    transfer = models.ForeignKey('transfer.ArchivedTransfer', null=True, blank=True, on_delete=models.DO_NOTHING,
+                                 db_constraint=False, related_name='+')
+    status = models.CharField(max_length=50, choices=Status.choices)
+    previous_status = models.CharField(max_length=50, choices=Status.choices, null=True, blank=True)
+    location = models.ForeignKey(Location, null=True, blank=True, on_delete=models.DO_NOTHING, db_constraint=False,
+                                 related_name='+')
+    previous_location = models.ForeignKey(Location, null=True, blank=True, on_delete=models.DO_NOTHING,
+                                          db_constraint=False, related_name='+')
+    previous_status_seconds = models.PositiveBigIntegerField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['occurred_at', 'id']
 
     def __str__(self):
-        return f"{self.asset.name} - {self.serial_number} ({self.status})"
\ No newline at end of file
+        return f"{self.asset_item_id}: {self.previous_status} -> {self.status} at {self.occurred_at}"
@@ -0,0 +1,45 @@
+from asset.projections import ASSET_COLUMNS, asset_representation
+from core.projections import Projection, date_repr
+
+ASSET_ITEM_COLUMNS = (
+    'serial_number', 'purchase_date', 'warranty_expiry_date', 'description',
+    'price', 'status', 'location', 'location__name', 'vendor', 'vendor__name',
+    'created_at', 'updated_at',
+)
+
+# The nested asset_details columns follow the item's own columns.
+_ASSET_OFFSET = len(ASSET_ITEM_COLUMNS)
+
+
+class AssetItemProjection(Projection):
+    """values_list()-based equivalent of AssetItemSerializer(many=True).data."""
+    columns = ASSET_ITEM_COLUMNS + tuple(f'asset__{column}' for column in ASSET_COLUMNS)
+    # asset_details nests the asset, so its edits count as the item's
+    version_columns = ('updated_at', 'asset__updated_at', 'asset__image_digest')
+
+    def build(self, row):
+        (serial_number, purchase_date, warranty_expiry_date, description, price,
+         status, location_id, location_name, vendor_id, vendor_name,
+         created_at, updated_at) = row[:_ASSET_OFFSET]
+        asset_details = asset_representation(row[_ASSET_OFFSET:])
+
+        data = {
+            'asset': asset_details['id'],
+            'serial_number': serial_number,
+            'purchase_date': date_repr(purchase_date),
+            'warranty_expiry_date': date_repr(warranty_expiry_date),
+            'description': description,
+            'price': float(price),
+            'status': status,
+            'asset_details': asset_details,
+            'location': location_id,
+            'asset_name': asset_details['name'],
+        }
+        if location_id is not None:
+            data['location_name'] = location_name
+        data['vendor'] = vendor_id
+        if vendor_id is not None:
+            data['vendor_name'] = vendor_name
+        data['created_at'] = self.datetime_repr(created_at)
+        data['updated_at'] = self.datetime_repr(updated_at)
+        return data
@@ -1,9 +1,26 @@
 from rest_framework import serializers
-from .models import AssetItem
+from .bulk import create_items
+from .models import ArchivedAssetItem, ArchivedAssetItemEvent, AssetItem, AssetItemEvent
 from asset.serializers import AssetSerializer
 from location.serializers import LocationSerializer
+from core.sparse import SparseFieldsetSerializerMixin
+from transfer.serializers import ArchivedTransferSerializer
 
-class AssetItemSerializer(serializers.ModelSerializer):
+# Everything AssetItemSerializer reads, including the nested asset_details.
+ASSET_ITEM_RELATED = ('asset__category', 'asset__location', 'asset__vendor', 'location', 'vendor')
+
+
+class AssetItemListSerializer(serializers.ListSerializer):
+    """Saves a list of new items as one batch (see assetitem.bulk)."""
+
+    def create(self, validated_data):
+        items = create_items(AssetItem(**attrs) for attrs in validated_data)
+        # Reloaded with what the representation reads, in one query
+        loaded = AssetItem.all_objects.select_related(*ASSET_ITEM_RELATED).in_bulk([item.pk for item in items])
+        return [loaded[item.pk] for item in items]
+
+
+class AssetItemSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     asset_details = AssetSerializer(source='asset', read_only=True)
     asset_name = serializers.CharField(source='asset.name', read_only=True)
     location_name = serializers.CharField(source='location.name', read_only=True)
@@ -16,6 +33,49 @@ class AssetItemSerializer(serializers.ModelSerializer):
             'description', 'price', 'status', 'asset_details', 'location', 'asset_name', 
             'location_name', 'vendor', 'vendor_name', 'created_at', 'updated_at'
         ]
+        # Left out by ?fields= unless also named in ?expand=
+        expandable_fields = ['asset_details']
+        list_serializer_class = AssetItemListSerializer
 
     def get_location_name(self, obj):
-        return obj.location.name if obj.location else None
\ No newline at end of file
+        return obj.location.name if obj.location else None
+
+
+class AssetItemEventSerializer(serializers.ModelSerializer):
+    location_name = serializers.CharField(source='location.name', read_only=True)
+    previous_location_name = serializers.CharField(source='previous_location.name', read_only=True)
+
+    class Meta:
+        model = AssetItemEvent
+        fields = [
+            'id', 'occurred_at', 'source', 'transfer', 'status', 'previous_status',
+            'previous_status_seconds', 'location', 'location_name',
+            'previous_location', 'previous_location_name',
+        ]
+
+
+class ArchivedAssetItemEventSerializer(AssetItemEventSerializer):
+    class Meta(AssetItemEventSerializer.Meta):
+        model = ArchivedAssetItemEvent
+
+
+class ArchivedAssetItemSerializer(serializers.ModelSerializer):
+    asset_name = serializers.CharField(source='asset.name', read_only=True)
+    location_name = serializers.CharField(source='location.name', read_only=True)
+    vendor_name = serializers.CharField(source='vendor.name', read_only=True)
+
+    class Meta:
+        model = ArchivedAssetItem
+        fields = [
+            'id', 'asset', 'asset_name', 'serial_number', 'purchase_date', 'warranty_expiry_date',
+            'description', 'price', 'status', 'location', 'location_name', 'vendor', 'vendor_name',
+            'created_at', 'updated_at', 'retired_at', 'archived_at',
+        ]
+
+
+class ArchivedAssetItemDetailSerializer(ArchivedAssetItemSerializer):
+    transfers = ArchivedTransferSerializer(many=True, read_only=True)
+    events = ArchivedAssetItemEventSerializer(many=True, read_only=True)
+
+    class Meta(ArchivedAssetItemSerializer.Meta):
+        fields = ArchivedAssetItemSerializer.Meta.fields + ['transfers', 'events']
@@ -0,0 +1,64 @@
+"""
+Serial number allocation.
+
+Numbers come from one SerialSequence row per prefix. Each worker process
+reserves blocks of SERIAL_BLOCK_SIZE numbers (hi-lo) with a single atomic
+``UPDATE ... SET next_value = next_value + n`` and hands out ranges from its
+block without touching the database. A request for ``count`` serials is
+always one contiguous range; if the current block can't fit it, the rest of
+the block is abandoned and a new one reserved. Numbers skipped that way, or
+lost when a process exits, leave gaps but are never reused.
+
+Allocate before opening the transaction that uses the serials: a block
+reserved inside it would be given back by a rollback while this process
+keeps handing it out.
+"""
+import threading
+
+from django.conf import settings
+from django.db import IntegrityError, router, transaction
+from django.db.models import F
+from django.db.transaction import TransactionManagementError
+
+from .models import SerialSequence
+
+SERIAL_DIGITS = 8
+
+_blocks = {}  # prefix -> [next number, end (exclusive)]
+_lock = threading.Lock()
+
+
+def reserve_block(prefix, size):
+    """Atomically reserve ``size`` numbers for ``prefix``; returns (start, end)."""
+    with transaction.atomic():
+        updated = SerialSequence.objects.filter(prefix=prefix).update(next_value=F('next_value') + size)
+        if not updated:
+            try:
+                with transaction.atomic():
+                    SerialSequence.objects.create(prefix=prefix, next_value=1 + size)
+                return 1, 1 + size
+            except IntegrityError:  # another worker created it first
+                SerialSequence.objects.filter(prefix=prefix).update(next_value=F('next_value') + size)
+        end = SerialSequence.objects.filter(prefix=prefix).values_list('next_value', flat=True).get()
+    return end - size, end
+
+
+def allocate(prefix, count):
+    """Return ``count`` consecutive, never-before-issued numbers for ``prefix``."""
+    if transaction.get_connection(router.db_for_write(SerialSequence)).in_atomic_block:
+        raise TransactionManagementError('Allocate serial numbers before entering a transaction.')
+    with _lock:
+        block = _blocks.get(prefix)
+        if block is None or block[1] - block[0] < count:
+            block = _blocks[prefix] = list(reserve_block(prefix, max(count, settings.SERIAL_BLOCK_SIZE)))
+        start = block[0]
+        block[0] += count
+    return range(start, start + count)
+
+
+def format_serial(prefix, number):
+    return f'{prefix}-{number:0{SERIAL_DIGITS}d}'
+
+
+def allocate_serials(prefix, count):
+    return [format_serial(prefix, number) for number in allocate(prefix, count)]
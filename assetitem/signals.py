@@ -0,0 +1,14 @@
+"""
+Names the cached AssetItem list fragments copy from other rows (see
+core.fragments). The nested asset's own fields are covered by its
+updated_at, which is one of the fragment's versions.
+"""
+from category.models import Category
+from core.fragments import depends
+from location.models import Location
+from vendor.models import Vendor
+
+from .models import AssetItem
+
+for related_model in (Category, Location, Vendor):
+    depends(AssetItem, related_model, ('name',))
@@ -1,3 +1,68 @@
-from django.test import TestCase
+import threading
 
-# Create your tests here.
+from django.db import connection, transaction
+from django.db.transaction import TransactionManagementError
+from django.test import TransactionTestCase, override_settings
+
+from . import serials
+from .models import SerialSequence
+
+
+@override_settings(SERIAL_BLOCK_SIZE=7)
+class SerialAllocationTests(TransactionTestCase):
+    prefix = 'TEST'
+    threads = 8
+    rounds = 25
+
+    def setUp(self):
+        serials._blocks.pop(self.prefix, None)
+        self.addCleanup(serials._blocks.pop, self.prefix, None)
+
+    def run_threads(self, work):
+        """Run ``work()`` from every thread at once; returns what each returned."""
+        if connection.vendor == 'sqlite' and connection.is_in_memory_db():
+            self.skipTest('threads need a file database (set DB_TEST_NAME)')
+        results, errors = [], []
+        barrier = threading.Barrier(self.threads)
+
+        def worker():
+            try:
+                barrier.wait()
+                results.append(work())
+            except Exception as exc:  # reported below
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(self.threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        return results
+
+    def test_concurrent_allocations_are_unique(self):
+        results = self.run_threads(lambda: [
+            number for count in range(1, self.rounds + 1) for number in serials.allocate(self.prefix, count % 10 + 1)
+        ])
+        numbers = [number for issued in results for number in issued]
+        self.assertEqual(len(numbers), len(set(numbers)))
+        self.assertLess(max(numbers), SerialSequence.objects.get(prefix=self.prefix).next_value)
+
+    def test_concurrent_block_reservations_do_not_overlap(self):
+        # What separate worker processes do, without the in-process lock
+        results = self.run_threads(lambda: [serials.reserve_block(self.prefix, 5) for _ in range(self.rounds)])
+        numbers = [number for blocks in results for start, end in blocks for number in range(start, end)]
+        self.assertEqual(len(numbers), len(set(numbers)))
+        self.assertEqual(len(numbers), self.threads * self.rounds * 5)
+
+    def test_allocate_inside_transaction_is_refused(self):
+        with transaction.atomic():
+            with self.assertRaises(TransactionManagementError):
+                serials.allocate(self.prefix, 1)
+        self.assertFalse(SerialSequence.objects.filter(prefix=self.prefix).exists())
+
+    def test_serials_are_formatted_and_consecutive(self):
+        self.assertEqual(serials.allocate_serials(self.prefix, 3), ['TEST-00000001', 'TEST-00000002', 'TEST-00000003'])
+        self.assertEqual(serials.allocate_serials(self.prefix, 2), ['TEST-00000004', 'TEST-00000005'])
@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import AssetItemViewSet
+from .views import AssetItemViewSet, AssetItemAsyncListView, AssetItemAsyncBySerialView
 
 app_name = 'assetitems'
 
@@ -8,5 +8,7 @@ router = DefaultRouter()
 router.register(r'', AssetItemViewSet)
 
 urlpatterns = [
+    path('async/', AssetItemAsyncListView.as_view(), name='assetitem-list-async'),
+    path('async/by-serial/<path:serial_number>/', AssetItemAsyncBySerialView.as_view(), name='assetitem-by-serial-async'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
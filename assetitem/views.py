@@ -1,25 +1,55 @@
 from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 
-from .models import AssetItem, Status
-from .serializers import AssetItemSerializer
+from core.async_views import AsyncAPIView
+from .analytics import asset_status_report
+from .filters import ArchivedAssetItemFilterSet, AssetItemFilterSet
+from .models import ArchivedAssetItem, AssetItem, Status
+from .projections import AssetItemProjection
+from .serializers import (
+    ASSET_ITEM_RELATED, ArchivedAssetItemDetailSerializer, ArchivedAssetItemSerializer, AssetItemEventSerializer,
+    AssetItemSerializer,
+)
 from users.views import IsSuperAdmin
+from core.idempotency import IdempotencyMixin
+from core.sparse import SparseFieldsetMixin
+from core.throttling import ANALYTICS, BULK
 
-class AssetItemViewSet(viewsets.ModelViewSet):
+ARCHIVE_PAGE_SIZE = 100
+MAX_ARCHIVE_PAGE_SIZE = 1000
+
+
+def scope_asset_items(queryset, user):
+    """Branch admins only see asset items at their branch."""
+    if user.is_branch_admin and user.branch:
+        queryset = queryset.filter(location=user.branch)
+    return queryset
+
+
+def include_retired(request):
+    """?retired=1 widens item lookups to retired items still in the live table."""
+    return request.query_params.get('retired', '').lower() in ('1', 'true', 'yes')
+
+
+class AssetItemViewSet(IdempotencyMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = AssetItem.objects.all()
     serializer_class = AssetItemSerializer
     permission_classes = [permissions.IsAuthenticated]
+    # asset, status, location and serial_number filters, plus ranges and ordering
+    filterset_class = AssetItemFilterSet
+    throttle_scopes = {'analytics': ANALYTICS, 'bulk_create': BULK}
 
     def get_permissions(self):
         """
         Super admins can perform all operations
         Branch admins can create, read, and update asset items in their branch
         """
-        if self.action in ['list', 'retrieve', 'create', 'update', 'partial_update', 'by_asset_id', 'by_category_id', 'update_status', 'by_serial_number']:
+        if self.action in ['list', 'retrieve', 'create', 'update', 'partial_update', 'by_asset_id', 'by_category_id', 'update_status', 'by_serial_number', 'history', 'archived', 'archived_detail']:
             permission_classes = [permissions.IsAuthenticated]
-        else:  # destroy and other admin actions
+        else:  # destroy, analytics, retire, restore and other admin actions
             permission_classes = [IsSuperAdmin]
         return [permission() for permission in permission_classes]
 
@@ -36,62 +66,44 @@ class AssetItemViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save()
 
+    def list(self, request, *args, **kwargs):
+        # Read-only listing is built from values_list() rows; output is
+        # identical to AssetItemSerializer(many=True).data.
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.list_response(queryset, AssetItemProjection)
+
     # Optional: Add additional filtering methods
     def get_queryset(self):
-        user = self.request.user
-        queryset = AssetItem.objects.all()
-
-        # If user is branch admin, filter by their branch location
-        if user.is_branch_admin and user.branch:
-            queryset = queryset.filter(location=user.branch)
-
-        # Filter by asset ID
-        asset_id = self.request.query_params.get('asset', None)
-        if asset_id:
-            queryset = queryset.filter(asset_id=asset_id)
-
-        # Filter by status
-        status_param = self.request.query_params.get('status', None)
-        if status_param:
-            queryset = queryset.filter(status=status_param)
-
-        # Filter by location
-        location_id = self.request.query_params.get('location', None)
-        if location_id:
-            queryset = queryset.filter(location_id=location_id)
-
-        # Filter by serial number
-        serial_number = self.request.query_params.get('serial_number', None)
-        if serial_number:
-            queryset = queryset.filter(serial_number=serial_number)
-
-        return queryset
+        # Retired items are left out unless asked for (or being restored)
+        if self.action == 'restore' or include_retired(self.request):
+            queryset = AssetItem.all_objects.all()
+        else:
+            queryset = AssetItem.objects.all()
+        return scope_asset_items(queryset.select_related(*ASSET_ITEM_RELATED), self.request.user)
 
     @action(detail=False, methods=['get'], url_path=r'asset/(?P<asset_id>\d+)')
     def by_asset_id(self, request, asset_id=None):
         """Get all asset items for a specific asset."""
-        queryset = AssetItem.objects.filter(asset_id=asset_id)
+        queryset = AssetItem.objects.select_related(*ASSET_ITEM_RELATED).filter(asset_id=asset_id)
         
         # Apply branch filtering for branch admins
         user = request.user
         if user.is_branch_admin and user.branch:
             queryset = queryset.filter(location=user.branch)
             
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return self.list_response(self.filter_queryset(queryset), AssetItemProjection)
 
     @action(detail=False, methods=['get'], url_path=r'category/(?P<category_id>\d+)')
     def by_category_id(self, request, category_id=None):
         """Get all asset items belonging to assets in a specific category."""
-        queryset = AssetItem.objects.filter(asset__category_id=category_id)
+        queryset = AssetItem.objects.select_related(*ASSET_ITEM_RELATED).filter(asset__category_id=category_id)
         
         # Apply branch filtering for branch admins
         user = request.user
         if user.is_branch_admin and user.branch:
             queryset = queryset.filter(location=user.branch)
             
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return self.list_response(self.filter_queryset(queryset), AssetItemProjection)
 
     @action(detail=True, methods=['patch'], url_path='update-status')
     def update_status(self, request, pk=None):
@@ -121,6 +133,73 @@ class AssetItemViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(asset_item)
         return Response(serializer.data)
 
+    @action(detail=True, methods=['get'])
+    def history(self, request, pk=None):
+        """Status and location transitions of one asset item, oldest first."""
+        asset_item = self.get_object()
+        events = asset_item.events.select_related('location', 'previous_location')
+        return Response(AssetItemEventSerializer(events, many=True).data)
+
+    @action(detail=True, methods=['post'])
+    def retire(self, request, pk=None):
+        """Take an item out of service; it drops out of listings, stats and exports."""
+        asset_item = self.get_object()
+        if asset_item.retired_at is None:
+            asset_item.retire()
+        return Response(self.get_serializer(asset_item).data)
+
+    @action(detail=True, methods=['post'])
+    def restore(self, request, pk=None):
+        """Put a retired item that has not been archived yet back in service."""
+        asset_item = self.get_object()
+        if asset_item.retired_at is not None:
+            asset_item.restore()
+        return Response(self.get_serializer(asset_item).data)
+
+    @action(detail=False, methods=['get'])
+    def archived(self, request):
+        """
+        Items moved out of the live tables by archive_retired_items, newest
+        first. Filters: asset, location, serial_number, archived_at__gte/__lte.
+        ?limit= caps the rows returned (default 100, at most 1000).
+        """
+        try:
+            limit = min(max(int(request.query_params.get('limit', ARCHIVE_PAGE_SIZE)), 1), MAX_ARCHIVE_PAGE_SIZE)
+        except ValueError:
+            raise ValidationError({'limit': ['A valid integer is required.']})
+        queryset = scope_asset_items(
+            ArchivedAssetItem.objects.select_related('asset', 'location', 'vendor'), request.user,
+        )
+        queryset = ArchivedAssetItemFilterSet.apply(queryset, request.query_params)
+        if not queryset.query.order_by:
+            queryset = queryset.order_by('-archived_at', '-id')
+        return Response(ArchivedAssetItemSerializer(queryset[:limit], many=True).data)
+
+    @action(detail=False, methods=['get'], url_path=r'archived/(?P<archived_pk>\d+)')
+    def archived_detail(self, request, archived_pk=None):
+        """One archived item with its transfers and status history."""
+        queryset = scope_asset_items(ArchivedAssetItem.objects.select_related(
+            'asset', 'location', 'vendor',
+        ).prefetch_related(
+            'transfers__from_location', 'transfers__to_location', 'transfers__requested_by',
+            'transfers__approved_by', 'events__location', 'events__previous_location',
+        ), request.user)
+        asset_item = get_object_or_404(queryset, pk=archived_pk)
+        return Response(ArchivedAssetItemDetailSerializer(asset_item).data)
+
+    @action(detail=False, methods=['get'])
+    def analytics(self, request):
+        """
+        Time in status, failures, MTBF and utilisation per asset, from the
+        rollup maintained by the rollup_item_events command.
+        ?asset= limits the report to a comma-separated list of asset ids.
+        """
+        try:
+            asset_ids = [int(pk) for pk in request.query_params.get('asset', '').split(',') if pk]
+        except ValueError:
+            raise ValidationError({'asset': ['Enter a comma-separated list of asset ids.']})
+        return Response(asset_status_report(asset_ids))
+
     @action(detail=False, methods=['patch', 'get'], url_path='by-serial/(?P<serial_number>.+)')
     def by_serial_number(self, request, serial_number=None):
         """Get or update an asset item by its serial number."""
@@ -174,4 +253,43 @@ class AssetItemViewSet(viewsets.ModelViewSet):
             asset_item.save()
 
             serializer = self.get_serializer(asset_item)
-            return Response(serializer.data)
\ No newline at end of file
+            return Response(serializer.data)
+
+
+class AssetItemAsyncListView(AsyncAPIView):
+    """Async equivalent of AssetItemViewSet.list for ASGI deployments."""
+
+    async def get(self, request):
+        try:
+            queryset = AssetItemFilterSet.apply(scope_asset_items(AssetItem.objects.all(), request.user), request.GET)
+        except ValidationError as exc:
+            return self.render(exc.detail, status.HTTP_400_BAD_REQUEST)
+        return self.render(await AssetItemProjection().aproject(queryset))
+
+
+class AssetItemAsyncBySerialView(AsyncAPIView):
+    """Async equivalent of GET AssetItemViewSet.by_serial_number."""
+
+    async def get(self, request, serial_number):
+        queryset = AssetItem.objects.select_related(*ASSET_ITEM_RELATED).filter(serial_number=serial_number)
+
+        # Apply branch filtering for branch admins
+        user = request.user
+        if user.is_branch_admin and user.branch:
+            queryset = queryset.filter(location=user.branch)
+
+        try:
+            asset_item = await queryset.aget()
+        except AssetItem.DoesNotExist:
+            return self.render(
+                {'error': f'No asset item found with serial number: {serial_number}'},
+                status.HTTP_404_NOT_FOUND
+            )
+        except AssetItem.MultipleObjectsReturned:
+            return self.render(
+                {'error': f'Multiple asset items found with serial number: {serial_number}. Please use ID instead.'},
+                status.HTTP_400_BAD_REQUEST
+            )
+
+        serializer = AssetItemSerializer(asset_item, context={'request': request})
+        return self.render(serializer.data)
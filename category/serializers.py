@@ -1,7 +1,8 @@
 from .models import Category
 from rest_framework import serializers
+from core.sparse import SparseFieldsetSerializerMixin
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = '__all__'
@@ -1,13 +1,14 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
-from .views import CategoryViewSet
+from .views import CategoryViewSet, CategoryStatsAsyncView
 
 router = DefaultRouter()
 router.register(r'', CategoryViewSet)
 
 app_name = 'categories'
 urlpatterns = [
+    path('async/stats/', CategoryStatsAsyncView.as_view(), name='category-stats-async'),
     path('', include(router.urls)),
 ]
 
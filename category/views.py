@@ -3,8 +3,15 @@ from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from django.db.models import Count
+
 from asset.models import Asset
 from assetitem.models import AssetItem
+from core.async_views import AsyncAPIView
+from core.coalesce import coalesced
+from core.deletion import BulkDeleteMixin
+from core.throttling import ANALYTICS, BULK
+from core.sparse import SparseFieldsetMixin
 from .models import Category
 from .serializers import CategorySerializer
 from users.views import IsSuperAdmin
@@ -12,9 +19,10 @@ from users.views import IsSuperAdmin
 
 # Create your views here.
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(BulkDeleteMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
+    throttle_scopes = {'stats': ANALYTICS, 'bulk_create': BULK, 'destroy': BULK}
     
     def get_permissions(self):
         """
@@ -41,6 +49,7 @@ class CategoryViewSet(viewsets.ModelViewSet):
         serializer.save()
 
     @action(detail=False, methods=['get'], url_path='stats')
+    @coalesced('category-stats')
     def stats(self, request):
         # Only get non-blocked categories
         categories = Category.objects.filter(is_blocked=False)
@@ -86,4 +95,38 @@ class CategoryViewSet(viewsets.ModelViewSet):
         category.save()
 
         serializer = self.get_serializer(category)
-        return Response(serializer.data)
\ No newline at end of file
+        return Response(serializer.data)
+
+
+class CategoryStatsAsyncView(AsyncAPIView):
+    """
+    Async equivalent of CategoryViewSet.stats for ASGI deployments. Counts are
+    grouped in the database (two queries in total) instead of per category.
+    """
+    throttle_scope = ANALYTICS
+
+    async def get(self, request):
+        asset_totals = {
+            row['category']: row['total']
+            async for row in Asset.objects.values('category').annotate(total=Count('id')).order_by()
+        }
+        status_counts = {
+            (row['asset__category'], row['status']): row['total']
+            async for row in AssetItem.objects.values('asset__category', 'status').annotate(total=Count('id')).order_by()
+        }
+
+        result = []
+        async for category in Category.objects.filter(is_blocked=False):
+            result.append({
+                'id': category.id,
+                'name': category.name,
+                'totalAssets': asset_totals.get(category.id, 0),
+                'description': category.description or '',
+                'is_blocked': category.is_blocked,
+                'availableCount': status_counts.get((category.id, 'AVAILABLE'), 0),
+                'maintenanceCount': status_counts.get((category.id, 'MAINTENANCE'), 0),
+                'brokenCount': status_counts.get((category.id, 'BROKEN'), 0),
+                'assignedCount': status_counts.get((category.id, 'ASSIGNED'), 0)
+            })
+
+        return self.render(result)
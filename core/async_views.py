@@ -0,0 +1,88 @@
+"""
+Native async read endpoints.
+
+DRF views are synchronous, so under ASGI every DRF request occupies a worker
+thread for its whole lifetime. AsyncAPIView is a small async counterpart for
+read-only endpoints: it authenticates with the async ORM, runs the handler on
+the event loop and renders with the default DRF renderer, so responses match
+their sync equivalents byte for byte.
+"""
+import math
+
+from django.http import HttpResponse
+from django.views import View
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.settings import api_settings
+
+from core.throttling import READ, atake
+from users.models import User
+
+
+class AsyncAPIView(View):
+    http_method_names = ['get', 'head', 'options']
+    # Same renderer the DRF views negotiate for application/json.
+    renderer_class = api_settings.DEFAULT_RENDERER_CLASSES[0]
+
+    # Related objects permission checks and branch filters need; loaded with
+    # the user so no lazy (sync-only) query runs on the event loop.
+    user_related = ('role', 'branch')
+    # Token bucket scope, as with TokenBucketThrottle on the DRF views
+    throttle_scope = READ
+
+    async def dispatch(self, request, *args, **kwargs):
+        method = request.method.lower()
+        if method == 'head':
+            method = 'get'
+        handler = getattr(self, method, None) if method in self.http_method_names else None
+        if handler is None:
+            return self.render({'detail': f'Method "{request.method}" not allowed.'},
+                               status.HTTP_405_METHOD_NOT_ALLOWED)
+
+        user, error = await self.authenticate(request)
+        if error:
+            response = self.render({'detail': error}, status.HTTP_401_UNAUTHORIZED)
+            response['WWW-Authenticate'] = 'Token'
+            return response
+        request.user = user
+
+        wait = await atake(self.throttle_scope, user, request.META.get('REMOTE_ADDR'))
+        if wait:
+            seconds = math.ceil(wait)
+            response = self.render(
+                {'detail': f'Request was throttled. Expected available in {seconds} second{"s" if seconds != 1 else ""}.'},
+                status.HTTP_429_TOO_MANY_REQUESTS,
+            )
+            response['Retry-After'] = str(seconds)
+            return response
+        return await handler(request, *args, **kwargs)
+
+    async def authenticate(self, request):
+        """Token first, then session - the order of DEFAULT_AUTHENTICATION_CLASSES."""
+        auth = request.META.get('HTTP_AUTHORIZATION', '').split()
+        if auth and auth[0].lower() == 'token':
+            if len(auth) != 2:
+                return None, 'Invalid token header.'
+            try:
+                token = await Token.objects.select_related(
+                    *[f'user__{name}' for name in self.user_related]
+                ).aget(key=auth[1])
+            except Token.DoesNotExist:
+                return None, 'Invalid token.'
+            if not token.user.is_active:
+                return None, 'User inactive or deleted.'
+            return token.user, None
+
+        session_user = await request.auser()
+        if session_user.is_authenticated and session_user.is_active:
+            user = await User.objects.select_related(*self.user_related).aget(pk=session_user.pk)
+            return user, None
+        return None, 'Authentication credentials were not provided.'
+
+    def render(self, data, status_code=status.HTTP_200_OK):
+        renderer = self.renderer_class()
+        return HttpResponse(
+            renderer.render(data),
+            status=status_code,
+            content_type=f'{renderer.media_type}; charset={renderer.charset}' if renderer.charset else renderer.media_type,
+        )
@@ -0,0 +1,11 @@
+"""
+Signals for set-based inserts.
+
+QuerySet.bulk_create() sends no post_save. Code inserting a batch of rows
+sends ``post_bulk_create`` itself, inside the inserting transaction, with
+``instances`` (saved, primary keys set) and ``using``; apps that react to
+saves listen to it as well and take the batch in at once.
+"""
+from django.dispatch import Signal
+
+post_bulk_create = Signal()
@@ -0,0 +1,176 @@
+"""
+Request coalescing ("singleflight") for expensive read endpoints.
+
+``fetch(key, build)`` returns a cached result, computing it at most once
+however many callers ask at the same moment:
+
+- threads of one process asking for the same key wait on the first one's
+  computation and share its result;
+- processes coordinate through a lock key in the cache (``cache.add``):
+  the holder computes, the others poll until its result lands;
+- a result is fresh for ``fresh`` seconds and then served stale for
+  ``stale`` more while one caller, the one that takes the lock,
+  recomputes it.
+
+``@coalesced`` applies this to a DRF view method, keyed by the caller's
+branch scope and the request's parameters. The cache must be shared
+between processes (CACHE_REDIS_URL) for cross-process coalescing.
+"""
+import hashlib
+import threading
+import time
+import uuid
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+HIT, STALE, SHARED, MISS = 'hit', 'stale', 'shared', 'miss'
+POLL_SECONDS = 0.05
+
+
+class _Flight:
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+_flights = {}  # key -> _Flight in progress in this process
+_flights_lock = threading.Lock()
+
+
+def singleflight(key, compute):
+    """
+    Run ``compute()`` once for all threads of this process asking for
+    ``key`` at the same time; returns (result, shared).
+    """
+    with _flights_lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = _Flight()
+    if not leader:
+        if flight.done.wait(settings.COALESCE_LOCK_SECONDS):
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+        return compute(), False  # the leader is stuck; don't queue behind it forever
+    try:
+        flight.result = compute()
+        return flight.result, False
+    except Exception as exc:
+        flight.error = exc
+        raise
+    finally:
+        with _flights_lock:
+            del _flights[key]
+        flight.done.set()
+
+
+def _lock(key):
+    token = uuid.uuid4().hex
+    return token if cache.add(f'{key}:lock', token, timeout=settings.COALESCE_LOCK_SECONDS) else None
+
+
+def _unlock(key, token):
+    if cache.get(f'{key}:lock') == token:
+        cache.delete(f'{key}:lock')
+
+
+def _is_fresh(entry):
+    return entry is not None and entry['fresh_until'] > time.time()
+
+
+def _store(key, build, fresh, stale):
+    entry = {'data': build(), 'fresh_until': time.time() + fresh}
+    cache.set(key, entry, timeout=fresh + stale)
+    return entry
+
+
+def _compute(key, build, fresh, stale):
+    """Compute under the cross-process lock; returns (entry, computed here)."""
+    deadline = time.monotonic() + settings.COALESCE_LOCK_SECONDS
+    while (token := _lock(key)) is None:
+        entry = cache.get(key)
+        if _is_fresh(entry):
+            return entry, False
+        if time.monotonic() > deadline:
+            # The holder died or is far too slow; compute without the lock
+            return _store(key, build, fresh, stale), True
+        time.sleep(POLL_SECONDS)
+    try:
+        # Another process may have finished between our read and the lock
+        entry = cache.get(key)
+        if _is_fresh(entry):
+            return entry, False
+        return _store(key, build, fresh, stale), True
+    finally:
+        _unlock(key, token)
+
+
+def fetch(key, build, fresh=None, stale=None):
+    """
+    ``build()``'s result for ``key``, computed once per burst of callers.
+    Returns (data, outcome): HIT, STALE (served while another caller
+    recomputes), SHARED (waited for another caller's computation) or MISS.
+    """
+    fresh = settings.COALESCE_FRESH_SECONDS if fresh is None else fresh
+    stale = settings.COALESCE_STALE_SECONDS if stale is None else stale
+    entry = cache.get(key)
+    if _is_fresh(entry):
+        return entry['data'], HIT
+    if entry is not None:
+        token = _lock(key)
+        if token is None:
+            return entry['data'], STALE
+        try:
+            return _store(key, build, fresh, stale)['data'], MISS
+        finally:
+            _unlock(key, token)
+
+    (entry, computed), shared = singleflight(key, lambda: _compute(key, build, fresh, stale))
+    return entry['data'], MISS if computed and not shared else SHARED
+
+
+class _Uncacheable(Exception):
+
+    def __init__(self, response):
+        super().__init__(response.status_code)
+        self.response = response
+
+
+def request_key(name, user, params, kwargs=None):
+    """Cache key of a request: endpoint, branch scope and parameters."""
+    scope = user.branch_id if user.is_branch_admin and user.branch_id else 'all'
+    parts = sorted((key, tuple(params.getlist(key))) for key in params)
+    parts += sorted((kwargs or {}).items())
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+    return f'coalesce:{name}:{scope}:{digest}'
+
+
+def coalesced(name, fresh=None, stale=None):
+    """
+    Coalesce a DRF view method (``get`` or a list ``@action``). Only 200
+    responses are cached; the outcome is reported in ``X-Coalesce``.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(view, request, *args, **kwargs):
+            def build():
+                response = method(view, request, *args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    raise _Uncacheable(response)
+                return response.data
+
+            try:
+                data, outcome = fetch(request_key(name, request.user, request.query_params, kwargs),
+                                      build, fresh, stale)
+            except _Uncacheable as exc:
+                return exc.response
+            return Response(data, headers={'X-Coalesce': outcome})
+        return wrapper
+    return decorator
@@ -0,0 +1,41 @@
+"""
+MySQL backend that borrows connections from a process-wide pool.
+
+Enable it with ENGINE='core.db.backends.mysql_pool' and an optional
+``POOL`` dict in the database settings (MAX_SIZE, TIMEOUT, MAX_IDLE).
+Keep CONN_MAX_AGE at 0 so every request hands its connection back.
+"""
+from django.db.backends.mysql import base
+
+from core.db.pool import get_pool
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+
+    @property
+    def pool(self):
+        return get_pool(self.alias, self.settings_dict.get('POOL') or {})
+
+    def get_new_connection(self, conn_params):
+        check = self._ping if self.settings_dict['CONN_HEALTH_CHECKS'] else None
+        return self.pool.acquire(
+            lambda: super(DatabaseWrapper, self).get_new_connection(conn_params),
+            check=check,
+        )
+
+    def _close(self):
+        if self.connection is None:
+            return
+        # A connection closed inside atomic() stays referenced by this
+        # wrapper until rollback, so it must never be handed to another thread.
+        reusable = not (self.in_atomic_block or self.errors_occurred)
+        with self.wrap_database_errors:
+            self.pool.release(self.connection, reusable=reusable)
+
+    @staticmethod
+    def _ping(conn):
+        try:
+            conn.ping()
+        except Exception:
+            return False
+        return True
@@ -0,0 +1,157 @@
+"""
+Process-wide pool of raw DB-API connections.
+
+Django keeps one connection per thread and, with CONN_MAX_AGE=0, closes it at
+the end of every request. The pooled backends hand those raw connections back
+here instead of closing them, so the next request (on any thread) can reuse an
+already authenticated connection.
+"""
+import threading
+import time
+from collections import deque
+
+from django.db import OperationalError
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class PoolTimeout(OperationalError):
+    """Raised when no connection became available within the wait timeout."""
+
+
+class ConnectionPool:
+    """A bounded pool of raw connections for a single database alias."""
+
+    def __init__(self, alias, max_size=10, timeout=5.0, max_idle=300):
+        self.alias = alias
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._idle = deque()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._counters = {
+            'created': 0,
+            'reused': 0,
+            'discarded': 0,
+            'timeouts': 0,
+            'waits': 0,
+            'wait_time_total': 0.0,
+        }
+
+    def acquire(self, connect, check=None):
+        """
+        Check out a connection, creating one with ``connect()`` if no idle
+        connection is available. ``check(conn)`` is an optional health check
+        run on reused connections; failing ones are discarded.
+        """
+        started = time.monotonic()
+        if not self._slots.acquire(blocking=False):
+            if not self._slots.acquire(timeout=self.timeout):
+                with self._lock:
+                    self._counters['timeouts'] += 1
+                raise PoolTimeout(
+                    f"Timed out after {self.timeout}s waiting for a connection "
+                    f"from the '{self.alias}' pool (max_size={self.max_size})."
+                )
+            with self._lock:
+                self._counters['waits'] += 1
+                self._counters['wait_time_total'] += time.monotonic() - started
+
+        try:
+            conn = self._checkout_idle(check)
+            if conn is None:
+                conn = connect()
+                with self._lock:
+                    self._counters['created'] += 1
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._in_use += 1
+        return conn
+
+    def _checkout_idle(self, check):
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                conn, returned_at = self._idle.pop()
+            if self.max_idle is not None and now - returned_at > self.max_idle:
+                self._discard(conn)
+                continue
+            if check is not None and not check(conn):
+                self._discard(conn)
+                continue
+            with self._lock:
+                self._counters['reused'] += 1
+            return conn
+
+    def release(self, conn, reusable=True):
+        """Return a checked-out connection, rolling back any open transaction."""
+        try:
+            if reusable:
+                try:
+                    conn.rollback()
+                except Exception:
+                    reusable = False
+            if reusable:
+                with self._lock:
+                    self._idle.append((conn, time.monotonic()))
+            else:
+                self._discard(conn)
+        finally:
+            with self._lock:
+                self._in_use -= 1
+            self._slots.release()
+
+    def _discard(self, conn):
+        with self._lock:
+            self._counters['discarded'] += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def close_idle(self):
+        """Close every idle connection, e.g. before forking workers."""
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for conn, _ in idle:
+            self._discard(conn)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'alias': self.alias,
+                'max_size': self.max_size,
+                'timeout': self.timeout,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                **self._counters,
+            }
+
+
+def get_pool(alias, options):
+    """Return the pool for ``alias``, creating it from ``options`` on first use."""
+    with _pools_lock:
+        pool = _pools.get(alias)
+        if pool is None:
+            pool = _pools[alias] = ConnectionPool(
+                alias,
+                max_size=int(options.get('MAX_SIZE', 10)),
+                timeout=float(options.get('TIMEOUT', 5)),
+                max_idle=options.get('MAX_IDLE', 300),
+            )
+        return pool
+
+
+def pool_stats():
+    """Snapshot of the metrics for every pool created in this process."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    return [pool.stats() for pool in pools]
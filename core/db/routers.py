@@ -0,0 +1,87 @@
+"""
+Primary/replica routing.
+
+Replicas are the entries in DATABASES that carry ``'REPLICA_OF': 'default'``
+(see DB_REPLICAS in settings). Reads are only sent to a replica while
+ReplicaRoutingMiddleware has marked the current request as a safe, unpinned
+read; everything else - writes, management commands, reads inside atomic()
+blocks, auth/session lookups - goes to the primary.
+
+To try it locally with SQLite::
+
+    DB_ENGINE=django.db.backends.sqlite3 DB_NAME=primary.sqlite3 \\
+    DB_REPLICAS=replica.sqlite3 python manage.py migrate
+    DB_ENGINE=django.db.backends.sqlite3 DB_NAME=primary.sqlite3 \\
+    DB_REPLICAS=replica.sqlite3 python manage.py migrate --database replica_1
+
+and copy primary.sqlite3 over replica.sqlite3 to simulate replication.
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# Authentication and permission checks must never see a lagging copy of a
+# token, session, user or role that was written a moment ago.
+PRIMARY_ONLY_APPS = {'auth', 'authtoken', 'sessions', 'contenttypes', 'users'}
+
+_read_from_replica = ContextVar('read_from_replica', default=False)
+
+
+def replica_aliases():
+    return [
+        alias for alias, settings_dict in settings.DATABASES.items()
+        if settings_dict.get('REPLICA_OF') == DEFAULT_DB_ALIAS
+    ]
+
+
+def set_replica_reads(enabled):
+    """Allow or forbid replica reads for the current context; returns a reset token."""
+    return _read_from_replica.set(enabled)
+
+
+def reset_replica_reads(token):
+    _read_from_replica.reset(token)
+
+
+@contextmanager
+def use_primary():
+    """Send every read inside the block to the primary database."""
+    token = _read_from_replica.set(False)
+    try:
+        yield
+    finally:
+        _read_from_replica.reset(token)
+
+
+def primary_db(view):
+    """
+    Mark a view class, a viewset or a single viewset action as always
+    reading from the primary database.
+    """
+    view.force_primary_db = True
+    return view
+
+
+class PrimaryReplicaRouter:
+
+    def db_for_read(self, model, **hints):
+        if not _read_from_replica.get():
+            return DEFAULT_DB_ALIAS
+        if model._meta.app_label in PRIMARY_ONLY_APPS:
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        replicas = replica_aliases()
+        if not replicas:
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary.
+        return True
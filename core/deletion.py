@@ -0,0 +1,214 @@
+"""
+Set-based cascading deletes.
+
+Django's ``Model.delete()`` loads every cascaded row into memory and deletes
+them in one transaction, which is fine for a vendor but not for a category
+with a million items under it. ``DeletionPlan`` walks the same ``on_delete``
+rules from model metadata, but describes each affected table as a queryset
+filtered by subqueries on its parents. The deletion then sweeps the tables
+children-first, ``DELETION_CHUNK_SIZE`` primary keys per transaction:
+``SET_NULL``/``SET_DEFAULT`` children are updated, ``pre_bulk_delete`` is sent
+and the chunk removed with a single ``DELETE ... WHERE pk IN (...)``.
+
+Rows are not loaded as instances, so ``pre_delete``/``post_delete`` do not
+fire; apps that react to deletes listen to ``pre_bulk_delete`` as well.
+A sweep interrupted half way leaves the children of still existing parents
+deleted; running it again finishes the job.
+"""
+import logging
+
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.db.models.sql import DeleteQuery
+from django.dispatch import Signal
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
+
+from .models import DeletionJob, DeletionStatus
+from .serializers import DeletionJobSerializer
+
+logger = logging.getLogger(__name__)
+
+# Sent inside each chunk's transaction, before the rows are deleted, with
+# ``queryset`` (the chunk) and ``using``.
+pre_bulk_delete = Signal()
+
+# Rows inserted under a parent mid-sweep make its DELETE fail; sweep again.
+MAX_PASSES = 3
+
+
+def _relations(model):
+    """Reverse relations a delete of ``model`` must handle (as Django's Collector)."""
+    return [
+        field for field in model._meta.get_fields(include_hidden=True)
+        if field.auto_created and not field.concrete and (field.one_to_one or field.one_to_many)
+    ]
+
+
+def _referencing(relation, rows):
+    """Rows of ``relation.related_model`` pointing at ``rows``."""
+    field = relation.field
+    return relation.related_model._base_manager.using(rows.db).filter(
+        **{f'{field.attname}__in': rows.values(field.target_field.attname)}
+    )
+
+
+def _delete_rows(model, pks, using):
+    """
+    ``DELETE ... WHERE pk IN (pks)``, the statement Django's Collector issues
+    once it has resolved the cascades; returns the number of rows deleted.
+    """
+    return DeleteQuery(model).delete_batch(pks, using)
+
+
+class DeletionPlan:
+    """The tables a delete of ``queryset`` touches, in the order they are swept."""
+
+    def __init__(self, queryset):
+        self.queryset = queryset
+        self.using = queryset.db
+        self.targets = {queryset.model: queryset}  # model -> rows to delete
+        self.nullify = {}  # model -> relations to null (or default) before its rows go
+        children = {}
+        pending = [(queryset.model, queryset, (queryset.model,))]
+        while pending:
+            parent, rows, path = pending.pop()
+            for relation in _relations(parent):
+                on_delete = relation.on_delete
+                if on_delete is models.DO_NOTHING:
+                    continue
+                if on_delete in (models.PROTECT, models.RESTRICT):
+                    protected = _referencing(relation, rows)
+                    if protected.exists():
+                        raise models.ProtectedError(
+                            f'{parent.__name__} rows are still referenced by {relation.related_model.__name__}.',
+                            protected,
+                        )
+                    continue
+                if on_delete in (models.SET_NULL, models.SET_DEFAULT):
+                    self.nullify.setdefault(parent, []).append(relation)
+                    continue
+                if on_delete is not models.CASCADE:
+                    raise ValueError(f'Unsupported on_delete for {relation.field} in a bulk delete.')
+
+                child = relation.related_model
+                if child in path:
+                    raise ValueError(f'Cascade cycle through {child.__name__}; delete it with Model.delete().')
+                related = _referencing(relation, rows)
+                self.targets[child] = self.targets[child] | related if child in self.targets else related
+                children.setdefault(parent, set()).add(child)
+                pending.append((child, related, path + (child,)))
+
+        # Children before parents: a post-order walk of the cascade graph
+        self.order, seen = [], set()
+
+        def visit(model):
+            seen.add(model)
+            for child in sorted(children.get(model, ()), key=lambda m: m._meta.label):
+                if child not in seen:
+                    visit(child)
+            self.order.append(model)
+
+        visit(queryset.model)
+
+    def counts(self):
+        """Rows that would be deleted, per model label (the dry run)."""
+        return {model._meta.label: self.targets[model].count() for model in self.order}
+
+    def execute(self, chunk_size=None, on_progress=None):
+        """Delete everything in the plan; returns deleted rows per model label."""
+        chunk_size = chunk_size or settings.DELETION_CHUNK_SIZE
+        deleted = {model._meta.label: 0 for model in self.order}
+        for attempt in range(1, MAX_PASSES + 1):
+            try:
+                for model in self.order:
+                    self._sweep(model, chunk_size, deleted, on_progress)
+                return deleted
+            except IntegrityError:
+                if attempt == MAX_PASSES:
+                    raise
+                logger.info('Rows were added during a bulk delete of %s, sweeping again',
+                            self.queryset.model._meta.label)
+
+    def _sweep(self, model, chunk_size, deleted, on_progress):
+        rows = self.targets[model]
+        manager = model._base_manager.using(self.using)
+        while True:
+            pks = list(rows.values_list('pk', flat=True)[:chunk_size])
+            if not pks:
+                return
+            for relation in self.nullify.get(model, ()):
+                self._nullify(relation, pks, chunk_size)
+            with transaction.atomic(using=self.using):
+                chunk = manager.filter(pk__in=pks)
+                pre_bulk_delete.send(sender=model, queryset=chunk, using=self.using)
+                deleted[model._meta.label] += _delete_rows(model, pks, self.using)
+            if on_progress:
+                on_progress(deleted)
+
+    def _nullify(self, relation, pks, chunk_size):
+        field = relation.field
+        value = None if relation.on_delete is models.SET_NULL else field.get_default()
+        manager = relation.related_model._base_manager.using(self.using)
+        referencing = manager.filter(**{f'{field.attname}__in': pks})
+        while ids := list(referencing.values_list('pk', flat=True)[:chunk_size]):
+            manager.filter(pk__in=ids).update(**{field.attname: value})
+
+
+def is_dry_run(request):
+    return request.query_params.get('dry_run', '').lower() in ('1', 'true', 'yes')
+
+
+class BulkDeleteMixin:
+    """
+    ViewSet mixin routing ``destroy`` through DeletionPlan. ``?dry_run=1``
+    returns the per-table counts without deleting; cascades of up to
+    DELETION_INLINE_LIMIT rows are deleted in the request, larger ones are
+    queued as a DeletionJob (202 with the job) for ``run_deletion_jobs``.
+    """
+
+    def destroy(self, request, *args, **kwargs):
+        instance = self.get_object()
+        model = type(instance)
+        rows = model._base_manager.filter(pk=instance.pk)
+        try:
+            plan = DeletionPlan(rows)
+        except models.ProtectedError as exc:
+            return Response({'detail': exc.args[0]}, status=status.HTTP_409_CONFLICT)
+
+        counts = plan.counts()
+        total = sum(counts.values())
+        if is_dry_run(request):
+            return Response({'dry_run': True, 'total': total, 'counts': counts})
+
+        if total <= settings.DELETION_INLINE_LIMIT:
+            plan.execute()
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
+        job = DeletionJob.enqueue(model, instance.pk, counts, request.user)
+        return Response(
+            DeletionJobSerializer(job).data, status=status.HTTP_202_ACCEPTED,
+            headers={'Location': reverse('system:deletion-job', args=[job.pk], request=request)},
+        )
+
+
+def run_job(job):
+    """Run a claimed DeletionJob to completion, recording progress as it goes."""
+    def progress(deleted):
+        DeletionJob.objects.filter(pk=job.pk).update(deleted=deleted, updated_at=timezone.now())
+
+    try:
+        rows = job.target_model()._base_manager.filter(pk=job.object_id)
+        deleted = DeletionPlan(rows).execute(on_progress=progress)
+    except Exception as exc:
+        logger.exception('Deletion job %s failed', job.pk)
+        DeletionJob.objects.filter(pk=job.pk).update(
+            status=DeletionStatus.FAILED, error=str(exc), finished_at=timezone.now(), updated_at=timezone.now(),
+        )
+        return False
+    DeletionJob.objects.filter(pk=job.pk).update(
+        status=DeletionStatus.COMPLETED, deleted=deleted, finished_at=timezone.now(), updated_at=timezone.now(),
+    )
+    return True
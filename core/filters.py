@@ -0,0 +1,172 @@
+"""
+Declarative, index-aware filtering and ordering for list endpoints.
+
+A FilterSet maps query parameters to model lookups::
+
+    class AssetFilterSet(FilterSet):
+        model = Asset
+        filters = {
+            'category': Filter('category'),
+            'price': Filter('price', RANGE),        # ?price__gte=&price__lte=
+        }
+        ordering_fields = ['name', 'price']         # ?ordering=-price
+
+Every declared filter must hit an indexed column; that is verified when the
+FilterSet class is defined, so an unindexed filter never ships. Orderings are
+checked per request: without equality filters the ordering column must be
+indexed; with them it must follow some of the equality-filtered columns in a
+composite index. Other combinations are rejected with a 400, or only logged
+when FILTERS_UNINDEXED_ORDERING is 'warn'.
+
+A FilterSet whose querysets always arrive filtered by equality on some
+columns (a read model partitioned by location, say) names them in ``scope``;
+indexes leading with those columns then count for the other filters and the
+orderings as if the scope columns weren't there.
+"""
+import logging
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured, ValidationError as DjangoValidationError
+from django.db import models
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+logger = logging.getLogger(__name__)
+
+EXACT = ('exact',)
+RANGE = ('gte', 'lte')
+SET = ('exact', 'in')
+
+
+class Filter:
+
+    def __init__(self, path, lookups=EXACT):
+        self.path = path
+        self.lookups = tuple(lookups)
+
+
+def _resolve_field(model, path):
+    """Return (model, field) for the last hop of ``path``."""
+    parts = path.split('__')
+    for part in parts[:-1]:
+        model = model._meta.get_field(part).related_model
+    return model, model._meta.get_field(parts[-1])
+
+
+def _index_columns(model):
+    """Column lists (by field name) of every index on ``model``."""
+    indexes = [[name.lstrip('-') for name in index.fields] for index in model._meta.indexes]
+    indexes.extend(list(fields) for fields in model._meta.unique_together)
+    indexes.extend(list(constraint.fields) for constraint in model._meta.constraints
+                   if isinstance(constraint, models.UniqueConstraint) and constraint.fields)
+    for field in model._meta.concrete_fields:
+        if field.primary_key or field.unique or field.db_index:
+            indexes.append([field.name])
+    return indexes
+
+
+def _unscoped(columns, scope):
+    """``columns`` without the leading run of ``scope`` columns."""
+    index = 0
+    while index < len(columns) and columns[index] in scope:
+        index += 1
+    return columns[index:]
+
+
+def is_indexed(model, path, scope=()):
+    model, field = _resolve_field(model, path)
+    return any(
+        columns[:1] == [field.name] or _unscoped(columns, scope)[:1] == [field.name]
+        for columns in _index_columns(model)
+    )
+
+
+class FilterSet:
+    model = None
+    filters = {}
+    ordering_fields = ()
+    scope = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        unindexed = [name for name, flt in cls.filters.items() if not is_indexed(cls.model, flt.path, cls.scope)]
+        if unindexed:
+            raise ImproperlyConfigured(
+                f'{cls.__name__} declares filters on unindexed columns: {", ".join(unindexed)}. '
+                f'Add an index to {cls.model.__name__} or drop the filter.'
+            )
+
+    @classmethod
+    def apply(cls, queryset, params):
+        """Filter and order ``queryset`` from ``params``; raises ValidationError on bad input."""
+        lookups = {}
+        equality_columns = set()
+        for name, flt in cls.filters.items():
+            _, field = _resolve_field(cls.model, flt.path)
+            for lookup in flt.lookups:
+                param = name if lookup == 'exact' else f'{name}__{lookup}'
+                raw = params.get(param)
+                if raw in (None, ''):
+                    continue
+                try:
+                    if lookup == 'in':
+                        value = [cls._clean(field, part) for part in raw.split(',') if part]
+                    else:
+                        value = cls._clean(field, raw)
+                except DjangoValidationError as exc:
+                    raise ValidationError({param: exc.messages})
+                lookups[flt.path if lookup == 'exact' else f'{flt.path}__{lookup}'] = value
+                if lookup in SET and '__' not in flt.path:
+                    equality_columns.add(field.name)
+
+        queryset = queryset.filter(**lookups)
+
+        ordering = params.get('ordering')
+        if ordering:
+            terms = [term.strip() for term in ordering.split(',') if term.strip()]
+            invalid = [term for term in terms if term.lstrip('-') not in cls.ordering_fields]
+            if invalid:
+                raise ValidationError({'ordering': [
+                    f'Unsupported ordering: {", ".join(invalid)}. '
+                    f'Choose from: {", ".join(cls.ordering_fields)}.'
+                ]})
+            cls._check_ordering(terms[0].lstrip('-'), equality_columns | set(cls.scope))
+            queryset = queryset.order_by(*terms)
+        return queryset
+
+    @staticmethod
+    def _clean(field, raw):
+        value = field.to_python(raw)
+        if field.choices and value not in {choice for choice, _ in field.flatchoices}:
+            raise DjangoValidationError(f'"{raw}" is not a valid choice.')
+        return value
+
+    @classmethod
+    def _check_ordering(cls, column, equality_columns):
+        for columns in _index_columns(cls.model):
+            if column not in columns:
+                continue
+            prefix = set(columns[:columns.index(column)])
+            # With equality filters the index must lead with (some of) them,
+            # otherwise the database filters on one index and sorts in memory.
+            if prefix <= equality_columns and (prefix or not equality_columns):
+                return
+
+        message = (
+            f'Ordering by {column} with filters on {", ".join(sorted(equality_columns)) or "nothing"} '
+            f'is not backed by an index on {cls.model.__name__}.'
+        )
+        if getattr(settings, 'FILTERS_UNINDEXED_ORDERING', 'reject') == 'warn':
+            logger.warning(message)
+            return
+        raise ValidationError({'ordering': [message]})
+
+
+class IndexedFilterBackend(BaseFilterBackend):
+    """Applies the view's ``filterset_class``, if it has one."""
+
+    def filter_queryset(self, request, queryset, view):
+        filterset_class = getattr(view, 'filterset_class', None)
+        if filterset_class is None:
+            return queryset
+        return filterset_class.apply(queryset, request.query_params)
@@ -0,0 +1,115 @@
+"""
+Per-object cache of serialized list rows.
+
+A Projection declaring ``version_columns`` can be served through project():
+the list query first reads only the pk and versions of the matching rows,
+their cached fragments come back in one get_many(), and just the misses are
+built (one query restricted to their pks) and cached. The versions are
+``updated_at`` columns, which every save() bumps, plus any column written
+behind them (``image_digest``), so an edited row simply misses.
+
+Names a fragment copies from other rows (a category's, a vendor's) don't
+move its versions. depends() declares them: a change to one of those fields,
+or a delete of such a row, bumps the fragment model's generation, which is
+part of every key, orphaning its cached fragments to expire on their TTL.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from .deletion import pre_bulk_delete
+
+FRAGMENT_BATCH_SIZE = 500
+
+# related model -> {fragment model: fields its fragments copy}
+_DEPENDANTS = {}
+
+
+def _generation_key(model):
+    return f'fragments:generation:{model._meta.label_lower}'
+
+
+def _prefix(model):
+    generation = cache.get_or_set(_generation_key(model), 1, timeout=None)
+    return f'fragment:{model._meta.label_lower}:g{generation}'
+
+
+def _version_repr(version):
+    if not version:
+        return '-'
+    return version.isoformat() if hasattr(version, 'isoformat') else str(version)
+
+
+def _key(prefix, pk, versions):
+    return f'{prefix}:{pk}:' + ':'.join(_version_repr(version) for version in versions)
+
+
+def invalidate(*models):
+    """Drop every cached fragment of ``models``."""
+    for model in models:
+        try:
+            cache.incr(_generation_key(model))
+        except ValueError:  # never cached, nothing to invalidate
+            pass
+
+
+def project(queryset, projection):
+    """``projection.project(queryset)``, reusing cached fragments of unchanged rows."""
+    timeout = settings.FRAGMENT_CACHE_SECONDS
+    if not timeout:
+        return projection.project(queryset)
+    model = queryset.model
+    versions = projection.version_columns
+    prefix = _prefix(model)
+
+    rows = [(row[0], _key(prefix, row[0], row[1:])) for row in queryset.values_list('pk', *versions)]
+    cached = cache.get_many([key for _, key in rows])
+    fragments = {pk: cached[key] for pk, key in rows if key in cached}
+    missing = [pk for pk, key in rows if key not in cached]
+
+    # Built rows are keyed by the versions read with them, which may be
+    # newer than the ones above if the row was written in between.
+    fresh, width = {}, 1 + len(versions)
+    base = model._base_manager.using(queryset.db)
+    for start in range(0, len(missing), FRAGMENT_BATCH_SIZE):
+        chunk = base.filter(pk__in=missing[start:start + FRAGMENT_BATCH_SIZE])
+        for row in chunk.values_list('pk', *versions, *projection.columns):
+            fragments[row[0]] = fresh[_key(prefix, row[0], row[1:width])] = projection.build(row[width:])
+    if fresh:
+        cache.set_many(fresh, timeout)
+    # A row deleted between the two reads is left out
+    return [fragments[pk] for pk, _ in rows if pk in fragments]
+
+
+def depends(fragment_model, related_model, fields):
+    """``fragment_model``'s fragments copy ``fields`` of ``related_model`` rows."""
+    if related_model not in _DEPENDANTS:
+        uid = f'fragments_{related_model._meta.label}'
+        pre_save.connect(_remember, sender=related_model, dispatch_uid=f'{uid}_remember')
+        post_save.connect(_invalidate_on_save, sender=related_model, dispatch_uid=f'{uid}_save')
+        post_delete.connect(_invalidate_on_delete, sender=related_model, dispatch_uid=f'{uid}_delete')
+        pre_bulk_delete.connect(_invalidate_on_delete, sender=related_model, dispatch_uid=f'{uid}_bulk_delete')
+    _DEPENDANTS.setdefault(related_model, {})[fragment_model] = tuple(fields)
+
+
+def _remember(sender, instance, raw=False, **kwargs):
+    fields = {field for fields in _DEPENDANTS[sender].values() for field in fields}
+    previous = sender._base_manager.filter(pk=instance.pk).values(*fields).first() if instance.pk and not raw else None
+    instance._fragments_changed = previous is not None and [
+        model for model, copied in _DEPENDANTS[sender].items()
+        if any(previous[field] != getattr(instance, field) for field in copied)
+    ]
+
+
+def _invalidate_on_save(sender, instance, **kwargs):
+    models = getattr(instance, '_fragments_changed', None)
+    if models:
+        del instance._fragments_changed
+        transaction.on_commit(lambda: invalidate(*models))
+
+
+def _invalidate_on_delete(sender, **kwargs):
+    # SET_NULL relations are cleared by UPDATEs that don't move the versions
+    models = list(_DEPENDANTS[sender])
+    transaction.on_commit(lambda: invalidate(*models))
@@ -0,0 +1,156 @@
+"""
+Idempotency-Key support for retried POSTs.
+
+A client sends ``Idempotency-Key: <unique value>`` with a POST. The first
+request claims the key and runs; its response is stored for
+IDEMPOTENCY_TTL_SECONDS. Retries with the same key and an identical request
+get the stored response back without the view running again (marked with
+``Idempotent-Replayed: true``). A retry that arrives while the first request
+is still running gets 409; reusing a key for a different request gets 422.
+
+Server errors (5xx) are not stored, so the client can retry them. A claim
+whose request died without finishing is taken over after
+IDEMPOTENCY_LOCK_SECONDS.
+"""
+import datetime
+import hashlib
+import json
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.response import Response
+
+from .models import IdempotencyRecord
+from .renderers import dumps
+
+HEADER = 'Idempotency-Key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+MAX_KEY_LENGTH = 255
+
+
+class IdempotencyInProgress(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = 'A request with this Idempotency-Key is still being processed.'
+    default_code = 'idempotency_in_progress'
+
+
+class IdempotencyKeyReused(APIException):
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = 'This Idempotency-Key was already used for a different request.'
+    default_code = 'idempotency_key_reused'
+
+
+class _Replay(Exception):
+
+    def __init__(self, record):
+        self.record = record
+
+
+def _update_with_upload(digest, request):
+    """
+    Multipart bodies are hashed as parsed: form fields, then each file's
+    name, size and content read in chunks. Reading ``request.body`` would
+    load the whole upload into memory and trip DATA_UPLOAD_MAX_MEMORY_SIZE.
+    """
+    fields = sorted((name, values) for name, values in request.POST.lists())
+    digest.update(dumps(fields))
+    for name, files in sorted(request.FILES.lists()):
+        for file in files:
+            digest.update(dumps([name, file.name, file.size]))
+            for chunk in file.chunks():
+                digest.update(chunk)
+            file.seek(0)
+
+
+def fingerprint(request):
+    """Hash of what makes two requests 'the same': method, path and body."""
+    digest = hashlib.sha256()
+    digest.update(request.method.encode())
+    digest.update(request.get_full_path().encode())
+    if request.content_type.startswith('multipart/'):
+        _update_with_upload(digest, request)
+    else:
+        digest.update(request.body)
+    return digest.hexdigest()
+
+
+def claim(user, key, request_fingerprint):
+    """
+    Claim ``key`` for a new request and return its record, or raise
+    _Replay with the finished record of an earlier identical request.
+    """
+    now = timezone.now()
+    lock_until = now + datetime.timedelta(seconds=settings.IDEMPOTENCY_LOCK_SECONDS)
+    expires_at = now + datetime.timedelta(seconds=settings.IDEMPOTENCY_TTL_SECONDS)
+    with transaction.atomic():
+        try:
+            with transaction.atomic():
+                return IdempotencyRecord.objects.create(
+                    user=user, key=key, fingerprint=request_fingerprint,
+                    locked_until=lock_until, expires_at=expires_at,
+                )
+        except IntegrityError:
+            pass
+
+        record = IdempotencyRecord.objects.select_for_update().get(user=user, key=key)
+        abandoned = record.response_status is None and record.locked_until <= now
+        if record.expires_at <= now or abandoned:
+            record.fingerprint = request_fingerprint
+            record.response_status = record.response_body = None
+            record.locked_until, record.expires_at = lock_until, expires_at
+            record.save()
+            return record
+        if record.fingerprint != request_fingerprint:
+            raise IdempotencyKeyReused()
+        if record.response_status is None:
+            raise IdempotencyInProgress()
+        raise _Replay(record)
+
+
+def complete(record, response):
+    if response.status_code >= 500:
+        # Let the client retry the failed request with the same key
+        record.delete()
+        return
+    record.response_status = response.status_code
+    record.response_body = dumps(response.data).decode()
+    record.save(update_fields=['response_status', 'response_body'])
+
+
+class IdempotencyMixin:
+    """
+    APIView/ViewSet mixin adding Idempotency-Key handling to the methods in
+    ``idempotent_methods``. Requests without the header are unaffected.
+    """
+    idempotent_methods = ('POST',)
+
+    def initial(self, request, *args, **kwargs):
+        # Authentication and permissions first: keys are scoped per user
+        super().initial(request, *args, **kwargs)
+        self._idempotency_record = None
+        key = request.headers.get(HEADER)
+        if not key or request.method not in self.idempotent_methods:
+            return
+        if len(key) > MAX_KEY_LENGTH:
+            raise ValidationError({HEADER: [f'Must be at most {MAX_KEY_LENGTH} characters.']})
+        self._idempotency_record = claim(request.user, key, fingerprint(request))
+
+    def handle_exception(self, exc):
+        if isinstance(exc, _Replay):
+            return Response(
+                json.loads(exc.record.response_body),
+                status=exc.record.response_status,
+                headers={REPLAYED_HEADER: 'true'},
+            )
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        record = getattr(self, '_idempotency_record', None)
+        if record is not None:
+            self._idempotency_record = None
+            complete(record, response)
+        return response
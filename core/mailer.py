@@ -0,0 +1,67 @@
+"""
+A database-backed outbox for notification mail.
+
+Jobs call ``queue()`` inside their own transaction, so a rolled back job
+sends nothing, and never wait on SMTP. ``send_pending()`` (the
+``send_queued_mail`` command) delivers the outbox MAIL_BATCH_SIZE messages
+per connection; a message that fails is retried on later runs until it has
+been tried MAIL_MAX_ATTEMPTS times.
+"""
+import logging
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import models
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+
+def queue(messages):
+    """
+    Queue (key, to, subject, body) tuples; a key already in the outbox is
+    skipped. Returns the number of messages queued.
+    """
+    rows = [OutboundEmail(key=key, to=list(to), subject=subject, body=body)
+            for key, to, subject, body in messages if to]
+    keys = [row.key for row in rows if row.key]
+    existing = set(OutboundEmail.objects.filter(key__in=keys).values_list('key', flat=True))
+    rows = [row for row in rows if row.key not in existing]
+    OutboundEmail.objects.bulk_create(rows, ignore_conflicts=True)
+    return len(rows)
+
+
+def pending():
+    return OutboundEmail.objects.filter(sent_at__isnull=True, attempts__lt=settings.MAIL_MAX_ATTEMPTS)
+
+
+def send_pending(batch_size=None):
+    """Deliver the outbox; returns (sent, failed)."""
+    batch_size = batch_size or settings.MAIL_BATCH_SIZE
+    sent = failed = 0
+    last_pk = 0
+    while True:
+        batch = list(pending().filter(pk__gt=last_pk).order_by('pk')[:batch_size])
+        if not batch:
+            return sent, failed
+        last_pk = batch[-1].pk
+        delivered, errors = [], {}
+        # One connection (one SMTP login) for the whole batch
+        with get_connection(fail_silently=False) as connection:
+            for email in batch:
+                try:
+                    EmailMessage(email.subject, email.body, settings.DEFAULT_FROM_EMAIL,
+                                 email.to, connection=connection).send()
+                    delivered.append(email.pk)
+                except Exception as exc:
+                    logger.warning('Sending queued email %s failed: %s', email.pk, exc)
+                    errors[email.pk] = str(exc)
+        OutboundEmail.objects.filter(pk__in=delivered).update(
+            sent_at=timezone.now(), attempts=models.F('attempts') + 1, error=None,
+        )
+        for pk, error in errors.items():
+            OutboundEmail.objects.filter(pk=pk).update(attempts=models.F('attempts') + 1, error=error)
+        sent += len(delivered)
+        failed += len(errors)
@@ -0,0 +1,125 @@
+import asyncio
+import io
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand, CommandError
+from django.core.wsgi import get_wsgi_application
+from rest_framework.authtoken.models import Token
+
+from users.models import User
+
+DEFAULT_PATHS = {
+    'async': '/api/users/users/async/me/',
+    'sync': '/api/users/users/me/',
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Drive the ASGI application with many concurrent connections and the '
+        'WSGI application with a fixed thread pool, in-process, and compare '
+        'throughput and latency'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--username', required=True, help='User to authenticate as')
+        parser.add_argument('--requests', type=int, default=1000)
+        parser.add_argument('--concurrency', type=int, default=200,
+                            help='Concurrent in-flight requests on the ASGI path')
+        parser.add_argument('--threads', type=int, default=8,
+                            help='Worker threads on the WSGI path (like gunicorn --threads)')
+        parser.add_argument('--async-path', default=DEFAULT_PATHS['async'])
+        parser.add_argument('--sync-path', default=DEFAULT_PATHS['sync'])
+        parser.add_argument('--host', default='localhost')
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options['username'])
+        except User.DoesNotExist:
+            raise CommandError(f"User '{options['username']}' does not exist")
+        token, _ = Token.objects.get_or_create(user=user)
+        auth = f'Token {token.key}'
+
+        asgi_latencies, asgi_elapsed = asyncio.run(self._run_asgi(
+            options['async_path'], auth, options['host'], options['requests'], options['concurrency']
+        ))
+        self._report(f"ASGI  async view, {options['concurrency']} concurrent", asgi_latencies, asgi_elapsed)
+
+        wsgi_latencies, wsgi_elapsed = self._run_wsgi(
+            options['sync_path'], auth, options['host'], options['requests'], options['threads']
+        )
+        self._report(f"WSGI  sync view, {options['threads']} threads", wsgi_latencies, wsgi_elapsed)
+
+    async def _run_asgi(self, path, auth, host, requests, concurrency):
+        application = get_asgi_application()
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies = []
+
+        async def one_request():
+            scope = {
+                'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1',
+                'method': 'GET', 'scheme': 'http', 'path': path, 'raw_path': path.encode(),
+                'query_string': b'', 'root_path': '',
+                'headers': [(b'host', host.encode()), (b'authorization', auth.encode())],
+                'client': ('127.0.0.1', 0), 'server': (host, 80),
+            }
+            messages = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+            status_code = None
+
+            async def receive():
+                if messages:
+                    return messages.pop()
+                await asyncio.Event().wait()  # no disconnect during the benchmark
+
+            async def send(message):
+                nonlocal status_code
+                if message['type'] == 'http.response.start':
+                    status_code = message['status']
+
+            async with semaphore:
+                started = time.perf_counter()
+                await application(scope, receive, send)
+                latencies.append(time.perf_counter() - started)
+            if status_code != 200:
+                raise CommandError(f'ASGI request to {path} returned {status_code}')
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one_request() for _ in range(requests)))
+        return latencies, time.perf_counter() - started
+
+    def _run_wsgi(self, path, auth, host, requests, threads):
+        application = get_wsgi_application()
+
+        def one_request(_):
+            environ = {
+                'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'QUERY_STRING': '', 'SCRIPT_NAME': '',
+                'SERVER_NAME': host, 'SERVER_PORT': '80', 'SERVER_PROTOCOL': 'HTTP/1.1',
+                'HTTP_HOST': host, 'HTTP_AUTHORIZATION': auth, 'REMOTE_ADDR': '127.0.0.1',
+                'wsgi.input': io.BytesIO(), 'wsgi.errors': io.StringIO(), 'wsgi.url_scheme': 'http',
+                'wsgi.version': (1, 0), 'wsgi.multithread': True, 'wsgi.multiprocess': False,
+                'wsgi.run_once': False,
+            }
+            statuses = []
+            started = time.perf_counter()
+            body = application(environ, lambda status, headers, exc_info=None: statuses.append(status))
+            b''.join(body)
+            latency = time.perf_counter() - started
+            if not statuses[0].startswith('200'):
+                raise CommandError(f'WSGI request to {path} returned {statuses[0]}')
+            return latency
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            latencies = list(pool.map(one_request, range(requests)))
+        return latencies, time.perf_counter() - started
+
+    def _report(self, label, latencies, elapsed):
+        latencies = sorted(latencies)
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        self.stdout.write(
+            f'{label:34} {len(latencies) / elapsed:9.1f} req/s  '
+            f'p50 {statistics.median(latencies) * 1000:7.2f} ms  p99 {p99 * 1000:7.2f} ms'
+        )
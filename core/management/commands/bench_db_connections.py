@@ -0,0 +1,88 @@
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.utils import load_backend
+
+POOLED_ENGINE = 'core.db.backends.mysql_pool'
+MYSQL_ENGINE = 'django.db.backends.mysql'
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare request throughput with per-request connections, persistent '
+        'connections and the connection pool'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default')
+        parser.add_argument('--requests', type=int, default=500,
+                            help='Simulated requests per thread')
+        parser.add_argument('--threads', type=int, default=4)
+
+    def handle(self, *args, **options):
+        alias = options['database']
+        base_settings = dict(connections.settings[alias])
+        engine = base_settings['ENGINE']
+        if engine == POOLED_ENGINE:
+            engine = MYSQL_ENGINE
+
+        scenarios = [
+            ('per-request (CONN_MAX_AGE=0)', {'ENGINE': engine, 'CONN_MAX_AGE': 0}),
+            ('persistent (CONN_MAX_AGE=600)', {'ENGINE': engine, 'CONN_MAX_AGE': 600}),
+        ]
+        if engine == MYSQL_ENGINE:
+            scenarios.append(('pooled', {'ENGINE': POOLED_ENGINE, 'CONN_MAX_AGE': 0}))
+        else:
+            self.stdout.write(self.style.WARNING(
+                f'Pooling is only available for MySQL; skipping the pooled run for {engine}.'
+            ))
+
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"{options['threads']} threads x {options['requests']} requests against '{alias}'"
+        ))
+        for label, overrides in scenarios:
+            settings_dict = {**base_settings, **overrides}
+            elapsed = self._run(alias, settings_dict, options['threads'], options['requests'])
+            total = options['threads'] * options['requests']
+            self.stdout.write(
+                f'{label:32} {total / elapsed:10.1f} req/s  ({elapsed * 1000 / total:.3f} ms/req)'
+            )
+
+        if engine == MYSQL_ENGINE:
+            from core.db.pool import pool_stats
+            for stats in pool_stats():
+                self.stdout.write(f'pool stats: {stats}')
+
+    def _run(self, alias, settings_dict, threads, requests):
+        backend = load_backend(settings_dict['ENGINE'])
+        errors = []
+
+        def worker():
+            wrapper = backend.DatabaseWrapper(settings_dict, alias)
+            try:
+                for _ in range(requests):
+                    # Mirrors django.db.close_old_connections() which runs on
+                    # request_started and request_finished.
+                    wrapper.close_if_unusable_or_obsolete()
+                    with wrapper.cursor() as cursor:
+                        cursor.execute('SELECT 1')
+                        cursor.fetchone()
+                    wrapper.close_if_unusable_or_obsolete()
+            except Exception as exc:  # surfaced after the run
+                errors.append(exc)
+            finally:
+                wrapper.close()
+
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        started = time.perf_counter()
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        if errors:
+            raise errors[0]
+        return elapsed
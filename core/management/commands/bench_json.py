@@ -0,0 +1,85 @@
+import datetime
+import time
+import uuid
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework.renderers import JSONRenderer
+
+from core.renderers import FastJSONRenderer
+
+
+def build_payload(count):
+    """
+    A list shaped like AssetItemSerializer output (dates already rendered to
+    strings by the serializer); every 100th item also carries raw dates,
+    Decimals, UUIDs and lazy strings to exercise the fallback encoder.
+    """
+    now = timezone.now()
+    today = datetime.date.today()
+    payload = []
+    for i in range(count):
+        item = {
+            'asset': i % 500,
+            'serial_number': f'ASSET-{i:08d}',
+            'purchase_date': today.isoformat(),
+            'warranty_expiry_date': (today + datetime.timedelta(days=i % 730)).isoformat(),
+            'description': 'Standard issue wheelchair, folding frame – ünïcode',
+            'price': 199.99 + i,
+            'status': 'AVAILABLE',
+            'asset_details': {
+                'id': i % 500, 'name': 'Wheelchair', 'description': None, 'quantity': 20,
+                'category': 3, 'category_name': 'Mobility aids', 'location': 7,
+                'location_name': 'Branch 7', 'price': 199.99, 'vendor': 2,
+                'vendor_name': 'Acme Medical', 'purchase_date': today.isoformat(), 'warranty_date': None,
+            },
+            'location': 7,
+            'asset_name': 'Wheelchair',
+            'location_name': 'Branch 7',
+            'vendor': 2,
+            'vendor_name': 'Acme Medical',
+            'created_at': '2025-05-28T16:13:00.123456Z',
+            'updated_at': '2025-05-28T16:13:00.123456Z',
+        }
+        if i % 100 == 0:
+            item.update({
+                'raw_date': today,
+                'raw_datetime': now,
+                'cost': Decimal('199.99'),
+                'reference': uuid.UUID(int=i),
+                'status_label': _('Available'),
+            })
+        payload.append(item)
+    return payload
+
+
+class Command(BaseCommand):
+    help = 'Compare encode throughput of DRF\'s JSONRenderer and FastJSONRenderer'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, default=50000)
+        parser.add_argument('--rounds', type=int, default=5)
+
+    def handle(self, *args, **options):
+        payload = build_payload(options['items'])
+        results = {}
+        for label, renderer in (('DRF JSONRenderer', JSONRenderer()), ('FastJSONRenderer', FastJSONRenderer())):
+            best = None
+            for _round in range(options['rounds']):
+                started = time.perf_counter()
+                body = renderer.render(payload)
+                elapsed = time.perf_counter() - started
+                best = elapsed if best is None else min(best, elapsed)
+            results[label] = body
+            self.stdout.write(
+                f'{label:18} {best * 1000:9.1f} ms  {len(body) / best / 1e6:8.1f} MB/s  '
+                f"{options['items'] / best:12.0f} items/s"
+            )
+
+        bodies = list(results.values())
+        if bodies[0] == bodies[1]:
+            self.stdout.write(self.style.SUCCESS('Outputs are byte-identical'))
+        else:
+            self.stdout.write(self.style.WARNING('Outputs differ'))
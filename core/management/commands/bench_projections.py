@@ -0,0 +1,98 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from asset.models import Asset
+from asset.projections import AssetProjection
+from asset.serializers import AssetSerializer
+from assetitem.models import AssetItem
+from assetitem.projections import AssetItemProjection
+from assetitem.serializers import AssetItemSerializer
+from category.models import Category
+from core.renderers import dumps
+from location.models import Location
+from transfer.listing import rebuild as rebuild_transfer_listings
+from transfer.models import Transfer, TransferListing
+from transfer.projections import TransferListingProjection, TransferProjection
+from transfer.serializers import TransferSerializer
+from users.models import User
+from vendor.models import Vendor
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed throw-away rows inside a rolled back transaction and compare the '
+        'per-row cost of ModelSerializer and values_list() projections'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self._seed(options['items'])
+                self._compare('Asset', Asset.objects.select_related('category', 'location', 'vendor'),
+                              AssetSerializer, AssetProjection)
+                self._compare('AssetItem', AssetItem.objects.select_related(
+                    'asset__category', 'asset__location', 'asset__vendor', 'location', 'vendor'),
+                    AssetItemSerializer, AssetItemProjection)
+                transfers = Transfer.objects.select_related(
+                    'asset_item__asset', 'from_location', 'to_location', 'requested_by', 'approved_by')
+                self._compare('Transfer', transfers, TransferSerializer, TransferProjection)
+                # bulk_create skips the signals that maintain the read model
+                rebuild_transfer_listings()
+                location = Location.objects.get(name='bench location 0')
+                self._compare('Listing', TransferListing.objects.filter(location=location), TransferSerializer,
+                              TransferListingProjection, reference=transfers.filter(from_location=location))
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _seed(self, count):
+        category = Category.objects.create(name='bench category')
+        vendor = Vendor.objects.create(name='bench vendor')
+        locations = [Location.objects.create(name=f'bench location {i}', type='branch') for i in range(2)]
+        user = User.objects.create(username='bench-projections', first_name='Bench', last_name='User')
+        assets = Asset.objects.bulk_create(
+            Asset(name=f'bench asset {i}', category=category, vendor=vendor if i % 2 else None,
+                  location=locations[0] if i % 3 else None, quantity=10, price=12.5)
+            for i in range(max(count // 10, 1))
+        )
+        items = AssetItem.objects.bulk_create(
+            AssetItem(asset=assets[i % len(assets)], serial_number=f'BENCH-{i}', price=12.5,
+                      location=locations[i % 2] if i % 5 else None, vendor=vendor if i % 2 else None,
+                      purchase_date=timezone.now().date(), updated_at=timezone.now())
+            for i in range(count)
+        )
+        Transfer.objects.bulk_create(
+            Transfer(asset_item=item, from_location=locations[0], to_location=locations[1],
+                     requested_by=user, approved_by=user if i % 2 else None,
+                     approval_date=timezone.now() if i % 2 else None)
+            for i, item in enumerate(items)
+        )
+
+    def _compare(self, label, queryset, serializer_class, projection_class, reference=None):
+        """``reference``: what the serializer reads, when not ``queryset`` itself."""
+        started = time.perf_counter()
+        serialized = serializer_class(list(queryset if reference is None else reference), many=True).data
+        serializer_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        projected = projection_class().project(queryset)
+        projection_time = time.perf_counter() - started
+
+        rows = len(projected) or 1
+        identical = dumps(serialized) == dumps(projected)
+        self.stdout.write(
+            f'{label:10} {rows:7} rows  serializer {serializer_time / rows * 1e6:8.1f} us/row  '
+            f'projection {projection_time / rows * 1e6:7.1f} us/row  '
+            f'x{serializer_time / max(projection_time, 1e-9):5.1f}  '
+            + (self.style.SUCCESS('identical') if identical else self.style.ERROR('DIFFERENT'))
+        )
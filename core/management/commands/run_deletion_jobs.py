@@ -0,0 +1,35 @@
+import datetime
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.deletion import run_job
+from core.models import DeletionJob
+
+
+class Command(BaseCommand):
+    help = (
+        'Run queued cascading deletes. Processes the queue and exits, or keeps '
+        'polling with --interval; several workers may run side by side.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=float, default=0,
+                            help='Seconds to wait between polls of an empty queue; 0 exits instead')
+
+    def handle(self, *args, **options):
+        stale_after = datetime.timedelta(seconds=settings.DELETION_JOB_STALE_SECONDS)
+        while True:
+            job = DeletionJob.claim(stale_after)
+            if job is None:
+                if not options['interval']:
+                    return
+                time.sleep(options['interval'])
+                continue
+            self.stdout.write(f'Deleting {job.model} {job.object_id} (job #{job.pk})')
+            if run_job(job):
+                job.refresh_from_db()
+                self.stdout.write(self.style.SUCCESS(f'Job #{job.pk}: deleted {sum(job.deleted.values())} rows'))
+            else:
+                self.stdout.write(self.style.ERROR(f'Job #{job.pk} failed, see its error'))
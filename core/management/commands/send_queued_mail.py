@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from core.mailer import send_pending
+
+
+class Command(BaseCommand):
+    help = 'Deliver queued notification mail in batches (run periodically, e.g. from cron)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None,
+                            help='Messages sent per connection (default: MAIL_BATCH_SIZE)')
+
+    def handle(self, *args, **options):
+        sent, failed = send_pending(options['batch_size'])
+        style = self.style.WARNING if failed else self.style.SUCCESS
+        self.stdout.write(style(f'Sent {sent} messages, {failed} failed'))
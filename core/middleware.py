@@ -0,0 +1,102 @@
+import hashlib
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.permissions import SAFE_METHODS
+
+from core.db.routers import replica_aliases, reset_replica_reads, set_replica_reads
+
+
+def _client_key(request):
+    """Identify the caller by its credentials without touching the database."""
+    credential = request.META.get('HTTP_AUTHORIZATION') or request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+    if not credential:
+        return None
+    return hashlib.sha256(credential.encode()).hexdigest()
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Lets safe requests read from replicas, except for clients that wrote
+    something within the last DB_REPLICA_PIN_SECONDS (read-your-writes) and
+    views marked with core.db.routers.primary_db.
+
+    Works natively in both WSGI and ASGI mode so async views don't pay for a
+    thread hop.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+            # Django adapts process_view by its own mode, so hand it a coroutine.
+            self.process_view = self._aprocess_view
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not replica_aliases():
+            return self.get_response(request)
+
+        client_key = _client_key(request)
+        is_write = request.method not in SAFE_METHODS
+        pinned = is_write or (client_key is not None and cache.get(self._pin_key(client_key)))
+
+        token = set_replica_reads(not pinned)
+        try:
+            response = self.get_response(request)
+        finally:
+            reset_replica_reads(token)
+
+        if is_write and client_key is not None and response.status_code < 400:
+            cache.set(self._pin_key(client_key), True, settings.DB_REPLICA_PIN_SECONDS)
+        return response
+
+    async def __acall__(self, request):
+        if not replica_aliases():
+            return await self.get_response(request)
+
+        client_key = _client_key(request)
+        is_write = request.method not in SAFE_METHODS
+        pinned = is_write or (client_key is not None and await cache.aget(self._pin_key(client_key)))
+
+        token = set_replica_reads(not pinned)
+        try:
+            response = await self.get_response(request)
+        finally:
+            reset_replica_reads(token)
+
+        if is_write and client_key is not None and response.status_code < 400:
+            await cache.aset(self._pin_key(client_key), True, settings.DB_REPLICA_PIN_SECONDS)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if self._forces_primary(request, view_func):
+            # Context is reset by __call__ once the response is produced.
+            set_replica_reads(False)
+
+    async def _aprocess_view(self, request, view_func, view_args, view_kwargs):
+        if self._forces_primary(request, view_func):
+            set_replica_reads(False)
+
+    @staticmethod
+    def _forces_primary(request, view_func):
+        if getattr(view_func, 'force_primary_db', False):
+            return True
+        view_class = getattr(view_func, 'cls', None) or getattr(view_func, 'view_class', None)
+        if view_class is None:
+            return False
+        if getattr(view_class, 'force_primary_db', False):
+            return True
+        # Viewset routes map HTTP methods to action names.
+        action = (getattr(view_func, 'actions', None) or {}).get(request.method.lower())
+        handler = getattr(view_class, action, None) if action else None
+        return getattr(handler, 'force_primary_db', False)
+
+    @staticmethod
+    def _pin_key(client_key):
+        return f'db-pin:{client_key}'
@@ -0,0 +1,142 @@
+from django.apps import apps
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+
+class Checkpoint(models.Model):
+    """
+    How far an incremental job (a log rollup, a projection rebuild) has got,
+    as the last processed id of its source table.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    position = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} @ {self.position}"
+
+    @classmethod
+    def get(cls, name):
+        return cls.objects.get_or_create(name=name)[0]
+
+
+class IdempotencyRecord(models.Model):
+    """
+    A client's Idempotency-Key and what its first request produced. While
+    ``response_status`` is empty the request is still running and the row
+    doubles as the lock against concurrent duplicates.
+    """
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='+')
+    key = models.CharField(max_length=255)
+    fingerprint = models.CharField(max_length=64)
+    response_status = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_body = models.TextField(null=True, blank=True)
+    locked_until = models.DateTimeField()
+    expires_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'key'], name='idempotency_user_key_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['expires_at'], name='idempotency_expires_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}:{self.key} ({self.response_status or 'in progress'})"
+
+
+class DeletionStatus(models.TextChoices):
+    PENDING = 'PENDING', 'Pending'
+    RUNNING = 'RUNNING', 'Running'
+    COMPLETED = 'COMPLETED', 'Completed'
+    FAILED = 'FAILED', 'Failed'
+
+
+ACTIVE_DELETION_STATUSES = (DeletionStatus.PENDING, DeletionStatus.RUNNING)
+
+
+class DeletionJob(models.Model):
+    """
+    A cascade too large to delete within a request, queued for
+    ``run_deletion_jobs``. ``planned`` holds the dry-run counts taken when it
+    was queued and ``deleted`` the rows removed so far, per model label.
+    """
+    model = models.CharField(max_length=100)
+    object_id = models.BigIntegerField()
+    status = models.CharField(max_length=20, choices=DeletionStatus.choices, default=DeletionStatus.PENDING)
+    planned = models.JSONField(default=dict)
+    deleted = models.JSONField(default=dict)
+    error = models.TextField(null=True, blank=True)
+    requested_by = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, blank=True,
+                                     on_delete=models.SET_NULL, related_name='+')
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'updated_at'], name='deletion_status_idx'),
+            models.Index(fields=['model', 'object_id'], name='deletion_target_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.model} {self.object_id} ({self.status})"
+
+    @classmethod
+    def enqueue(cls, model, object_id, planned, user=None):
+        """Queue a delete, or return the job already queued for the same row."""
+        label = model._meta.label
+        job = cls.objects.filter(model=label, object_id=object_id, status__in=ACTIVE_DELETION_STATUSES).first()
+        if job is None:
+            job = cls.objects.create(model=label, object_id=object_id, planned=planned,
+                                     requested_by=user if user and user.is_authenticated else None)
+        return job
+
+    @classmethod
+    def claim(cls, stale_after):
+        """
+        Take the oldest pending job, or a running one whose worker has not
+        reported progress within ``stale_after``; None when there is nothing to do.
+        """
+        now = timezone.now()
+        runnable = models.Q(status=DeletionStatus.PENDING) | models.Q(
+            status=DeletionStatus.RUNNING, updated_at__lt=now - stale_after,
+        )
+        for job in cls.objects.filter(runnable).order_by('pk')[:10]:
+            # Conditional update: only one worker wins the row
+            if cls.objects.filter(runnable, pk=job.pk).update(
+                    status=DeletionStatus.RUNNING, started_at=now, updated_at=now):
+                job.refresh_from_db()
+                return job
+        return None
+
+    def target_model(self):
+        return apps.get_model(self.model)
+
+
+class OutboundEmail(models.Model):
+    """
+    A message queued by ``core.mailer.queue`` and delivered in batches by
+    ``send_queued_mail``. ``key`` makes queueing idempotent: a job that is
+    re-run does not mail the same recipients twice.
+    """
+    key = models.CharField(max_length=255, unique=True, null=True, blank=True)
+    to = models.JSONField(default=list)
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['sent_at', 'attempts'], name='outbound_email_pending_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.to)}"
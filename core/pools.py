@@ -0,0 +1,80 @@
+"""
+Long-lived process pools for CPU-bound work the GIL would serialise.
+
+Pools are keyed by name, started on first use and kept for the life of the
+process. Workers are spawned fresh rather than forked from a threaded
+server, so the functions they run must live in modules that import without
+Django being set up. A pool whose worker died is discarded and the next
+job starts a new one.
+"""
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+_pools = {}  # name -> ProcessPoolExecutor
+_lock = threading.Lock()
+
+
+def pool_size(configured):
+    """``configured`` workers, or one per CPU when it is 0."""
+    return configured or os.cpu_count() or 1
+
+
+def process_pool(name, workers):
+    with _lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = _pools[name] = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+            )
+        return pool
+
+
+def _discard(name, pool):
+    with _lock:
+        if _pools.get(name) is pool:
+            del _pools[name]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def chunked(iterable, size):
+    chunk = []
+    for value in iterable:
+        chunk.append(value)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def ordered_map(name, workers, function, chunks, *args):
+    """
+    Yield ``function(chunk, *args)`` for each of ``chunks``, in order, on the
+    ``name`` pool with at most two chunks per worker in flight. A single
+    chunk is run in-process: starting the pool would cost more.
+    """
+    chunks = iter(chunks)
+    first = next(chunks, None)
+    if first is None:
+        return
+    second = next(chunks, None)
+    if second is None:
+        yield function(first, *args)
+        return
+
+    pool = process_pool(name, workers)
+    try:
+        pending = deque([pool.submit(function, first, *args), pool.submit(function, second, *args)])
+        for chunk in chunks:
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+            pending.append(pool.submit(function, chunk, *args))
+        while pending:
+            yield pending.popleft().result()
+    except BrokenProcessPool:
+        _discard(name, pool)
+        raise
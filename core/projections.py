@@ -0,0 +1,51 @@
+"""
+Read projections for hot list endpoints.
+
+A projection builds the exact dicts a ModelSerializer would produce, straight
+from ``values_list()`` tuples: no model instances, no related-object caches
+and no per-field ``to_representation`` dispatch. Subclasses list the columns
+they need (joined names included) and turn one row into one dict.
+
+Output must stay byte-identical to the serializer it replaces, including
+DRF's quirk of omitting a ``source='fk.name'`` key when the FK is null.
+"""
+from django.conf import settings
+from django.utils import timezone
+
+
+def date_repr(value):
+    """DRF DateField.to_representation with the default ISO-8601 format."""
+    return value.isoformat() if value else None
+
+
+class Projection:
+    columns = ()
+    # Columns that between them change whenever a row's output does; when set, list
+    # responses reuse cached fragments of unchanged rows (core.fragments)
+    version_columns = ()
+
+    def __init__(self):
+        # Matches DRF's DateTimeField.enforce_timezone() for aware values.
+        self.tz = timezone.get_current_timezone() if settings.USE_TZ else None
+
+    def datetime_repr(self, value):
+        """DRF DateTimeField.to_representation with the default ISO-8601 format."""
+        if not value:
+            return None
+        if self.tz is not None and timezone.is_aware(value):
+            value = value.astimezone(self.tz)
+        value = value.isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+
+    def build(self, row):
+        raise NotImplementedError
+
+    def project(self, queryset):
+        build = self.build
+        return [build(row) for row in queryset.values_list(*self.columns)]
+
+    async def aproject(self, queryset):
+        build = self.build
+        return [build(row) async for row in queryset.values_list(*self.columns)]
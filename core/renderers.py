@@ -0,0 +1,46 @@
+"""
+JSON rendering backed by orjson.
+
+Drop-in replacement for DRF's JSONRenderer: same media type, same compact
+output, and the same handling of dates, Decimals, UUIDs and lazy strings
+(delegated to DRF's JSONEncoder), but the encoding itself runs in native
+code. Falls back to the stdlib implementation when orjson isn't installed or
+when the client asks for indented output.
+"""
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
+_encoder = JSONEncoder()
+
+# Datetimes go through DRF's encoder so they keep its ISO-8601 format.
+ORJSON_OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+
+def _default(obj):
+    return _encoder.default(obj)
+
+
+def dumps(data):
+    """Encode ``data`` exactly as FastJSONRenderer would, returning bytes."""
+    ret = orjson.dumps(data, default=_default, option=ORJSON_OPTIONS)
+    # Keep the output a strict javascript subset, like DRF does.
+    if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+        ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+    return ret
+
+
+class FastJSONRenderer(JSONRenderer):
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or not self.compact or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
@@ -0,0 +1,11 @@
+from rest_framework import serializers
+
+from .models import DeletionJob
+
+
+class DeletionJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = DeletionJob
+        fields = ['id', 'model', 'object_id', 'status', 'planned', 'deleted', 'error',
+                  'created_at', 'started_at', 'finished_at']
+        read_only_fields = fields
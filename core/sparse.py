@@ -0,0 +1,170 @@
+"""
+Sparse fieldsets: ``?fields=``, ``?omit=`` and ``?expand=`` on read requests.
+
+``fields`` keeps only the listed fields, ``omit`` drops fields, and
+``expand`` adds back expensive nested fields (``Meta.expandable_fields``)
+that a ``fields`` list did not name. The pruned serializer is then used to
+narrow the SQL: only the columns its remaining fields read are loaded
+(``.only()``) and only the relations they traverse are joined
+(``select_related``).
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+
+from . import fragments
+
+SPARSE_PARAMS = ('fields', 'omit', 'expand')
+
+
+def _query_params(request):
+    # Plain Django requests (the async views) have no DRF query_params.
+    return getattr(request, 'query_params', None) or request.GET
+
+
+def _param_set(params, name):
+    value = params.get(name)
+    if value is None:
+        return None
+    return {part.strip() for part in value.split(',') if part.strip()}
+
+
+def sparse_requested(request):
+    return (
+        request is not None
+        and request.method in SAFE_METHODS
+        and any(name in _query_params(request) for name in SPARSE_PARAMS)
+    )
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    Prunes the serializer's fields from the request's query parameters.
+    Nested serializers are left alone; only the top-level serializer prunes.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if not sparse_requested(request):
+            return
+
+        params = _query_params(request)
+        requested = _param_set(params, 'fields')
+        omitted = _param_set(params, 'omit') or set()
+        expanded = _param_set(params, 'expand') or set()
+        expandable = set(getattr(self.Meta, 'expandable_fields', ()))
+
+        for name in list(self.fields):
+            keep = requested is None or name in requested or (name in expandable and name in expanded)
+            if not keep or name in omitted:
+                self.fields.pop(name)
+
+
+def _concrete_field_names(model):
+    return [field.name for field in model._meta.concrete_fields]
+
+
+def _resolve(model, path, select, only):
+    """
+    Walk a serializer source path (``location.name``, ``asset_item__asset``)
+    recording the joins and columns it needs. Returns False when the path
+    can't be expressed with select_related/only (reverse or m2m relations).
+    """
+    parts = path.replace('.', '__').split('__')
+    prefix = ''
+    for index, part in enumerate(parts):
+        is_last = index == len(parts) - 1
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            # A method or property (e.g. get_full_name) needs the whole row.
+            only.update(f'{prefix}{name}' for name in _concrete_field_names(model))
+            return True
+        if field.many_to_many or field.one_to_many or (field.is_relation and not field.concrete):
+            return False
+        only.add(f'{prefix}{field.name}')
+        if is_last:
+            return True
+        if not field.is_relation:
+            return False
+        select.add(f'{prefix}{field.name}')
+        prefix = f'{prefix}{field.name}__'
+        model = field.related_model
+    return True
+
+
+def _collect(serializer, model, prefix, select, only):
+    method_sources = getattr(getattr(serializer, 'Meta', None), 'sparse_sources', {})
+    only.add(f'{prefix}{model._meta.pk.name}')
+    for field in serializer.fields.values():
+        if isinstance(field, serializers.SerializerMethodField):
+            if field.field_name not in method_sources:
+                return False
+            sources = method_sources[field.field_name]
+        elif field.source == '*':
+            return False
+        elif isinstance(field, serializers.BaseSerializer):
+            try:
+                relation = model._meta.get_field(field.source)
+            except FieldDoesNotExist:
+                return False
+            if not (relation.many_to_one or relation.one_to_one) or not relation.concrete:
+                return False
+            select.add(f'{prefix}{relation.name}')
+            only.add(f'{prefix}{relation.name}')
+            if not _collect(field, relation.related_model, f'{prefix}{relation.name}__', select, only):
+                return False
+            continue
+        else:
+            sources = [field.source]
+
+        for source in sources:
+            nested_select, nested_only = set(), set()
+            if not _resolve(model, source, nested_select, nested_only):
+                return False
+            select.update(f'{prefix}{path}' for path in nested_select)
+            only.update(f'{prefix}{path}' for path in nested_only)
+    return True
+
+
+def narrow_queryset(queryset, serializer):
+    """Restrict ``queryset`` to the joins and columns ``serializer`` reads."""
+    select, only = set(), set()
+    if not _collect(serializer, queryset.model, '', select, only):
+        return queryset
+    queryset = queryset.select_related(None)
+    if select:
+        # select_related() without arguments would follow every relation.
+        queryset = queryset.select_related(*sorted(select))
+    return queryset.only(*sorted(only))
+
+
+class SparseFieldsetMixin:
+    """
+    ViewSet mixin: when a sparse fieldset is requested, querysets going
+    through filter_queryset() are narrowed to what the pruned serializer
+    needs. Use together with SparseFieldsetSerializerMixin on the serializer.
+    """
+
+    def sparse_fieldset_requested(self):
+        return sparse_requested(self.request)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.sparse_fieldset_requested():
+            queryset = narrow_queryset(queryset, self.get_serializer())
+        return queryset
+
+    def list_response(self, queryset, projection_class):
+        """
+        Respond with a filtered queryset: via its values_list() projection for
+        full rows (through the fragment cache when the projection declares
+        version columns), or via the pruned serializer for sparse fieldsets.
+        """
+        if self.sparse_fieldset_requested():
+            return Response(self.get_serializer(queryset, many=True).data)
+        if projection_class.version_columns:
+            return Response(fragments.project(queryset, projection_class()))
+        return Response(projection_class().project(queryset))
@@ -0,0 +1,180 @@
+from django.apps import apps
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+
+from asset.models import Asset
+from assetitem.models import AssetItem
+from category.models import Category
+from location.models import Location
+from transfer.models import Transfer
+from users.models import User
+
+from .deletion import DeletionPlan
+from .idempotency import HEADER, REPLAYED_HEADER, IdempotencyMixin, claim, fingerprint
+from .models import IdempotencyRecord
+from .throttling import BULK, WRITE, scope_for, take
+
+
+class CountingView(IdempotencyMixin, APIView):
+    calls = 0
+
+    def post(self, request):
+        type(self).calls += 1
+        if request.data.get('fail'):
+            return Response({'detail': 'boom'}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        return Response({'call': self.calls}, status=status.HTTP_201_CREATED)
+
+
+class IdempotencyTests(TestCase):
+    factory = APIRequestFactory()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='client', password='x')
+
+    def setUp(self):
+        CountingView.calls = 0
+
+    def request(self, data, key='key-1', format='json', user=None):
+        request = self.factory.post('/things/', data, format=format, headers={HEADER: key} if key else {})
+        force_authenticate(request, user or self.user)
+        return request
+
+    def post(self, data, **kwargs):
+        return CountingView.as_view()(self.request(data, **kwargs))
+
+    def test_retry_replays_stored_response(self):
+        first = self.post({'name': 'a'})
+        retry = self.post({'name': 'a'})
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual((retry.status_code, retry.data), (201, {'call': 1}))
+        self.assertEqual(retry[REPLAYED_HEADER], 'true')
+        self.assertEqual(CountingView.calls, 1)
+
+    def test_requests_without_key_are_not_stored(self):
+        self.post({'name': 'a'}, key=None)
+        self.post({'name': 'a'}, key=None)
+        self.assertEqual(CountingView.calls, 2)
+        self.assertFalse(IdempotencyRecord.objects.exists())
+
+    def test_keys_are_scoped_per_user(self):
+        other = User.objects.create_user(username='other', password='x')
+        self.post({'name': 'a'})
+        response = self.post({'name': 'a'}, user=other)
+        self.assertEqual(response.data, {'call': 2})
+
+    def test_retry_while_running_is_conflict(self):
+        claim(self.user, 'key-1', fingerprint(self.request({'name': 'a'})))
+        response = self.post({'name': 'a'})
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(CountingView.calls, 0)
+
+    def test_key_reused_for_different_body_is_rejected(self):
+        self.post({'name': 'a'})
+        response = self.post({'name': 'b'})
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(CountingView.calls, 1)
+
+    def test_server_errors_are_not_stored(self):
+        first = self.post({'fail': True})
+        retry = self.post({'fail': True})
+        self.assertEqual((first.status_code, retry.status_code), (503, 503))
+        self.assertNotIn(REPLAYED_HEADER, retry)
+        self.assertEqual(CountingView.calls, 2)
+        self.assertFalse(IdempotencyRecord.objects.exists())
+
+    def upload(self, content, **fields):
+        return {**fields, 'file': SimpleUploadedFile('photo.jpg', content, content_type='image/jpeg')}
+
+    def test_multipart_retry_replays(self):
+        self.post(self.upload(b'x' * 4096, name='a'), format='multipart')
+        retry = self.post(self.upload(b'x' * 4096, name='a'), format='multipart')
+        self.assertEqual(retry[REPLAYED_HEADER], 'true')
+        self.assertEqual(CountingView.calls, 1)
+
+    def test_multipart_fingerprint_covers_fields_and_file_content(self):
+        def fingerprint_of(data):
+            return fingerprint(self.request(data, format='multipart'))
+
+        base = fingerprint_of(self.upload(b'x' * 4096, name='a'))
+        self.assertEqual(base, fingerprint_of(self.upload(b'x' * 4096, name='a')))
+        self.assertNotEqual(base, fingerprint_of(self.upload(b'x' * 4096, name='b')))
+        self.assertNotEqual(base, fingerprint_of(self.upload(b'x' * 4095 + b'y', name='a')))
+
+    @override_settings(DATA_UPLOAD_MAX_MEMORY_SIZE=1024)
+    def test_multipart_fingerprint_does_not_read_raw_body(self):
+        response = self.post(self.upload(b'x' * 64 * 1024, name='a'), format='multipart')
+        self.assertEqual(response.status_code, 201)
+
+
+class DeletionPlanTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(username='admin', password='x')
+        cls.hq, branch = Location.objects.bulk_create([Location(name='HQ'), Location(name='Branch')])
+        cls.category, other = Category.objects.bulk_create([Category(name='Chairs'), Category(name='Aids')])
+        for category in (cls.category, other):
+            for n in range(3):
+                asset = Asset.objects.create(name=f'{category.name} {n}', category=category, location=cls.hq)
+                for serial in range(3):
+                    item = AssetItem.objects.create(asset=asset, location=branch, serial_number=f'{asset.pk}-{serial}')
+                    Transfer.objects.create(asset_item=item, from_location=branch, to_location=cls.hq,
+                                            requested_by=user)
+
+    def row_counts(self, labels):
+        return {label: apps.get_model(label)._base_manager.count() for label in labels}
+
+    def test_dry_run_counts_match_rows_deleted(self):
+        plan = DeletionPlan(Category.objects.filter(pk=self.category.pk))
+        counts = plan.counts()
+        before = self.row_counts(counts)
+        deleted = plan.execute(chunk_size=2)
+        after = self.row_counts(counts)
+        self.assertEqual(deleted, counts)
+        self.assertEqual({label: before[label] - after[label] for label in counts}, counts)
+        self.assertEqual(counts['assetitem.AssetItem'], 9)
+        self.assertEqual(Asset.objects.filter(category__name='Aids').count(), 3)
+
+    def test_set_null_children_are_kept(self):
+        plan = DeletionPlan(Location.objects.filter(pk=self.hq.pk))
+        counts = plan.counts()
+        self.assertEqual(plan.execute(chunk_size=4), counts)
+        self.assertEqual(counts['location.Location'], 1)
+        self.assertEqual(Asset.objects.filter(location__isnull=True).count(), 6)
+
+
+@override_settings(REST_FRAMEWORK={'DEFAULT_THROTTLE_RATES': {'bulk': '3/min', 'bulk.branch': '4/min'}})
+class ThrottleTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        branch = Location.objects.create(name='Branch')
+        cls.alice = User.objects.create_user(username='alice', password='x', branch=branch)
+        cls.bob = User.objects.create_user(username='bob', password='x', branch=branch)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_budget_is_spent_then_throttled(self):
+        waits = [take(BULK, self.alice, None) for _ in range(4)]
+        self.assertEqual(waits[:3], [0, 0, 0])
+        self.assertGreater(waits[3], 0)
+
+    def test_throttled_requests_do_not_spend_the_branch_budget(self):
+        for _ in range(5):
+            take(BULK, self.alice, None)
+        self.assertEqual(take(BULK, self.bob, None), 0)
+        self.assertGreater(take(BULK, self.bob, None), 0)  # branch bucket: 4 allowed in all
+
+    def test_list_create_is_bulk(self):
+        factory = APIRequestFactory()
+        view = type('View', (), {'action': 'create', 'throttle_scopes': {'bulk_create': BULK}})()
+        for data, scope in (([{'name': 'a'}], BULK), ({'name': 'a'}, WRITE)):
+            request = APIView().initialize_request(factory.post('/things/', data, format='json'))
+            self.assertEqual(scope_for(request, view), scope)
@@ -0,0 +1,185 @@
+"""
+Rate limiting, per user and per branch.
+
+Each scope's budget is set in REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'] in
+DRF's 'N/period' form. '<scope>' is the per-user budget (per client IP for
+anonymous requests) and '<scope>.branch' the budget shared by everyone in a
+branch.
+
+A bucket counts requests in fixed windows of one period and allows a
+request while the current window's count, plus the previous window's
+weighted by how much of it still overlaps the last period, is at most N
+(a sliding window): short bursts pass, the sustained rate is capped. The
+counts are taken with cache add() and incr(), which are atomic on shared
+caches such as Redis, so concurrent workers can't both spend the last
+request of a window. A request costs one incr() per bucket and one
+get_many() of the previous windows, and a throttled one gives its counts
+back with decr().
+
+Views pick a scope with ``throttle_scope`` or per action with
+``throttle_scopes``; otherwise safe methods use 'read' and the rest 'write'.
+A list POSTed to ``create`` is looked up as the 'bulk_create' action.
+"""
+import threading
+import time
+from collections import Counter
+
+from django.core.cache import cache
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+READ = 'read'
+WRITE = 'write'
+ANALYTICS = 'analytics'
+AUTH = 'auth'
+BULK = 'bulk'
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def parse_rate(rate):
+    """'60/min' -> (60 requests, per 60 seconds)."""
+    count, period = rate.split('/')
+    return int(count), PERIODS[period[0]]
+
+
+def _count(scope, outcome):
+    with _stats_lock:
+        _stats[scope, outcome] += 1
+
+
+def throttle_stats():
+    """Allowed and throttled request counts per scope, for this process."""
+    with _stats_lock:
+        stats = {}
+        for (scope, outcome), count in _stats.items():
+            stats.setdefault(scope, {'allowed': 0, 'throttled': 0})[outcome] = count
+        return stats
+
+
+def buckets_for(scope, user, ident):
+    """[(cache key, capacity, period in seconds)] that apply to a request."""
+    rates = api_settings.DEFAULT_THROTTLE_RATES
+    buckets = []
+    if rates.get(scope):
+        owner = f'user:{user.pk}' if user is not None and user.is_authenticated else f'ip:{ident}'
+        buckets.append((f'throttle:{scope}:{owner}', *parse_rate(rates[scope])))
+    branch_id = getattr(user, 'branch_id', None) if user is not None and user.is_authenticated else None
+    if branch_id and rates.get(f'{scope}.branch'):
+        buckets.append((f'throttle:{scope}:branch:{branch_id}', *parse_rate(rates[f'{scope}.branch'])))
+    return buckets
+
+
+def _windows(buckets, now):
+    """[(current window key, previous window key, capacity, period, elapsed share of the window)]"""
+    windows = []
+    for key, capacity, period in buckets:
+        index = int(now // period)
+        windows.append((f'{key}:{index}', f'{key}:{index - 1}', capacity, period, now / period - index))
+    return windows
+
+
+def _wait(windows, counts, previous):
+    """Seconds until every bucket has room for the request; 0 if it is allowed."""
+    wait = 0.0
+    for (_, previous_key, capacity, period, elapsed), count in zip(windows, counts):
+        carried = previous.get(previous_key, 0)
+        if carried * (1 - elapsed) + count <= capacity:
+            continue
+        if count > capacity or not carried:
+            wait = max(wait, (1 - elapsed) * period)
+        else:
+            # Until enough of the previous window has slid out
+            wait = max(wait, (carried * (1 - elapsed) + count - capacity) / carried * period)
+    return wait
+
+
+def _timeout(period):
+    # The window is read back as the previous one during the next period
+    return int(2 * period) + 1
+
+
+def _increment(key, period):
+    while True:
+        cache.add(key, 0, timeout=_timeout(period))
+        try:
+            return cache.incr(key)
+        except ValueError:  # expired in between, add it again
+            pass
+
+
+async def _aincrement(key, period):
+    while True:
+        await cache.aadd(key, 0, timeout=_timeout(period))
+        try:
+            return await cache.aincr(key)
+        except ValueError:  # expired in between, add it again
+            pass
+
+
+def _release(windows):
+    for key, _, _, _, _ in windows:
+        try:
+            cache.decr(key)
+        except ValueError:  # expired, nothing to give back
+            pass
+
+
+async def _arelease(windows):
+    for key, _, _, _, _ in windows:
+        try:
+            await cache.adecr(key)
+        except ValueError:  # expired, nothing to give back
+            pass
+
+
+def take(scope, user, ident):
+    """Count the request; returns seconds to wait, 0 if allowed."""
+    buckets = buckets_for(scope, user, ident)
+    if not buckets:
+        return 0.0
+    windows = _windows(buckets, time.time())
+    counts = [_increment(key, period) for key, _, _, period, _ in windows]
+    wait = _wait(windows, counts, cache.get_many([previous_key for _, previous_key, _, _, _ in windows]))
+    if wait:
+        _release(windows)
+    _count(scope, 'throttled' if wait else 'allowed')
+    return wait
+
+
+async def atake(scope, user, ident):
+    """Async take() for AsyncAPIView."""
+    buckets = buckets_for(scope, user, ident)
+    if not buckets:
+        return 0.0
+    windows = _windows(buckets, time.time())
+    counts = [await _aincrement(key, period) for key, _, _, period, _ in windows]
+    wait = _wait(windows, counts, await cache.aget_many([previous_key for _, previous_key, _, _, _ in windows]))
+    if wait:
+        await _arelease(windows)
+    _count(scope, 'throttled' if wait else 'allowed')
+    return wait
+
+
+def scope_for(request, view):
+    action = getattr(view, 'action', None)
+    if action == 'create' and isinstance(request.data, list):
+        action = 'bulk_create'
+    scope = getattr(view, 'throttle_scopes', {}).get(action) or getattr(view, 'throttle_scope', None)
+    if scope:
+        return scope
+    return READ if request.method in SAFE_METHODS else WRITE
+
+
+class TokenBucketThrottle(BaseThrottle):
+
+    def allow_request(self, request, view):
+        self._wait = take(scope_for(request, view), request.user, self.get_ident(request))
+        return not self._wait
+
+    def wait(self):
+        return self._wait
@@ -0,0 +1,28 @@
+"""
+Where a row was before the save in progress.
+
+Apps that scope work by branch (the sync feed, the dashboard cache) also owe
+it to the branch a moved row left. track_location() connects one pre_save
+receiver per model, however many apps ask for it, which leaves the stored
+``location_id`` on the instance as ``_previous_location_id``.
+"""
+from django.db.models.signals import pre_save
+
+
+def track_location(*models):
+    """Keep ``_previous_location_id`` on saved instances of ``models``."""
+    for model in models:
+        pre_save.connect(remember_location, sender=model, dispatch_uid=f'previous-location-{model._meta.label}')
+
+
+def remember_location(sender, instance, update_fields=None, **kwargs):
+    if instance._state.adding:
+        previous = None
+    elif update_fields is not None and not {'location', 'location_id'} & set(update_fields):
+        previous = instance.location_id
+    else:
+        # Models keeping what they were loaded with (AssetItem) spare the query
+        previous = getattr(instance, '_saved_state', (None, None))[1]
+        if previous is None:
+            previous = sender._base_manager.filter(pk=instance.pk).values_list('location', flat=True).first()
+    instance._previous_location_id = previous
@@ -0,0 +1,10 @@
+from django.urls import path
+
+from .views import DeletionJobView, MetricsView
+
+app_name = 'system'
+
+urlpatterns = [
+    path('metrics/', MetricsView.as_view(), name='metrics'),
+    path('deletions/<int:pk>/', DeletionJobView.as_view(), name='deletion-job'),
+]
@@ -0,0 +1,33 @@
+from django.shortcuts import get_object_or_404
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.db.pool import pool_stats
+from core.models import DeletionJob
+from core.serializers import DeletionJobSerializer
+from core.throttling import throttle_stats
+from users.views import IsSuperAdmin
+
+
+class MetricsView(APIView):
+    """
+    Runtime metrics for this worker process - Only accessible by Super Admins
+    """
+    permission_classes = [IsSuperAdmin]
+
+    def get(self, request):
+        return Response({
+            'db_pools': pool_stats(),
+            'throttles': throttle_stats(),
+        })
+
+
+class DeletionJobView(APIView):
+    """
+    Progress of a queued cascading delete - Only accessible by Super Admins
+    """
+    permission_classes = [IsSuperAdmin]
+
+    def get(self, request, pk):
+        job = get_object_or_404(DeletionJob, pk=pk)
+        return Response(DeletionJobSerializer(job).data)
@@ -0,0 +1,36 @@
+"""
+Per-scope cache for dashboard summaries.
+
+A scope is a branch id, or 'all' for the unscoped (super admin) view. Each
+scope has a version number in the cache; bumping it orphans every cached
+summary of that scope, which then expires on its own TTL. Builds go through
+core.coalesce, so a crowd opening the dashboard at once computes it once.
+"""
+from django.conf import settings
+from django.core.cache import cache
+
+from core import coalesce
+
+ALL = 'all'
+
+
+def _version_key(scope):
+    return f'dashboard:version:{scope}'
+
+
+def _summary_key(scope, variant):
+    version = cache.get_or_set(_version_key(scope), 1, timeout=None)
+    return f'dashboard:{scope}:v{version}:{variant}'
+
+
+def get_or_build(scope, variant, build):
+    return coalesce.fetch(_summary_key(scope, variant), build, fresh=settings.DASHBOARD_CACHE_SECONDS)[0]
+
+
+def invalidate(location_ids):
+    """Invalidate the given branches' summaries and the unscoped one."""
+    for scope in {ALL, *filter(None, location_ids)}:
+        try:
+            cache.incr(_version_key(scope))
+        except ValueError:  # never cached, nothing to invalidate
+            pass
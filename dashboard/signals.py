@@ -0,0 +1,64 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from asset.models import Asset
+from assetitem.models import AssetItem
+from core.bulk import post_bulk_create
+from core.deletion import pre_bulk_delete
+from core.tracking import track_location
+from location.models import Location
+from transfer.models import Transfer
+
+from .cache import invalidate
+
+
+def _locations(instance):
+    if isinstance(instance, Transfer):
+        return [instance.from_location_id, instance.to_location_id]
+    if isinstance(instance, Location):
+        return [instance.pk]
+    return [instance.location_id, getattr(instance, '_previous_location_id', None)]
+
+
+# A moved row also changes the summary of the branch it left
+track_location(Asset, AssetItem)
+
+
+@receiver(post_save, sender=Asset)
+@receiver(post_save, sender=AssetItem)
+@receiver(post_save, sender=Location)
+@receiver(post_save, sender=Transfer)
+@receiver(post_delete, sender=Asset)
+@receiver(post_delete, sender=AssetItem)
+@receiver(post_delete, sender=Location)
+@receiver(post_delete, sender=Transfer)
+def invalidate_dashboard(sender, instance, **kwargs):
+    location_ids = _locations(instance)
+    transaction.on_commit(lambda: invalidate(location_ids))
+
+
+@receiver(post_bulk_create, sender=AssetItem)
+def invalidate_dashboard_on_bulk_create(sender, instances, **kwargs):
+    location_ids = {instance.location_id for instance in instances}
+    transaction.on_commit(lambda: invalidate(location_ids))
+
+
+# Columns naming the branches a bulk-deleted row counted towards
+BULK_DELETE_LOCATIONS = {
+    Asset: ('location',),
+    AssetItem: ('location',),
+    Location: ('pk',),
+    Transfer: ('from_location', 'to_location'),
+}
+
+
+@receiver(pre_bulk_delete, sender=Asset)
+@receiver(pre_bulk_delete, sender=AssetItem)
+@receiver(pre_bulk_delete, sender=Location)
+@receiver(pre_bulk_delete, sender=Transfer)
+def invalidate_dashboard_on_bulk_delete(sender, queryset, **kwargs):
+    location_ids = set()
+    for row in queryset.values_list(*BULK_DELETE_LOCATIONS[sender]).distinct():
+        location_ids.update(row)
+    transaction.on_commit(lambda: invalidate(location_ids))
@@ -0,0 +1,115 @@
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+from rest_framework import permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from asset.models import Asset
+from core.throttling import ANALYTICS
+from assetitem.models import AssetItem, Status
+from transfer.models import Transfer, TransferStatus
+from transfer.projections import TransferProjection
+
+from . import cache
+
+DEFAULT_RECENT = 10
+MAX_RECENT = 50
+OPEN_TRANSFER_STATUSES = [TransferStatus.PENDING, TransferStatus.IN_TRANSIT]
+
+
+def _status_counts(choices):
+    return {value: 0 for value in choices.values}
+
+
+def build_summary(branch, recent):
+    """
+    Dashboard numbers for one branch (or everything when ``branch`` is None),
+    from four queries: assets, items grouped by location and status,
+    transfer counts, and the latest transfers.
+    """
+    assets = Asset.objects.all()
+    items = AssetItem.objects.all()
+    transfers = Transfer.objects.all()
+    if branch is not None:
+        assets = assets.filter(location=branch)
+        items = items.filter(location=branch)
+        transfers = transfers.filter(Q(from_location=branch) | Q(to_location=branch))
+
+    by_status = _status_counts(Status)
+    inventory_value = 0.0
+    locations = {}
+    grouped = items.values_list('location', 'location__name', 'status').annotate(
+        total=Count('id'), value=Sum('price'),
+    ).order_by()
+    for location_id, location_name, status, total, value in grouped:
+        by_status[status] = by_status.get(status, 0) + total
+        inventory_value += value or 0
+        location = locations.setdefault(location_id, {
+            'location': location_id,
+            'location_name': location_name,
+            'total': 0,
+            'by_status': _status_counts(Status),
+        })
+        location['total'] += total
+        location['by_status'][status] = location['by_status'].get(status, 0) + total
+
+    # Without a branch every open transfer is both incoming and outgoing
+    incoming = outgoing = Q(status__in=OPEN_TRANSFER_STATUSES)
+    if branch is not None:
+        incoming &= Q(to_location=branch)
+        outgoing &= Q(from_location=branch)
+    transfer_counts = transfers.aggregate(
+        total=Count('id'),
+        pending_incoming=Count('id', filter=incoming),
+        pending_outgoing=Count('id', filter=outgoing),
+        **{status.lower(): Count('id', filter=Q(status=status)) for status in TransferStatus.values},
+    )
+    recent_transfers = TransferProjection().project(
+        transfers.select_related(None).order_by('-request_date', '-id')[:recent]
+    )
+
+    return {
+        'generated_at': timezone.now().isoformat(),
+        'assets': {
+            'total': assets.count(),
+        },
+        'items': {
+            'total': sum(by_status.values()),
+            'by_status': by_status,
+            'inventory_value': round(inventory_value, 2),
+        },
+        'locations': sorted(locations.values(), key=lambda location: location['location_name'] or ''),
+        'transfers': {
+            'total': transfer_counts['total'],
+            'pending_incoming': transfer_counts['pending_incoming'],
+            'pending_outgoing': transfer_counts['pending_outgoing'],
+            'by_status': {status: transfer_counts[status.lower()] for status in TransferStatus.values},
+        },
+        'recent_transfers': recent_transfers,
+    }
+
+
+class DashboardView(APIView):
+    """
+    Everything the dashboard shows in one response, cached per branch for
+    DASHBOARD_CACHE_SECONDS and invalidated when assets, items, locations or
+    transfers change. Branch admins only see their branch, as in
+    AssetViewSet.get_queryset; super admins see everything.
+
+    ?recent=  number of latest transfers to include, default 10, at most 50
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    throttle_scope = ANALYTICS
+
+    def get(self, request):
+        try:
+            recent = min(max(int(request.query_params.get('recent', DEFAULT_RECENT)), 0), MAX_RECENT)
+        except ValueError:
+            raise ValidationError({'recent': ['A valid integer is required.']})
+
+        user = request.user
+        branch = user.branch if user.is_branch_admin and user.branch else None
+        scope = branch.pk if branch is not None else cache.ALL
+        summary = cache.get_or_build(scope, f'recent={recent}', lambda: build_summary(branch, recent))
+        return Response(summary)
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class ImagesConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'images'
+
+    def ready(self):
+        # Fingerprint uploads and queue their variants
+        from . import signals  # noqa: F401
@@ -0,0 +1,13 @@
+from rest_framework import serializers
+
+from .variants import variant_urls
+
+
+class ImageVariantsField(serializers.ReadOnlyField):
+    """
+    {variant name: URL} of an image from its digest column, e.g.
+    ``ImageVariantsField(source='image_digest')``; None without an image.
+    """
+
+    def to_representation(self, value):
+        return variant_urls(value)
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+
+from images.processing import digest_file, register, submit
+from images.signals import IMAGE_FIELDS
+from images.variants import VARIANTS
+
+
+class Command(BaseCommand):
+    help = 'Fingerprint existing asset and profile images and render any missing variants'
+
+    def handle(self, *args, **options):
+        digests = set()
+        for model, (image_field, digest_field) in IMAGE_FIELDS.items():
+            rows = model._base_manager.exclude(**{image_field: ''}).exclude(**{f'{image_field}__isnull': True})
+            for instance in rows.only('pk', image_field, digest_field).iterator():
+                file = getattr(instance, image_field)
+                digest = getattr(instance, digest_field)
+                if not digest:
+                    try:
+                        file.open('rb')
+                    except FileNotFoundError:
+                        self.stdout.write(self.style.WARNING(f'{model._meta.label} {instance.pk}: {file.name} is missing'))
+                        continue
+                    try:
+                        digest = digest_file(file)
+                    finally:
+                        file.close()
+                    model._base_manager.filter(pk=instance.pk).update(**{digest_field: digest})
+                register(digest, file.name)
+                digests.add(digest)
+
+        futures = [submit(digest, name) for digest in digests for name in VARIANTS]
+        failed = 0
+        for future in futures:
+            try:
+                future.result()
+            except Exception as exc:
+                failed += 1
+                self.stdout.write(self.style.ERROR(str(exc)))
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(digests)} images, {len(futures) - failed} variants ready, {failed} failed'
+        ))
@@ -0,0 +1,17 @@
+from django.db import models
+
+
+class StoredImage(models.Model):
+    """
+    An uploaded image by content: its SHA-256 ``digest`` and the storage
+    name of (one copy of) the file. Variants are derived from the digest, so
+    the same picture uploaded twice is resized once.
+    """
+    digest = models.CharField(max_length=64, unique=True)
+    name = models.CharField(max_length=255)
+    width = models.PositiveIntegerField(null=True, blank=True)
+    height = models.PositiveIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.digest[:12]} ({self.name})"
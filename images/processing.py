@@ -0,0 +1,125 @@
+"""
+Fingerprinting uploads and rendering their variants.
+
+Resizing runs on a thread pool of IMAGE_WORKERS threads (Pillow releases
+the GIL while decoding, resampling and encoding). Uploads queue all their
+variants once the saving transaction commits; a variant requested before
+it exists is rendered on the same pool and the request waits for it.
+Concurrent requests for one variant share a single render.
+"""
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import close_old_connections
+from PIL import Image, ImageOps
+
+from .models import StoredImage
+from .variants import VARIANTS, relative_path
+
+logger = logging.getLogger(__name__)
+
+HASH_CHUNK = 1024 * 1024
+
+_pool = None
+_inflight = {}  # (digest, variant name) -> Future
+_lock = threading.Lock()
+
+
+def digest_file(file):
+    """SHA-256 of a file's content, read in chunks; leaves it rewound."""
+    sha = hashlib.sha256()
+    file.seek(0)
+    for chunk in iter(lambda: file.read(HASH_CHUNK), b''):
+        sha.update(chunk)
+    file.seek(0)
+    return sha.hexdigest()
+
+
+def register(digest, name):
+    """Record which stored file holds ``digest``; the first copy wins."""
+    return StoredImage.objects.get_or_create(digest=digest, defaults={'name': name})[0]
+
+
+def variant_file(digest, variant):
+    return os.path.join(settings.MEDIA_ROOT, *relative_path(digest, variant).split('/'))
+
+
+def render(digest, variant_name):
+    """Write one variant if it is not on disk yet; returns its path."""
+    variant = VARIANTS[variant_name]
+    path = variant_file(digest, variant)
+    if os.path.exists(path):
+        return path
+    stored = StoredImage.objects.get(digest=digest)
+    with default_storage.open(stored.name, 'rb') as source, Image.open(source) as image:
+        if stored.width is None:
+            StoredImage.objects.filter(pk=stored.pk).update(width=image.width, height=image.height)
+        # JPEGs can decode at a fraction of full size when that still covers the box
+        image.draft('RGB', (variant.width * 2, variant.height * 2))
+        image = ImageOps.exif_transpose(image)
+        image = image.convert('RGBA' if image.mode in ('RGBA', 'LA', 'P') else 'RGB')
+        box = (variant.width, variant.height)
+        if variant.crop:
+            image = ImageOps.fit(image, box, Image.LANCZOS)
+        else:
+            image.thumbnail(box, Image.LANCZOS)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Written aside and renamed into place: readers never see half a file
+        fd, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                image.save(out, 'WEBP', quality=settings.IMAGE_QUALITY, method=4)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+    return path
+
+
+def _render_pooled(digest, variant_name):
+    # Pool threads outlive any request; give their connections the same
+    # CONN_MAX_AGE / health handling a request cycle would.
+    close_old_connections()
+    try:
+        return render(digest, variant_name)
+    finally:
+        close_old_connections()
+
+
+def _executor():
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(max_workers=settings.IMAGE_WORKERS, thread_name_prefix='image-variants')
+    return _pool
+
+
+def submit(digest, variant_name):
+    """Future for the variant's path, shared with any render already running."""
+    key = (digest, variant_name)
+    with _lock:
+        future = _inflight.get(key)
+        if future is None:
+            future = _inflight[key] = _executor().submit(_render_pooled, digest, variant_name)
+            future.add_done_callback(lambda done: _forget(key, done))
+        return future
+
+
+def _forget(key, future):
+    with _lock:
+        if _inflight.get(key) is future:
+            del _inflight[key]
+    if future.exception() is not None:
+        logger.warning('Rendering image variant %s/%s failed: %s', *key, future.exception())
+
+
+def schedule(digest):
+    """Queue every variant of ``digest`` without waiting for them."""
+    for name in VARIANTS:
+        submit(digest, name)
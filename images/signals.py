@@ -0,0 +1,54 @@
+"""
+Keeps the ``*_digest`` column of every model in IMAGE_FIELDS in step with
+its image field, registers new uploads and queues their variants.
+"""
+from django.db import transaction
+from django.db.models.signals import post_save, pre_save
+
+from asset.models import Asset
+from users.models import User
+
+from .processing import digest_file, register, schedule
+
+# model -> (image field, digest field)
+IMAGE_FIELDS = {
+    Asset: ('image', 'image_digest'),
+    User: ('profile_image', 'profile_image_digest'),
+}
+
+
+def fingerprint(sender, instance, update_fields=None, **kwargs):
+    image_field, digest_field = IMAGE_FIELDS[sender]
+    if update_fields is not None and image_field not in update_fields:
+        return
+    file = getattr(instance, image_field)
+    if not file:
+        setattr(instance, digest_field, '')
+    elif not file._committed:
+        # A new upload, hashed before FileField.pre_save stores it
+        setattr(instance, digest_field, digest_file(file))
+        instance._image_uploaded = True
+    elif not getattr(instance, digest_field):
+        file.open('rb')
+        try:
+            setattr(instance, digest_field, digest_file(file))
+        finally:
+            file.close()
+        instance._image_uploaded = True
+
+
+def queue_variants(sender, instance, update_fields=None, **kwargs):
+    if not getattr(instance, '_image_uploaded', False):
+        return
+    del instance._image_uploaded
+    image_field, digest_field = IMAGE_FIELDS[sender]
+    digest = getattr(instance, digest_field)
+    if update_fields is not None and digest_field not in update_fields:
+        sender._base_manager.filter(pk=instance.pk).update(**{digest_field: digest})
+    register(digest, getattr(instance, image_field).name)
+    transaction.on_commit(lambda: schedule(digest))
+
+
+for model in IMAGE_FIELDS:
+    pre_save.connect(fingerprint, sender=model, dispatch_uid=f'images_fingerprint_{model._meta.label}')
+    post_save.connect(queue_variants, sender=model, dispatch_uid=f'images_queue_{model._meta.label}')
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from .views import variant
+
+app_name = 'images'
+
+urlpatterns = [
+    path('<str:shard>/<str:digest>/<str:filename>', variant, name='variant'),
+]
@@ -0,0 +1,41 @@
+"""
+The image variants served for uploads, and where they live.
+
+Variant files are content-addressed: MEDIA_ROOT/variants/<d[:2]>/<digest>/<name>_<w>x<h>.webp.
+The dimensions are part of the file name, so changing a size yields new
+URLs instead of stale cached images, and a file once written never changes
+(it is served as immutable). URLs are root-relative so list projections
+can build them without a request.
+"""
+from collections import namedtuple
+
+from django.conf import settings
+
+# ``crop``: fill the box exactly (centre crop) instead of fitting inside it
+Variant = namedtuple('Variant', 'name width height crop')
+
+VARIANTS = {
+    variant.name: variant for variant in (
+        Variant('thumb', 160, 160, True),
+        Variant('web', 1024, 1024, False),
+    )
+}
+VARIANT_DIR = 'variants'
+
+
+def filename(variant):
+    return f'{variant.name}_{variant.width}x{variant.height}.webp'
+
+
+BY_FILENAME = {filename(variant): variant for variant in VARIANTS.values()}
+
+
+def relative_path(digest, variant):
+    return f'{VARIANT_DIR}/{digest[:2]}/{digest}/{filename(variant)}'
+
+
+def variant_urls(digest):
+    """{variant name: URL} for an image digest, or None without an image."""
+    if not digest:
+        return None
+    return {name: f'{settings.MEDIA_URL}{relative_path(digest, variant)}' for name, variant in VARIANTS.items()}
@@ -0,0 +1,39 @@
+import re
+from concurrent.futures import TimeoutError
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse
+from django.views.decorators.http import require_safe
+
+from .models import StoredImage
+from .processing import submit
+from .variants import BY_FILENAME
+
+DIGEST = re.compile(r'^[0-9a-f]{64}$')
+
+
+@require_safe
+def variant(request, shard, digest, filename):
+    """
+    Serve an image variant, rendering it first if it is not on disk yet.
+
+    In production the web server serves MEDIA_ROOT/variants directly and
+    only falls back to this view for files that do not exist yet.
+    """
+    spec = BY_FILENAME.get(filename)
+    if spec is None or not DIGEST.match(digest) or shard != digest[:2]:
+        raise Http404
+    if not StoredImage.objects.filter(digest=digest).exists():
+        raise Http404
+    try:
+        path = submit(digest, spec.name).result(timeout=settings.IMAGE_RENDER_TIMEOUT)
+    except TimeoutError:
+        response = HttpResponse('Image is still being processed.', status=503, content_type='text/plain')
+        response['Retry-After'] = '1'
+        return response
+    except (FileNotFoundError, OSError):
+        raise Http404
+    response = FileResponse(open(path, 'rb'), content_type='image/webp')
+    # Content-addressed: the bytes behind this URL never change
+    response['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
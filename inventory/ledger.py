@@ -0,0 +1,137 @@
+"""
+Posting to and reading from the inventory ledger.
+
+post() writes both legs of each movement as StockEntry rows and moves the
+affected StockBalance rows, under a lock on the assets' rows so that
+concurrent postings for one asset serialise and running balances stay in
+order. Reads never scan the entries: current stock is the balance rows of
+(asset, location), stock at a past time the latest entry of each bucket up
+to then.
+"""
+from collections import namedtuple
+
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+
+from asset.models import Asset
+
+from .models import MovementKind, StockBalance, StockEntry
+
+# The bucket received items come from and deleted or retired items go to
+OUTSIDE = (None, None)
+ENTRY_BATCH_SIZE = 1000
+
+# ``source``/``target`` are (location_id, status) buckets of ``asset_id``, or OUTSIDE
+Move = namedtuple('Move', 'asset_id source target quantity asset_item_id', defaults=(1, None))
+
+
+def post(kind, moves, using=None):
+    """Post ``moves`` as ``kind`` movements; returns the number of entries written."""
+    moves = [move for move in moves if move.source != move.target and move.quantity]
+    if not moves:
+        return 0
+    now = timezone.now()
+    with transaction.atomic(using=using):
+        asset_ids = sorted({move.asset_id for move in moves})
+        # Locked in id order, so two postings can't deadlock on each other
+        list(Asset._base_manager.using(using).select_for_update().filter(pk__in=asset_ids)
+             .order_by('pk').values_list('pk', flat=True))
+        balances = {
+            (asset_id, location_id, status): quantity
+            for asset_id, location_id, status, quantity in StockBalance.objects.using(using)
+            .filter(asset_id__in=asset_ids).values_list('asset_id', 'location_id', 'status', 'quantity')
+        }
+        existing = set(balances)
+
+        entries, touched = [], set()
+        for move in moves:
+            for bucket, counter, quantity in ((move.source, move.target, -move.quantity),
+                                              (move.target, move.source, move.quantity)):
+                key = (move.asset_id, *bucket)
+                balances[key] = balances.get(key, 0) + quantity
+                touched.add(key)
+                entries.append(StockEntry(
+                    asset_id=move.asset_id, location_id=bucket[0], status=bucket[1],
+                    quantity=quantity, balance=balances[key], kind=kind,
+                    counter_location_id=counter[0], counter_status=counter[1],
+                    asset_item_id=move.asset_item_id, occurred_at=now,
+                ))
+
+        StockEntry.objects.using(using).bulk_create(entries, batch_size=ENTRY_BATCH_SIZE)
+        StockBalance.objects.using(using).bulk_create(
+            StockBalance(asset_id=asset_id, location_id=location_id, status=status,
+                         quantity=balances[asset_id, location_id, status])
+            for asset_id, location_id, status in touched - existing
+        )
+        for asset_id, location_id, status in touched & existing:
+            StockBalance.objects.using(using).filter(
+                asset_id=asset_id, location_id=location_id, status=status,
+            ).update(quantity=balances[asset_id, location_id, status], updated_at=now)
+    return len(entries)
+
+
+def post_item_change(before, after, asset_item_id=None, kind=None, using=None):
+    """
+    Post one item moving from ``before`` to ``after``, each an (asset_id,
+    location_id, status) triple or None when the item is not in stock.
+    ``kind`` defaults to what changed.
+    """
+    if before == after:
+        return 0
+    if kind is None:
+        if before is None:
+            kind = MovementKind.RECEIVE
+        elif after is None:
+            kind = MovementKind.DELETE
+        elif before[0] != after[0]:
+            kind = MovementKind.REASSIGN
+        elif before[1] != after[1]:
+            kind = MovementKind.TRANSFER
+        else:
+            kind = MovementKind.STATUS
+
+    if before is not None and after is not None and before[0] != after[0]:
+        moves = [Move(before[0], before[1:], OUTSIDE, 1, asset_item_id),
+                 Move(after[0], OUTSIDE, after[1:], 1, asset_item_id)]
+    elif before is None:
+        moves = [Move(after[0], OUTSIDE, after[1:], 1, asset_item_id)]
+    else:
+        moves = [Move(before[0], before[1:], after[1:] if after else OUTSIDE, 1, asset_item_id)]
+    return post(kind, moves, using=using)
+
+
+def current_stock(asset_id, location_id=None, by_location=False):
+    """
+    {status: quantity} of ``asset_id`` at ``location_id`` (None: items with no
+    location), or with ``by_location`` {location_id: {status: quantity}}
+    over all locations. One read of the balance table.
+    """
+    balances = StockBalance.objects.filter(asset_id=asset_id, status__isnull=False)
+    if not by_location:
+        return dict(balances.filter(location_id=location_id).values_list('status', 'quantity'))
+    stock = {}
+    for location_id, status, quantity in balances.values_list('location_id', 'status', 'quantity'):
+        stock.setdefault(location_id, {})[status] = quantity
+    return stock
+
+
+def stock_at(asset_id, location_id, at):
+    """
+    {status: quantity} of ``asset_id`` at ``location_id`` as of ``at``: one
+    index seek per status the bucket has ever held.
+    """
+    latest = StockEntry.objects.filter(
+        asset_id=asset_id, location_id=location_id, status=OuterRef('status'), occurred_at__lte=at,
+    ).order_by('-occurred_at', '-id').values('balance')[:1]
+    rows = StockBalance.objects.filter(
+        asset_id=asset_id, location_id=location_id, status__isnull=False,
+    ).annotate(balance_at=Subquery(latest)).values_list('status', 'balance_at')
+    return {status: balance or 0 for status, balance in rows}
+
+
+def purge(asset_ids, using=None):
+    """Drop the ledger of deleted assets."""
+    asset_ids = list(asset_ids)
+    StockEntry.objects.using(using).filter(asset_id__in=asset_ids).delete()
+    StockBalance.objects.using(using).filter(asset_id__in=asset_ids).delete()
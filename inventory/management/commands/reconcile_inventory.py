@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from inventory.reconcile import reconcile
+
+
+class Command(BaseCommand):
+    help = 'Compare the inventory ledger with asset item counts and repair any drift (run periodically, e.g. from cron)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Report drift without repairing it')
+
+    def handle(self, *args, **options):
+        drift = reconcile(repair=not options['dry_run'])
+        for (asset_id, location_id, status), recorded, counted in drift:
+            self.stdout.write(f'asset {asset_id} location {location_id} {status}: ledger {recorded}, items {counted}')
+        verb = 'Found' if options['dry_run'] else 'Repaired'
+        style = self.style.WARNING if drift else self.style.SUCCESS
+        self.stdout.write(style(f'{verb} {len(drift)} drifted balances'))
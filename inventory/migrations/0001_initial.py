@@ -0,0 +1,51 @@
+# Generated by Django 5.2.1 on 2026-10-19 19:32
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('asset', '0003_updated_at_auto_now'),
+        ('location', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StockBalance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(blank=True, max_length=50, null=True)),
+                ('quantity', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('asset', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='asset.asset')),
+                ('location', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='location.location')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('asset', 'location', 'status'), name='stock_balance_bucket_uniq')],
+            },
+        ),
+        migrations.CreateModel(
+            name='StockEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(blank=True, max_length=50, null=True)),
+                ('quantity', models.IntegerField()),
+                ('balance', models.IntegerField()),
+                ('kind', models.CharField(choices=[('OPENING', 'Opening balance'), ('RECEIVE', 'Received'), ('TRANSFER', 'Transfer'), ('STATUS', 'Status change'), ('REASSIGN', 'Moved to another asset'), ('RETIRE', 'Retired'), ('RESTORE', 'Restored'), ('DELETE', 'Deleted'), ('RECONCILE', 'Reconciliation')], max_length=10)),
+                ('counter_status', models.CharField(blank=True, max_length=50, null=True)),
+                ('asset_item_id', models.BigIntegerField(blank=True, null=True)),
+                ('occurred_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('asset', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='asset.asset')),
+                ('counter_location', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='location.location')),
+                ('location', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='location.location')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['asset', 'location', 'status', 'occurred_at'], name='stock_entry_bucket_time_idx'), models.Index(fields=['asset_item_id'], name='stock_entry_item_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+from django.db import migrations
+from django.db.models import Count
+from django.utils import timezone
+
+
+def open_balances(apps, schema_editor):
+    """One OPENING movement per (asset, location, status) of the items in service."""
+    AssetItem = apps.get_model('assetitem', 'AssetItem')
+    StockBalance = apps.get_model('inventory', 'StockBalance')
+    StockEntry = apps.get_model('inventory', 'StockEntry')
+    now = timezone.now()
+    rows = AssetItem.objects.filter(retired_at__isnull=True).values_list(
+        'asset_id', 'location_id', 'status').annotate(count=Count('id')).order_by()
+    entries, balances, outside = [], [], {}
+    for asset_id, location_id, status, count in rows:
+        outside[asset_id] = outside.get(asset_id, 0) - count
+        entries.append(StockEntry(asset_id=asset_id, location_id=location_id, status=status, quantity=count,
+                                  balance=count, kind='OPENING', occurred_at=now))
+        balances.append(StockBalance(asset_id=asset_id, location_id=location_id, status=status, quantity=count))
+    for asset_id, quantity in outside.items():
+        entries.append(StockEntry(asset_id=asset_id, quantity=quantity, balance=quantity, kind='OPENING',
+                                  occurred_at=now))
+        balances.append(StockBalance(asset_id=asset_id, quantity=quantity))
+    StockEntry.objects.bulk_create(entries, batch_size=1000)
+    StockBalance.objects.bulk_create(balances, batch_size=1000)
+
+
+def clear(apps, schema_editor):
+    apps.get_model('inventory', 'StockEntry').objects.all().delete()
+    apps.get_model('inventory', 'StockBalance').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0001_initial'),
+        ('assetitem', '0007_archived_event_transfer'),
+    ]
+
+    operations = [
+        migrations.RunPython(open_balances, clear),
+    ]
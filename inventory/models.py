@@ -0,0 +1,72 @@
+from django.db import models
+from django.utils import timezone
+
+from asset.models import Asset
+from location.models import Location
+
+
+class MovementKind(models.TextChoices):
+    OPENING = 'OPENING', 'Opening balance'
+    RECEIVE = 'RECEIVE', 'Received'
+    TRANSFER = 'TRANSFER', 'Transfer'
+    STATUS = 'STATUS', 'Status change'
+    REASSIGN = 'REASSIGN', 'Moved to another asset'
+    RETIRE = 'RETIRE', 'Retired'
+    RESTORE = 'RESTORE', 'Restored'
+    DELETE = 'DELETE', 'Deleted'
+    RECONCILE = 'RECONCILE', 'Reconciliation'
+
+
+# Ledger rows outlive the locations they mention, and are purged with their
+# asset by inventory.signals; neither relation is a database constraint.
+LEDGER_FK = dict(on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+
+
+class StockEntry(models.Model):
+    """
+    One leg of a double-entry inventory movement. Every movement writes two
+    entries that cancel out: ``-quantity`` on the bucket items left and
+    ``+quantity`` on the one they entered. A bucket is (asset, location,
+    status); the bucket with no status is the outside world, where received
+    items come from and deleted or retired ones go. ``balance`` is the
+    bucket's running balance after this entry, so the stock of a bucket at
+    any time is its latest entry up to then.
+    """
+    asset = models.ForeignKey(Asset, **LEDGER_FK)
+    location = models.ForeignKey(Location, null=True, blank=True, **LEDGER_FK)
+    status = models.CharField(max_length=50, null=True, blank=True)
+    quantity = models.IntegerField()
+    balance = models.IntegerField()
+    kind = models.CharField(max_length=10, choices=MovementKind.choices)
+    # The other leg's bucket
+    counter_location = models.ForeignKey(Location, null=True, blank=True, **LEDGER_FK)
+    counter_status = models.CharField(max_length=50, null=True, blank=True)
+    asset_item_id = models.BigIntegerField(null=True, blank=True)
+    occurred_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['asset', 'location', 'status', 'occurred_at'], name='stock_entry_bucket_time_idx'),
+            models.Index(fields=['asset_item_id'], name='stock_entry_item_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.asset_id}@{self.location_id}/{self.status}: {self.quantity:+} = {self.balance}"
+
+
+class StockBalance(models.Model):
+    """Current balance of one (asset, location, status) bucket, kept by inventory.ledger.post()."""
+    asset = models.ForeignKey(Asset, **LEDGER_FK)
+    location = models.ForeignKey(Location, null=True, blank=True, **LEDGER_FK)
+    status = models.CharField(max_length=50, null=True, blank=True)
+    quantity = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            # NULL location/status buckets are kept unique by post() locking the asset row
+            models.UniqueConstraint(fields=['asset', 'location', 'status'], name='stock_balance_bucket_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.asset_id}@{self.location_id}/{self.status}: {self.quantity}"
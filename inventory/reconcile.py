@@ -0,0 +1,67 @@
+"""
+Checking the ledger against the asset item table.
+
+The ledger is only as good as the code paths that post to it; raw SQL,
+loaddata or a bug can make balances drift from the items they count.
+reconcile() compares every (asset, location, status) balance with a COUNT
+of live, unretired items and, unless told otherwise, posts a RECONCILE
+movement (to or from OUTSIDE) for each difference. Each batch of assets is
+locked while it is compared, so postings can't slip in between the count
+and the repair.
+"""
+from django.db import transaction
+from django.db.models import Count
+
+from asset.models import Asset
+from assetitem.models import AssetItem
+
+from .ledger import OUTSIDE, Move, post, purge
+from .models import MovementKind, StockBalance
+
+BATCH_SIZE = 500
+
+
+def _reconcile_assets(asset_ids, repair):
+    with transaction.atomic():
+        list(Asset.objects.select_for_update().filter(pk__in=asset_ids).order_by('pk').values_list('pk', flat=True))
+        actual = {
+            (asset_id, location_id, status): count
+            for asset_id, location_id, status, count in AssetItem.objects.filter(asset_id__in=asset_ids)
+            .values_list('asset_id', 'location_id', 'status').annotate(count=Count('id')).order_by()
+        }
+        ledger = dict(
+            ((asset_id, location_id, status), quantity)
+            for asset_id, location_id, status, quantity in StockBalance.objects.filter(
+                asset_id__in=asset_ids, status__isnull=False,
+            ).values_list('asset_id', 'location_id', 'status', 'quantity')
+        )
+        drift = [
+            (key, ledger.get(key, 0), actual.get(key, 0))
+            for key in sorted(actual.keys() | ledger.keys(), key=str)
+            if ledger.get(key, 0) != actual.get(key, 0)
+        ]
+        if repair and drift:
+            post(MovementKind.RECONCILE, [
+                Move(asset_id, OUTSIDE, (location_id, status), counted - recorded)
+                for (asset_id, location_id, status), recorded, counted in drift
+            ])
+    return drift
+
+
+def reconcile(repair=True, batch_size=BATCH_SIZE):
+    """
+    Returns the drift found as ((asset_id, location_id, status), ledger
+    quantity, counted quantity) tuples, repaired unless ``repair`` is False.
+    """
+    drift, last_pk = [], 0
+    assets = Asset.objects.order_by('pk').values_list('pk', flat=True)
+    while asset_ids := list(assets.filter(pk__gt=last_pk)[:batch_size]):
+        drift.extend(_reconcile_assets(asset_ids, repair))
+        last_pk = asset_ids[-1]
+
+    # Ledgers left behind by assets deleted without going through the ORM
+    orphaned = set(StockBalance.objects.values_list('asset_id', flat=True).distinct()) - set(
+        Asset.objects.values_list('pk', flat=True))
+    if repair and orphaned:
+        purge(orphaned)
+    return drift
@@ -0,0 +1,38 @@
+from django.db.models import Count
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from asset.models import Asset
+from assetitem.models import AssetItem
+from core.deletion import pre_bulk_delete
+
+from .ledger import OUTSIDE, Move, post, post_item_change, purge
+from .models import MovementKind
+
+
+@receiver(post_delete, sender=AssetItem)
+def post_item_delete(sender, instance, using=None, **kwargs):
+    if instance.retired_at is None:  # retired items already left the stock
+        post_item_change((instance.asset_id, instance.location_id, instance.status), None,
+                         asset_item_id=instance.pk, using=using)
+
+
+@receiver(pre_bulk_delete, sender=AssetItem)
+def post_item_bulk_delete(sender, queryset, using=None, **kwargs):
+    # One aggregated movement per bucket rather than one per item
+    rows = queryset.filter(retired_at__isnull=True).values_list(
+        'asset_id', 'location_id', 'status').annotate(count=Count('id')).order_by()
+    post(MovementKind.DELETE, [
+        Move(asset_id, (location_id, status), OUTSIDE, count)
+        for asset_id, location_id, status, count in rows
+    ], using=using)
+
+
+@receiver(post_delete, sender=Asset)
+def purge_asset(sender, instance, using=None, **kwargs):
+    purge([instance.pk], using=using)
+
+
+@receiver(pre_bulk_delete, sender=Asset)
+def purge_assets(sender, queryset, using=None, **kwargs):
+    purge(queryset.values_list('pk', flat=True), using=using)
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from .views import StockView
+
+app_name = 'inventory'
+
+urlpatterns = [
+    path('stock/', StockView.as_view(), name='stock'),
+]
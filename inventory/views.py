@@ -0,0 +1,66 @@
+from django.utils.dateparse import parse_datetime
+from rest_framework import permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from asset.models import Asset
+
+from .ledger import current_stock, stock_at
+
+
+def _int_param(params, name):
+    try:
+        return int(params[name]) if params.get(name) else None
+    except ValueError:
+        raise ValidationError({name: ['A valid integer is required.']})
+
+
+class StockView(APIView):
+    """
+    Stock of one asset from the inventory ledger, by status.
+
+    ?asset=     asset id (required)
+    ?location=  location id; without it every location is listed
+    ?at=        ISO 8601 datetime for the stock at that moment instead of now
+
+    Branch admins only see their branch.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        params = request.query_params
+        asset_id = _int_param(params, 'asset')
+        if asset_id is None:
+            raise ValidationError({'asset': ['This parameter is required.']})
+        if not Asset.objects.filter(pk=asset_id).exists():
+            raise ValidationError({'asset': [f'Asset {asset_id} does not exist.']})
+        location_id = _int_param(params, 'location')
+        at = None
+        if params.get('at'):
+            at = parse_datetime(params['at'])
+            if at is None:
+                raise ValidationError({'at': ['Enter a valid ISO 8601 datetime.']})
+
+        user = request.user
+        if user.is_branch_admin and user.branch:
+            location_id = user.branch.pk
+
+        if location_id is not None:
+            locations = [location_id]
+        else:
+            locations = list(current_stock(asset_id, by_location=True))
+
+        result = []
+        for location in locations:
+            by_status = stock_at(asset_id, location, at) if at else current_stock(asset_id, location)
+            by_status = {status: quantity for status, quantity in by_status.items() if quantity}
+            # Buckets emptied since stay in the ledger; list the location only if asked for
+            if by_status or location_id is not None:
+                result.append({'location': location, 'total': sum(by_status.values()), 'by_status': by_status})
+        return Response({
+            'asset': asset_id,
+            'at': at.isoformat() if at else None,
+            'total': sum(row['total'] for row in result),
+            'locations': result,
+        })
@@ -0,0 +1,70 @@
+"""
+A minimal streaming PDF writer: one full-page greyscale image per page.
+
+Pages are written out as they arrive, keeping only the byte offsets the
+cross-reference table needs, so a document of any length streams in
+constant memory.
+"""
+MM_PER_INCH = 25.4
+POINTS_PER_INCH = 72
+
+
+class PdfStream:
+    """Feed pages to ``page()`` and the returned bytes to the client, then ``close()``."""
+
+    def __init__(self, page_size_mm):
+        self.width_pt, self.height_pt = (round(size / MM_PER_INCH * POINTS_PER_INCH, 2) for size in page_size_mm)
+        self.offsets = []  # byte offset of each object, object n at index n - 1
+        self.position = 0
+        self.pages = []
+        # Objects 1 and 2 (catalog, page tree) are written last; reserve their numbers
+        self.offsets.extend([None, None])
+
+    def _emit(self, chunks):
+        data = b''.join(chunks)
+        self.position += len(data)
+        return data
+
+    def _object(self, number, body, stream=None):
+        self.offsets[number - 1] = self.position
+        chunks = [f'{number} 0 obj\n'.encode(), body]
+        if stream is not None:
+            chunks += [b'\nstream\n', stream, b'\nendstream']
+        chunks.append(b'\nendobj\n')
+        return self._emit(chunks)
+
+    def _reserve(self):
+        self.offsets.append(None)
+        return len(self.offsets)
+
+    def header(self):
+        return self._emit([b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n'])
+
+    def page(self, width_px, height_px, pixels):
+        """A page showing one zlib-compressed 8-bit greyscale image, scaled to the page."""
+        image, content, page = self._reserve(), self._reserve(), self._reserve()
+        self.pages.append(page)
+        drawing = f'q {self.width_pt} 0 0 {self.height_pt} 0 0 cm /Im0 Do Q'.encode()
+        return b''.join([
+            self._object(image, (
+                f'<< /Type /XObject /Subtype /Image /Width {width_px} /Height {height_px} '
+                f'/ColorSpace /DeviceGray /BitsPerComponent 8 /Filter /FlateDecode /Length {len(pixels)} >>'
+            ).encode(), pixels),
+            self._object(content, f'<< /Length {len(drawing)} >>'.encode(), drawing),
+            self._object(page, (
+                f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {self.width_pt} {self.height_pt}] '
+                f'/Resources << /XObject << /Im0 {image} 0 R >> >> /Contents {content} 0 R >>'
+            ).encode()),
+        ])
+
+    def close(self):
+        kids = ' '.join(f'{page} 0 R' for page in self.pages)
+        chunks = [
+            self._object(1, b'<< /Type /Catalog /Pages 2 0 R >>'),
+            self._object(2, f'<< /Type /Pages /Kids [{kids}] /Count {len(self.pages)} >>'.encode()),
+        ]
+        xref = self.position
+        table = [f'xref\n0 {len(self.offsets) + 1}\n0000000000 65535 f \n'.encode()]
+        table += [f'{offset:010d} 00000 n \n'.encode() for offset in self.offsets]
+        table.append(f'trailer\n<< /Size {len(self.offsets) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode())
+        return b''.join(chunks) + self._emit(table)
@@ -0,0 +1,77 @@
+"""
+The label rendering pipeline.
+
+Labels are cut into LABEL_CHUNK_SIZE chunks and rendered on a process pool
+(core.pools) of LABEL_WORKERS processes, the CPU count by default, so
+throughput grows with cores instead of being held to one by the GIL.
+Results are consumed in order with a bounded number of chunks in flight,
+so the ZIP or PDF streams out as chunks finish and memory stays flat
+however many labels are asked for. The workers only import
+``labels.render``, which caches fonts and the logo per worker.
+"""
+import zipfile
+
+from django.conf import settings
+
+from core.pools import chunked, ordered_map, pool_size
+
+from .pdf import PdfStream
+from .render import A4_MM, LabelSpec, render_pngs, render_sheets, sheet_grid
+
+
+def label_spec():
+    return LabelSpec(settings.LABEL_WIDTH_MM, settings.LABEL_HEIGHT_MM, settings.LABEL_DPI,
+                     settings.LABEL_FONT, settings.LABEL_LOGO)
+
+
+def workers():
+    return pool_size(settings.LABEL_WORKERS)
+
+
+def render_chunks(function, labels, spec, chunk_size):
+    """Yield ``function(chunk, spec)`` for each chunk of ``labels``, in order."""
+    return ordered_map('labels', workers(), function, chunked(labels, chunk_size), spec)
+
+
+class _Sink:
+    """Write-only file for zipfile that hands out what was written since the last drain."""
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, data):
+        self.parts.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data, self.parts = b''.join(self.parts), []
+        return data
+
+
+def stream_zip(labels, spec=None, chunk_size=None):
+    """Yield a ZIP archive of one PNG per label, piece by piece."""
+    spec = spec or label_spec()
+    sink = _Sink()
+    # PNGs are compressed already; storing them saves the CPU for rendering
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for files in render_chunks(render_pngs, labels, spec, chunk_size or settings.LABEL_CHUNK_SIZE):
+            for name, data in files:
+                archive.writestr(name, data)
+            yield sink.drain()
+    yield sink.drain()
+
+
+def stream_pdf(labels, spec=None, chunk_size=None):
+    """Yield a PDF of A4 sheets with the labels laid out multi-up, page by page."""
+    spec = spec or label_spec()
+    columns, rows = sheet_grid(spec)
+    # Whole sheets per chunk, so no sheet is split between workers
+    per_chunk = max((chunk_size or settings.LABEL_CHUNK_SIZE) // (columns * rows), 1) * columns * rows
+    document = PdfStream(A4_MM)
+    yield document.header()
+    for sheets in render_chunks(render_sheets, labels, spec, per_chunk):
+        yield b''.join(document.page(*sheet) for sheet in sheets)
+    yield document.close()
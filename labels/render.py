@@ -0,0 +1,129 @@
+"""
+Label and sheet rendering with Pillow.
+
+This module runs in the label worker processes, so it does not touch
+Django: everything it needs comes in a LabelSpec. Fonts and the logo are
+loaded once per process and cached, not once per label.
+"""
+import functools
+import io
+import zlib
+from collections import namedtuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+from .barcode import QUIET_ZONE, modules
+
+MM_PER_INCH = 25.4
+A4_MM = (210, 297)
+SHEET_MARGIN_MM = 8
+
+# Sizes in millimetres; ``font``/``logo`` are file paths or ''
+LabelSpec = namedtuple('LabelSpec', 'width_mm height_mm dpi font logo')
+# One label: ``title`` above the barcode, ``code`` encoded and printed below it
+Label = namedtuple('Label', 'name code title')
+
+
+def _px(mm, dpi):
+    return int(round(mm / MM_PER_INCH * dpi))
+
+
+@functools.lru_cache(maxsize=16)
+def font(path, size):
+    if path:
+        return ImageFont.truetype(path, size)
+    return ImageFont.load_default(size)
+
+
+@functools.lru_cache(maxsize=4)
+def logo(path, height):
+    if not path:
+        return None
+    with Image.open(path) as image:
+        image = image.convert('L')
+        width = max(int(image.width * height / image.height), 1)
+        return image.resize((width, height), Image.LANCZOS)
+
+
+def _fit_text(draw, text, spec, size, max_width):
+    """The text shortened with an ellipsis until it fits ``max_width``."""
+    face = font(spec.font, size)
+    if draw.textlength(text, font=face) <= max_width:
+        return text, face
+    while text and draw.textlength(text + '…', font=face) > max_width:
+        text = text[:-1]
+    return text + '…', face
+
+
+def render_label(label, spec):
+    """One label as a greyscale image of the spec's size."""
+    width, height = _px(spec.width_mm, spec.dpi), _px(spec.height_mm, spec.dpi)
+    image = Image.new('L', (width, height), 255)
+    draw = ImageDraw.Draw(image)
+    pad = max(height // 20, 2)
+    text_size = max(height // 9, 8)
+
+    # Header: logo and title
+    header = text_size + pad
+    left = pad
+    mark = logo(spec.logo, text_size + pad // 2)
+    if mark is not None:
+        image.paste(mark, (pad, pad // 2))
+        left += mark.width + pad
+    if label.title:
+        title, face = _fit_text(draw, label.title, spec, text_size, width - left - pad)
+        draw.text((left, pad // 2), title, font=face, fill=0)
+
+    # Barcode: the widest whole module that fits, centred
+    footer = text_size + pad
+    bars = modules(label.code)
+    module = max((width - 2 * pad) // (sum(bars) + 2 * QUIET_ZONE), 1)
+    x = (width - module * sum(bars)) // 2
+    top, bottom = header + pad, height - footer - pad
+    for index, bar in enumerate(bars):
+        if index % 2 == 0:
+            draw.rectangle((x, top, x + bar * module - 1, bottom), fill=0)
+        x += bar * module
+
+    code, face = _fit_text(draw, label.code, spec, text_size, width - 2 * pad)
+    draw.text((width // 2, height - pad), code, font=face, fill=0, anchor='md')
+    return image
+
+
+def render_pngs(labels, spec):
+    """[(file name, PNG bytes)] for ``labels``."""
+    files = []
+    for label in labels:
+        buffer = io.BytesIO()
+        render_label(label, spec).save(buffer, 'PNG', dpi=(spec.dpi, spec.dpi), optimize=False)
+        files.append((f'{label.name}.png', buffer.getvalue()))
+    return files
+
+
+def sheet_grid(spec):
+    """(columns, rows) of labels that fit an A4 sheet."""
+    usable_width, usable_height = (size - 2 * SHEET_MARGIN_MM for size in A4_MM)
+    return max(int(usable_width // spec.width_mm), 1), max(int(usable_height // spec.height_mm), 1)
+
+
+def render_sheets(labels, spec):
+    """
+    A4 sheets of ``labels`` laid out multi-up, each as (width px, height px,
+    zlib-compressed greyscale pixels) ready for the PDF writer.
+    """
+    columns, rows = sheet_grid(spec)
+    per_sheet = columns * rows
+    page_width, page_height = (_px(size, spec.dpi) for size in A4_MM)
+    label_width, label_height = _px(spec.width_mm, spec.dpi), _px(spec.height_mm, spec.dpi)
+    # Centre the grid on the page
+    left = (page_width - columns * label_width) // 2
+    top = (page_height - rows * label_height) // 2
+
+    sheets = []
+    for start in range(0, len(labels), per_sheet):
+        page = Image.new('L', (page_width, page_height), 255)
+        for index, label in enumerate(labels[start:start + per_sheet]):
+            row, column = divmod(index, columns)
+            page.paste(render_label(label, spec), (left + column * label_width, top + row * label_height))
+        sheets.append((page_width, page_height, zlib.compress(page.tobytes(), 6)))
+    return sheets
@@ -0,0 +1,53 @@
+import re
+
+from rest_framework.exceptions import ValidationError
+
+from assetitem.models import AssetItem
+
+from .render import Label
+
+_UNSAFE = re.compile(r'[^A-Za-z0-9._-]+')
+
+
+def _ids(raw, name):
+    try:
+        return [int(part) for part in raw.split(',') if part]
+    except ValueError:
+        raise ValidationError({name: ['Enter a comma-separated list of ids.']})
+
+
+def select_items(params, user=None):
+    """
+    The asset items to label, from exactly one of:
+
+    ?asset=                       every item of the asset, e.g. one receive_asset batch
+    ?serial_from= & ?serial_to=   an inclusive serial number range
+    ?ids=                         a comma-separated list of item ids
+
+    Branch admins only get their branch's items.
+    """
+    given = [name for name in ('asset', 'serial_from', 'ids') if params.get(name)]
+    if len(given) != 1:
+        raise ValidationError({'detail': ['Choose the items with one of asset, serial_from/serial_to or ids.']})
+
+    items = AssetItem.objects.all()
+    if user is not None and user.is_branch_admin and user.branch:
+        items = items.filter(location=user.branch)
+    if params.get('asset'):
+        items = items.filter(asset_id__in=_ids(params['asset'], 'asset'))
+    elif params.get('ids'):
+        items = items.filter(pk__in=_ids(params['ids'], 'ids'))
+    else:
+        if not params.get('serial_to'):
+            raise ValidationError({'serial_to': ['Required with serial_from.']})
+        items = items.filter(serial_number__gte=params['serial_from'], serial_number__lte=params['serial_to'])
+    return items.order_by('serial_number', 'pk')
+
+
+def labels_for(items):
+    """Label tuples for ``items``; only the three columns printed are read."""
+    labels = []
+    for pk, serial_number, asset_name in items.values_list('pk', 'serial_number', 'asset__name'):
+        code = serial_number or f'ITEM-{pk}'
+        labels.append(Label(f'{pk}_{_UNSAFE.sub("_", code)}', code, asset_name))
+    return labels
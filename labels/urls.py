@@ -0,0 +1,9 @@
+from django.urls import path
+
+from .views import LabelsView
+
+app_name = 'labels'
+
+urlpatterns = [
+    path('', LabelsView.as_view(), name='labels'),
+]
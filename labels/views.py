@@ -0,0 +1,42 @@
+from django.http import StreamingHttpResponse
+from rest_framework import permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.views import APIView
+
+from core.throttling import ANALYTICS
+from .pipeline import stream_pdf, stream_zip
+from .selection import labels_for, select_items
+
+FORMATS = {
+    'zip': (stream_zip, 'application/zip'),
+    'pdf': (stream_pdf, 'application/pdf'),
+}
+
+
+class LabelsView(APIView):
+    """
+    Barcode labels for asset items, rendered across a process pool and
+    streamed as they are produced.
+
+    ?output=zip   one PNG label per item (default)
+    ?output=pdf   A4 sheets with the labels laid out multi-up
+
+    Items are chosen with ?asset=, ?serial_from=&serial_to= or ?ids=
+    (see labels.selection).
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    throttle_scope = ANALYTICS
+
+    def get(self, request):
+        output = request.query_params.get('output', 'zip')
+        if output not in FORMATS:
+            raise ValidationError({'output': [f'Choose from: {", ".join(FORMATS)}.']})
+        labels = labels_for(select_items(request.query_params, request.user))
+        if not labels:
+            raise ValidationError({'detail': ['No asset items match.']})
+
+        stream, content_type = FORMATS[output]
+        response = StreamingHttpResponse(stream(labels), content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="labels.{output}"'
+        response['X-Label-Count'] = str(len(labels))
+        return response
@@ -1,13 +1,16 @@
 from django.shortcuts import render
+from core.deletion import BulkDeleteMixin
+from core.throttling import BULK
 from .models import Location
 from rest_framework import viewsets, permissions
 from .serializers import LocationSerializer
 from users.views import IsSuperAdmin
 # Create your views here.
 
-class LocationViewSet(viewsets.ModelViewSet):
+class LocationViewSet(BulkDeleteMixin, viewsets.ModelViewSet):
     queryset = Location.objects.all()
     serializer_class = LocationSerializer
+    throttle_scopes = {'destroy': BULK}
     
     def get_permissions(self):
         """
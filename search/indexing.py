@@ -0,0 +1,148 @@
+"""
+Builds and maintains SearchDocument rows.
+
+Each indexed model has a source queryset (with the joins its document needs)
+and a builder turning one instance into an unsaved SearchDocument. Documents
+are replaced wholesale on every change: delete, then bulk insert the new rows
+and their serial variants.
+"""
+import re
+
+from django.db import transaction
+
+from asset.models import Asset
+from assetitem.models import AssetItem
+from location.models import Location
+from vendor.models import Vendor
+
+from .models import DocumentKind, SearchDocument, SerialVariant
+
+# Shorter serials would match too much with one edit allowed
+MIN_FUZZY_SERIAL_LENGTH = 4
+BATCH_SIZE = 1000
+
+
+def normalise_serial(value):
+    """Upper-case alphanumerics only, so 'ab-12 3' and 'AB123' index the same."""
+    key = re.sub(r'[^0-9A-Z]', '', (value or '').upper())[:50]
+    return key or None
+
+
+def serial_variants(key):
+    variants = {key}
+    if len(key) >= MIN_FUZZY_SERIAL_LENGTH:
+        variants.update(key[:i] + key[i + 1:] for i in range(len(key)))
+    return variants
+
+
+def _join(*parts):
+    return ' '.join(part for part in parts if part)
+
+
+def _asset_document(asset):
+    return SearchDocument(
+        kind=DocumentKind.ASSET,
+        object_id=asset.pk,
+        location_id=asset.location_id,
+        title=asset.name[:255],
+        body=_join(asset.description, asset.category.name, asset.vendor.name if asset.vendor else None),
+    )
+
+
+def _asset_item_document(item):
+    return SearchDocument(
+        kind=DocumentKind.ASSET_ITEM,
+        object_id=item.pk,
+        location_id=item.location_id,
+        title=_join(item.asset.name, item.serial_number)[:255],
+        body=_join(item.description, item.asset.description, item.vendor.name if item.vendor else None),
+        serial_key=normalise_serial(item.serial_number),
+    )
+
+
+def _vendor_document(vendor):
+    return SearchDocument(
+        kind=DocumentKind.VENDOR,
+        object_id=vendor.pk,
+        title=vendor.name[:255],
+        body=_join(vendor.contact_person, vendor.description, vendor.email),
+    )
+
+
+def _location_document(location):
+    return SearchDocument(
+        kind=DocumentKind.LOCATION,
+        object_id=location.pk,
+        location_id=location.pk,
+        title=location.name[:255],
+        body=_join(location.type, location.parent_location, location.description),
+    )
+
+
+# kind -> (source queryset factory, document builder)
+SOURCES = {
+    DocumentKind.ASSET: (lambda: Asset.objects.select_related('category', 'vendor'), _asset_document),
+    DocumentKind.ASSET_ITEM: (lambda: AssetItem.objects.select_related('asset', 'vendor'), _asset_item_document),
+    DocumentKind.VENDOR: (lambda: Vendor.objects.all(), _vendor_document),
+    DocumentKind.LOCATION: (lambda: Location.objects.all(), _location_document),
+}
+
+KIND_FOR_MODEL = {
+    Asset: DocumentKind.ASSET,
+    AssetItem: DocumentKind.ASSET_ITEM,
+    Vendor: DocumentKind.VENDOR,
+    Location: DocumentKind.LOCATION,
+}
+
+
+@transaction.atomic
+def _write(kind, objects):
+    build = SOURCES[kind][1]
+    documents = [build(obj) for obj in objects]
+    object_ids = [document.object_id for document in documents]
+    SearchDocument.objects.filter(kind=kind, object_id__in=object_ids).delete()
+    SearchDocument.objects.bulk_create(documents, batch_size=BATCH_SIZE)
+
+    # bulk_create doesn't return primary keys on MySQL, so read them back
+    keyed = SearchDocument.objects.filter(
+        kind=kind, object_id__in=object_ids, serial_key__isnull=False,
+    ).values_list('id', 'serial_key')
+    SerialVariant.objects.bulk_create(
+        (SerialVariant(key=variant, document_id=document_id)
+         for document_id, serial_key in keyed
+         for variant in serial_variants(serial_key)),
+        batch_size=BATCH_SIZE,
+    )
+    return len(documents)
+
+
+def index_objects(kind, object_ids):
+    """(Re)index the given objects of ``kind``; returns the number indexed."""
+    queryset_factory = SOURCES[kind][0]
+    object_ids = list(object_ids)
+    indexed = 0
+    for start in range(0, len(object_ids), BATCH_SIZE):
+        batch = object_ids[start:start + BATCH_SIZE]
+        found = list(queryset_factory().filter(pk__in=batch))
+        missing = set(batch) - {obj.pk for obj in found}
+        if missing:
+            remove_objects(kind, missing)
+        indexed += _write(kind, found)
+    return indexed
+
+
+def remove_objects(kind, object_ids):
+    SearchDocument.objects.filter(kind=kind, object_id__in=list(object_ids)).delete()
+
+
+def rebuild(kind, batch_size=BATCH_SIZE):
+    """Drop and rebuild every document of ``kind``, walking the table by primary key."""
+    queryset_factory = SOURCES[kind][0]
+    SearchDocument.objects.filter(kind=kind).delete()
+    indexed, last_pk = 0, 0
+    while True:
+        batch = list(queryset_factory().filter(pk__gt=last_pk).order_by('pk')[:batch_size])
+        if not batch:
+            return indexed
+        indexed += _write(kind, batch)
+        last_pk = batch[-1].pk
@@ -0,0 +1,23 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from search.indexing import BATCH_SIZE, SOURCES, rebuild
+from search.models import DocumentKind
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the search index from the asset, asset item, vendor and location tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--kind', choices=DocumentKind.values, action='append',
+                            help='Only rebuild these kinds (repeatable); defaults to all')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        for kind in options['kind'] or list(SOURCES):
+            started = time.perf_counter()
+            count = rebuild(kind, batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(
+                f'Indexed {count} {kind} documents in {time.perf_counter() - started:.1f}s'
+            ))
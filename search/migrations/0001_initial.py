@@ -0,0 +1,40 @@
+# Generated by Django 5.2.1 on 2026-10-19 19:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('asset', 'Asset'), ('assetitem', 'Asset Item'), ('vendor', 'Vendor'), ('location', 'Location')], max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('location_id', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('title', models.CharField(max_length=255)),
+                ('body', models.TextField(blank=True, default='')),
+                ('serial_key', models.CharField(blank=True, max_length=50, null=True)),
+                ('indexed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['serial_key'], name='search_document_serial_idx'), models.Index(fields=['location_id', 'kind'], name='search_document_location_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='search_document_object_uniq')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SerialVariant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(db_index=True, max_length=50)),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='serial_variants', to='search.searchdocument')),
+            ],
+        ),
+    ]
@@ -0,0 +1,49 @@
+from django.db import models
+
+
+class DocumentKind(models.TextChoices):
+    ASSET = 'asset', 'Asset'
+    ASSET_ITEM = 'assetitem', 'Asset Item'
+    VENDOR = 'vendor', 'Vendor'
+    LOCATION = 'location', 'Location'
+
+
+class SearchDocument(models.Model):
+    """
+    One searchable row per indexed object. ``title`` and ``body`` are covered
+    by a FULLTEXT index on MySQL and an FTS5 table on SQLite (see migration
+    0002_fulltext); ``serial_key`` is the normalised serial number.
+    """
+    kind = models.CharField(max_length=20, choices=DocumentKind.choices)
+    object_id = models.PositiveBigIntegerField()
+    # Branch the object belongs to, for branch admin scoping
+    location_id = models.PositiveBigIntegerField(null=True, blank=True)
+    title = models.CharField(max_length=255)
+    body = models.TextField(blank=True, default='')
+    serial_key = models.CharField(max_length=50, null=True, blank=True)
+    indexed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'], name='search_document_object_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['serial_key'], name='search_document_serial_idx'),
+            models.Index(fields=['location_id', 'kind'], name='search_document_location_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.object_id} {self.title}"
+
+
+class SerialVariant(models.Model):
+    """
+    Single-character deletions of a serial key (plus the key itself). Two
+    serials within one edit (insert, delete, substitute or swap neighbours)
+    share at least one variant, so typo lookups are plain indexed equality.
+    """
+    key = models.CharField(max_length=50, db_index=True)
+    document = models.ForeignKey(SearchDocument, on_delete=models.CASCADE, related_name='serial_variants')
+
+    def __str__(self):
+        return self.key
@@ -0,0 +1,118 @@
+"""
+Ranked search over SearchDocument.
+
+Two kinds of matches are merged:
+
+- serial matches on asset items: exact, prefix, then within one edit
+  (via SerialVariant), scored above any text match;
+- full-text matches on title/body: MySQL FULLTEXT in boolean mode, SQLite
+  FTS5 with bm25 ranking (title weighted 10x), or a slow icontains fallback
+  for other databases. Every term must match; the last one as a prefix.
+"""
+import re
+
+from django.db import connections, router
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+from .indexing import MIN_FUZZY_SERIAL_LENGTH, normalise_serial, serial_variants
+from .models import DocumentKind, SearchDocument, SerialVariant
+
+# Branch admins see every vendor and location, but only their branch's assets
+GLOBAL_KINDS = (DocumentKind.VENDOR, DocumentKind.LOCATION)
+MAX_TERMS = 8
+
+SERIAL_EXACT = 'serial'
+SERIAL_PREFIX = 'serial_prefix'
+SERIAL_FUZZY = 'serial_fuzzy'
+TEXT = 'text'
+
+# Serial matches outrank text matches; text scores are added on top
+SERIAL_SCORES = {SERIAL_EXACT: 3000.0, SERIAL_PREFIX: 2000.0, SERIAL_FUZZY: 1000.0}
+
+
+def terms_for(query):
+    return re.findall(r'\w+', query.lower())[:MAX_TERMS]
+
+
+def scope_documents(queryset, user):
+    """Branch admins only see documents at their branch (and global kinds)."""
+    if user.is_branch_admin and user.branch:
+        queryset = queryset.filter(Q(kind__in=GLOBAL_KINDS) | Q(location_id=user.branch_id))
+    return queryset
+
+
+def _text_matches(queryset, terms):
+    connection = connections[router.db_for_read(SearchDocument)]
+    qn = connection.ops.quote_name
+    table = qn(SearchDocument._meta.db_table)
+
+    if connection.vendor == 'mysql':
+        # '+word*' makes every term required and prefix-matched
+        expression = f'MATCH ({table}.{qn("title")}, {table}.{qn("body")}) AGAINST (%s IN BOOLEAN MODE)'
+        match = ' '.join(f'+{term}*' for term in terms)
+        return queryset.annotate(
+            text_score=RawSQL(expression, [match], output_field=FloatField()),
+        ).filter(text_score__gt=0)
+
+    if connection.vendor == 'sqlite':
+        fts = qn(f'{SearchDocument._meta.db_table}_fts')
+        match = ' '.join(f'"{term}"*' for term in terms)
+        return queryset.filter(
+            id__in=RawSQL(f'SELECT rowid FROM {fts} WHERE {fts} MATCH %s', [match]),
+        ).annotate(text_score=RawSQL(
+            f'(SELECT -bm25({fts}, 10.0, 1.0) FROM {fts} WHERE {fts} MATCH %s AND rowid = {table}.{qn("id")})',
+            [match], output_field=FloatField(),
+        ))
+
+    for term in terms:
+        queryset = queryset.filter(Q(title__icontains=term) | Q(body__icontains=term))
+    return queryset.annotate(text_score=Value(1.0, output_field=FloatField()))
+
+
+def _serial_matches(queryset, key, limit):
+    """Yield (document id, match type) for serial hits, best first."""
+    items = queryset.filter(kind=DocumentKind.ASSET_ITEM)
+    yield from ((pk, SERIAL_EXACT) for pk in items.filter(serial_key=key).values_list('id', flat=True)[:limit])
+    yield from ((pk, SERIAL_PREFIX) for pk in
+                items.filter(serial_key__startswith=key).values_list('id', flat=True)[:limit])
+    if len(key) >= MIN_FUZZY_SERIAL_LENGTH:
+        fuzzy = SerialVariant.objects.filter(key__in=serial_variants(key)).values('document_id')
+        yield from ((pk, SERIAL_FUZZY) for pk in
+                    items.filter(id__in=fuzzy).values_list('id', flat=True)[:limit])
+
+
+def search(user, query, kinds=None, limit=20):
+    """Return up to ``limit`` ranked hits as dicts."""
+    queryset = scope_documents(SearchDocument.objects.all(), user)
+    if kinds:
+        queryset = queryset.filter(kind__in=kinds)
+
+    scores, matches = {}, {}
+    key = normalise_serial(query)
+    if key and (not kinds or DocumentKind.ASSET_ITEM in kinds):
+        for pk, match in _serial_matches(queryset, key, limit):
+            if pk not in matches:
+                matches[pk] = match
+                scores[pk] = SERIAL_SCORES[match]
+
+    terms = terms_for(query)
+    if terms:
+        ranked = _text_matches(queryset, terms).order_by('-text_score').values_list('id', 'text_score')[:limit]
+        for pk, text_score in ranked:
+            matches.setdefault(pk, TEXT)
+            scores[pk] = scores.get(pk, 0.0) + text_score
+
+    best = sorted(scores, key=scores.get, reverse=True)[:limit]
+    documents = SearchDocument.objects.in_bulk(best)
+    return [
+        {
+            'kind': documents[pk].kind,
+            'id': documents[pk].object_id,
+            'title': documents[pk].title,
+            'location': documents[pk].location_id,
+            'match': matches[pk],
+            'score': round(scores[pk], 4),
+        }
+        for pk in best if pk in documents
+    ]
@@ -0,0 +1,136 @@
+"""
+Reindex on save and delete. Work runs after the surrounding transaction
+commits, so rolled back writes never reach the index.
+
+Some documents embed names from other rows (an item's title carries its
+asset's name, an asset's body its category and vendor names); renaming those
+rows reindexes the dependants.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from asset.models import Asset
+from assetitem.models import AssetItem
+from category.models import Category
+from core.bulk import post_bulk_create
+from core.deletion import pre_bulk_delete
+from location.models import Location
+from vendor.models import Vendor
+
+from .indexing import KIND_FOR_MODEL, index_objects, remove_objects
+from .models import DocumentKind
+
+# model -> fields whose change must cascade to dependent documents
+CASCADING_FIELDS = {
+    Asset: ('name', 'description'),
+    Category: ('name',),
+    Vendor: ('name',),
+}
+
+# model -> fields its own document is built from, for models saved far more
+# often than those change
+INDEXED_FIELDS = {
+    AssetItem: ('asset', 'vendor', 'location', 'serial_number', 'description', 'retired_at'),
+}
+
+
+def _dependants(instance):
+    """(kind, object id queryset) pairs embedding text from ``instance``."""
+    if isinstance(instance, Asset):
+        return [(DocumentKind.ASSET_ITEM, instance.items.values_list('pk', flat=True))]
+    if isinstance(instance, Category):
+        return [(DocumentKind.ASSET, Asset.objects.filter(category=instance).values_list('pk', flat=True))]
+    if isinstance(instance, Vendor):
+        return [
+            (DocumentKind.ASSET, Asset.objects.filter(vendor=instance).values_list('pk', flat=True)),
+            (DocumentKind.ASSET_ITEM, AssetItem.objects.filter(vendor=instance).values_list('pk', flat=True)),
+        ]
+    return []
+
+
+@receiver(pre_save, sender=Asset)
+@receiver(pre_save, sender=Category)
+@receiver(pre_save, sender=Vendor)
+def remember_indexed_text(sender, instance, **kwargs):
+    fields = CASCADING_FIELDS[sender]
+    previous = sender.objects.filter(pk=instance.pk).values(*fields).first() if instance.pk else None
+    instance._search_cascade = previous is not None and any(
+        previous[field] != getattr(instance, field) for field in fields
+    )
+
+
+@receiver(pre_save, sender=AssetItem)
+def remember_indexed_fields(sender, instance, update_fields=None, **kwargs):
+    fields = [sender._meta.get_field(name) for name in INDEXED_FIELDS[sender]]
+    if update_fields is not None:
+        fields = [field for field in fields if field.name in update_fields or field.attname in update_fields]
+    if instance._state.adding or not fields:
+        instance._search_stale = instance._state.adding
+        return
+    previous = sender._base_manager.filter(pk=instance.pk).values(*(field.name for field in fields)).first()
+    instance._search_stale = previous is None or any(
+        previous[field.name] != getattr(instance, field.attname) for field in fields
+    )
+
+
+@receiver(post_save, sender=Asset)
+@receiver(post_save, sender=AssetItem)
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Location)
+@receiver(post_save, sender=Vendor)
+def index_on_save(sender, instance, raw=False, **kwargs):
+    if raw:  # loaddata
+        return
+    kind = KIND_FOR_MODEL.get(sender) if getattr(instance, '_search_stale', True) else None
+    cascade = getattr(instance, '_search_cascade', False)
+    if not kind and not cascade:
+        return
+
+    def reindex():
+        if kind:
+            index_objects(kind, [instance.pk])
+        if cascade:
+            for dependant_kind, object_ids in _dependants(instance):
+                index_objects(dependant_kind, object_ids)
+
+    transaction.on_commit(reindex)
+
+
+@receiver(post_bulk_create, sender=AssetItem)
+def index_on_bulk_create(sender, instances, **kwargs):
+    kind = KIND_FOR_MODEL[sender]
+    pks = [instance.pk for instance in instances]
+    transaction.on_commit(lambda: index_objects(kind, pks))
+
+
+@receiver(post_delete, sender=Asset)
+@receiver(post_delete, sender=AssetItem)
+@receiver(post_delete, sender=Location)
+@receiver(post_delete, sender=Vendor)
+def remove_on_delete(sender, instance, **kwargs):
+    kind = KIND_FOR_MODEL[sender]
+    pk = instance.pk
+    transaction.on_commit(lambda: remove_objects(kind, [pk]))
+
+
+@receiver(pre_bulk_delete, sender=Asset)
+@receiver(pre_bulk_delete, sender=AssetItem)
+@receiver(pre_bulk_delete, sender=Location)
+@receiver(pre_bulk_delete, sender=Vendor)
+def remove_on_bulk_delete(sender, queryset, **kwargs):
+    kind = KIND_FOR_MODEL[sender]
+    pks = list(queryset.values_list('pk', flat=True))
+    transaction.on_commit(lambda: remove_objects(kind, pks))
+
+
+@receiver(pre_delete, sender=Vendor)
+def reindex_vendor_dependants(sender, instance, **kwargs):
+    # The FKs are nulled by the delete itself, so collect the ids first
+    dependants = [(kind, list(object_ids)) for kind, object_ids in _dependants(instance)]
+
+    def reindex():
+        for kind, object_ids in dependants:
+            index_objects(kind, object_ids)
+
+    transaction.on_commit(reindex)
@@ -0,0 +1,38 @@
+from rest_framework import permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .models import DocumentKind
+from .query import search
+
+MIN_QUERY_LENGTH = 2
+MAX_LIMIT = 100
+
+
+class SearchView(APIView):
+    """
+    Ranked search across assets, asset items, vendors and locations.
+
+    ?q=        search text: name/description fragments or a serial number
+    ?kind=     optional comma-separated kinds (asset, assetitem, vendor, location)
+    ?limit=    number of hits, default 20, at most 100
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()
+        if len(query) < MIN_QUERY_LENGTH:
+            raise ValidationError({'q': [f'Enter at least {MIN_QUERY_LENGTH} characters.']})
+
+        kinds = [kind for kind in request.query_params.get('kind', '').split(',') if kind]
+        unknown = set(kinds) - set(DocumentKind.values)
+        if unknown:
+            raise ValidationError({'kind': [f'Unknown kind: {", ".join(sorted(unknown))}.']})
+
+        try:
+            limit = min(max(int(request.query_params.get('limit', 20)), 1), MAX_LIMIT)
+        except ValueError:
+            raise ValidationError({'limit': ['A valid integer is required.']})
+
+        return Response(search(request.user, query, kinds=kinds, limit=limit))
@@ -0,0 +1,108 @@
+"""
+Writing InventorySnapshot rows.
+
+take_snapshot() aggregates the live asset item table in a single
+INSERT ... SELECT. backfill() fills missing days without touching the live
+table: it starts from the nearest existing snapshot and applies (or, going
+backwards, reverts) that day's AssetItemEvent transitions.
+
+Backfilled values use each item's current price, and items deleted or
+retired since can't be replayed; days written by take_snapshot() are exact
+and count items in service only.
+"""
+import datetime
+from collections import defaultdict
+
+from django.db import connections, router, transaction
+from django.db.models import Count, Sum
+from django.utils import timezone
+
+from asset.models import Asset
+from assetitem.models import AssetItem, AssetItemEvent
+from .models import InventorySnapshot
+
+
+def take_snapshot(date):
+    """Replace ``date``'s snapshot with the live totals; returns rows written."""
+    using = router.db_for_write(InventorySnapshot)
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    with transaction.atomic(using=using):
+        InventorySnapshot.objects.using(using).filter(date=date).delete()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {qn(InventorySnapshot._meta.db_table)} '
+                f'(date, location_id, category_id, status, item_count, total_value) '
+                f'SELECT %s, item.location_id, asset.category_id, item.status, COUNT(*), COALESCE(SUM(item.price), 0) '
+                f'FROM {qn(AssetItem._meta.db_table)} item '
+                f'INNER JOIN {qn(Asset._meta.db_table)} asset ON asset.id = item.asset_id '
+                f'WHERE item.retired_at IS NULL '
+                f'GROUP BY item.location_id, asset.category_id, item.status',
+                [connection.ops.adapt_datefield_value(date)],
+            )
+            return cursor.rowcount
+
+
+def _load(date):
+    totals = defaultdict(lambda: [0, 0.0])
+    rows = InventorySnapshot.objects.filter(date=date).values_list(
+        'location', 'category', 'status', 'item_count', 'total_value')
+    for location_id, category_id, status, item_count, total_value in rows:
+        totals[location_id, category_id, status] = [item_count, total_value]
+    return totals
+
+
+def _apply_events(totals, date, sign):
+    """Add (sign=1) or revert (sign=-1) the transitions that happened on ``date``."""
+    start = timezone.make_aware(datetime.datetime.combine(date, datetime.time.min))
+    end = start + datetime.timedelta(days=1)
+    transitions = AssetItemEvent.objects.filter(occurred_at__gte=start, occurred_at__lt=end).values_list(
+        'asset_item__asset__category', 'location', 'status', 'previous_location', 'previous_status',
+    ).annotate(count=Count('id'), value=Sum('asset_item__price')).order_by()
+    for category_id, location_id, status, previous_location_id, previous_status, count, value in transitions:
+        value = value or 0.0
+        entered = totals[location_id, category_id, status]
+        entered[0] += sign * count
+        entered[1] += sign * value
+        if previous_status is not None:  # not a creation
+            left = totals[previous_location_id, category_id, previous_status]
+            left[0] -= sign * count
+            left[1] -= sign * value
+    return totals
+
+
+@transaction.atomic
+def _write(date, totals):
+    InventorySnapshot.objects.filter(date=date).delete()
+    InventorySnapshot.objects.bulk_create(
+        InventorySnapshot(date=date, location_id=location_id, category_id=category_id, status=status,
+                          item_count=count, total_value=round(value, 2))
+        for (location_id, category_id, status), (count, value) in totals.items()
+        if count > 0
+    )
+
+
+def _has_snapshot(date):
+    return InventorySnapshot.objects.filter(date=date).exists()
+
+
+def backfill(start, end):
+    """
+    Fill every day in [start, end] that has no snapshot yet, from a
+    neighbouring snapshot and the event log. Returns the dates written.
+    """
+    days = [start + datetime.timedelta(days=offset) for offset in range((end - start).days + 1)]
+    written = []
+    # Forwards from an earlier snapshot: day = previous day + that day's events
+    for day in days:
+        previous = day - datetime.timedelta(days=1)
+        if not _has_snapshot(day) and _has_snapshot(previous):
+            _write(day, _apply_events(_load(previous), day, 1))
+            written.append(day)
+    # Backwards from a later snapshot: day = next day - the next day's events
+    for day in reversed(days):
+        following = day + datetime.timedelta(days=1)
+        if not _has_snapshot(day) and _has_snapshot(following):
+            _write(day, _apply_events(_load(following), following, -1))
+            written.append(day)
+    return sorted(written)
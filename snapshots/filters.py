@@ -0,0 +1,12 @@
+from core.filters import FilterSet, Filter, RANGE, SET
+from .models import InventorySnapshot
+
+
+class InventorySnapshotFilterSet(FilterSet):
+    model = InventorySnapshot
+    filters = {
+        'location': Filter('location'),
+        'category': Filter('category', SET),
+        'status': Filter('status', SET),
+        'date': Filter('date', RANGE),
+    }
@@ -0,0 +1,37 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from snapshots.builder import backfill, take_snapshot
+
+
+class Command(BaseCommand):
+    help = (
+        "Write today's per-location/category/status inventory snapshot from the live table "
+        '(schedule it late in the day) and optionally backfill missing days from the event log'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', type=datetime.date.fromisoformat,
+                            help='Date to record the live totals under (YYYY-MM-DD); defaults to today')
+        parser.add_argument('--backfill-days', type=int, default=0,
+                            help='Also fill missing snapshots for this many days before --date')
+        parser.add_argument('--skip-live', action='store_true',
+                            help="Don't write the live snapshot, only backfill")
+
+    def handle(self, *args, **options):
+        date = options['date'] or timezone.localdate()
+        if options['backfill_days'] < 0:
+            raise CommandError('--backfill-days must not be negative')
+
+        if not options['skip_live']:
+            rows = take_snapshot(date)
+            self.stdout.write(self.style.SUCCESS(f'Snapshot for {date}: {rows} rows'))
+
+        if options['backfill_days']:
+            start = date - datetime.timedelta(days=options['backfill_days'])
+            written = backfill(start, date)
+            self.stdout.write(self.style.SUCCESS(f'Backfilled {len(written)} days'))
+            if not written and options['skip_live']:
+                self.stdout.write(self.style.WARNING('No neighbouring snapshot to backfill from'))
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.1 on 2026-10-19 19:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('category', '0001_initial'),
+        ('location', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InventorySnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('status', models.CharField(choices=[('AVAILABLE', 'Available'), ('MAINTENANCE', 'Maintenance'), ('BROKEN', 'Broken'), ('NOT AVAILABLE', 'Not Available'), ('ASSIGNED', 'Assigned')], max_length=50)),
+                ('item_count', models.PositiveIntegerField(default=0)),
+                ('total_value', models.FloatField(default=0)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='category.category')),
+                ('location', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='location.location')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['location', 'date'], name='snapshot_location_date_idx'), models.Index(fields=['category', 'date'], name='snapshot_category_date_idx'), models.Index(fields=['status', 'date'], name='snapshot_status_date_idx')],
+                'constraints': [models.UniqueConstraint(fields=('date', 'location', 'category', 'status'), name='inventory_snapshot_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import models
+
+from assetitem.models import Status
+from category.models import Category
+from location.models import Location
+
+
+class InventorySnapshot(models.Model):
+    """
+    Asset items held at the end of ``date``, aggregated per location,
+    category and status. One row per combination that had any items.
+    """
+    date = models.DateField()
+    location = models.ForeignKey(Location, null=True, blank=True, on_delete=models.CASCADE, related_name='+')
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='+')
+    status = models.CharField(max_length=50, choices=Status.choices)
+    item_count = models.PositiveIntegerField(default=0)
+    total_value = models.FloatField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['date', 'location', 'category', 'status'], name='inventory_snapshot_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['location', 'date'], name='snapshot_location_date_idx'),
+            models.Index(fields=['category', 'date'], name='snapshot_category_date_idx'),
+            models.Index(fields=['status', 'date'], name='snapshot_status_date_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.location_id}/{self.category_id}/{self.status}: {self.item_count}"
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from .views import InventorySnapshotSeriesView
+
+app_name = 'snapshots'
+
+urlpatterns = [
+    path('', InventorySnapshotSeriesView.as_view(), name='series'),
+]
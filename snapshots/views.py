@@ -0,0 +1,47 @@
+from django.db.models import Sum
+from rest_framework import permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.throttling import ANALYTICS
+from .filters import InventorySnapshotFilterSet
+from .models import InventorySnapshot
+
+GROUP_BY_FIELDS = ('location', 'category', 'status')
+
+
+class InventorySnapshotSeriesView(APIView):
+    """
+    Daily inventory time series from the snapshot table.
+
+    ?date__gte= / ?date__lte=        date range (YYYY-MM-DD)
+    ?location= ?category= ?status=   filters (category and status take __in lists)
+    ?group_by=                       comma-separated: location, category, status;
+                                     without it each day is a single total
+
+    Branch admins only see their own branch.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    throttle_scope = ANALYTICS
+
+    def get(self, request):
+        group_by = [field for field in request.query_params.get('group_by', '').split(',') if field]
+        unknown = set(group_by) - set(GROUP_BY_FIELDS)
+        if unknown:
+            raise ValidationError({'group_by': [
+                f'Unknown field: {", ".join(sorted(unknown))}. Choose from: {", ".join(GROUP_BY_FIELDS)}.'
+            ]})
+
+        queryset = InventorySnapshotFilterSet.apply(InventorySnapshot.objects.all(), request.query_params)
+        user = request.user
+        if user.is_branch_admin and user.branch:
+            queryset = queryset.filter(location=user.branch)
+
+        series = queryset.values('date', *group_by).annotate(
+            item_count=Sum('item_count'), total_value=Sum('total_value'),
+        ).order_by('date', *group_by)
+        return Response([
+            {**row, 'date': row['date'].isoformat(), 'total_value': round(row['total_value'], 2)}
+            for row in series
+        ])
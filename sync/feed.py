@@ -0,0 +1,117 @@
+"""
+The change feed behind /api/sync/.
+
+Entries past the client's watermark are collapsed to the latest change per
+row. Upserts are answered with the row's current representation, read
+through the caller's branch scope; a row that no longer exists or has left
+the caller's branch comes back as a tombstone (its id under ``deletes``).
+"""
+import datetime
+
+from django.conf import settings
+from django.db.models import Max, Q
+from django.utils import timezone
+
+from asset.models import Asset
+from asset.projections import AssetProjection
+from assetitem.models import AssetItem
+from assetitem.projections import AssetItemProjection
+from category.models import Category
+from category.serializers import CategorySerializer
+from core.models import Checkpoint
+from location.models import Location
+from location.serializers import LocationSerializer
+from vendor.models import Vendor
+from vendor.serializers import VendorSerializer
+from .models import ChangeLog, ChangeOp
+
+# Set by the prune_changelog command: watermarks below it must resync
+PRUNED_CHECKPOINT = 'sync.changelog_pruned'
+
+
+class SyncAssetItemProjection(AssetItemProjection):
+    """AssetItemProjection plus the id, minus asset_details (synced as assets)."""
+    columns = ('id',) + AssetItemProjection.columns
+
+    def build(self, row):
+        data = super().build(row[1:])
+        del data['asset_details']
+        return {'id': row[0], **data}
+
+
+def _projected(projection_class):
+    return lambda queryset: projection_class().project(queryset)
+
+
+def _serialized(serializer_class):
+    return lambda queryset: serializer_class(queryset, many=True).data
+
+
+# entity -> (model, branch-scoped?, representation of a queryset)
+ENTITIES = {
+    'assets': (Asset, True, _projected(AssetProjection)),
+    'assetitems': (AssetItem, True, _projected(SyncAssetItemProjection)),
+    'vendors': (Vendor, False, _serialized(VendorSerializer)),
+    'categories': (Category, False, _serialized(CategorySerializer)),
+    'locations': (Location, False, _serialized(LocationSerializer)),
+}
+ENTITY_FOR_MODEL = {model: entity for entity, (model, _, _) in ENTITIES.items()}
+GLOBAL_ENTITIES = [entity for entity, (_, scoped, _) in ENTITIES.items() if not scoped]
+
+
+def user_branch(user):
+    return user.branch if user.is_branch_admin and user.branch else None
+
+
+def settled_cutoff():
+    """
+    Entries younger than the settle window may still have a lower-id
+    sibling in an uncommitted transaction; nothing past them is handed out.
+    """
+    return timezone.now() - datetime.timedelta(seconds=settings.SYNC_SETTLE_SECONDS)
+
+
+def head():
+    """The sequence a freshly downloaded client should sync from."""
+    settled = ChangeLog.objects.filter(changed_at__lte=settled_cutoff())
+    return settled.aggregate(head=Max('id'))['head'] or 0
+
+
+def pruned_through():
+    return Checkpoint.get(PRUNED_CHECKPOINT).position
+
+
+def changes_since(user, since, entities, limit):
+    """Return (changes by entity, next watermark, has_more)."""
+    branch = user_branch(user)
+    entries = ChangeLog.objects.filter(id__gt=since, changed_at__lte=settled_cutoff(), entity__in=entities)
+    if branch is not None:
+        entries = entries.filter(
+            Q(entity__in=GLOBAL_ENTITIES) | Q(location_id=branch.pk) | Q(previous_location_id=branch.pk)
+        )
+    entries = list(entries.order_by('id').values_list('id', 'entity', 'object_id', 'op')[:limit + 1])
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    latest = {}
+    for _, entity, object_id, op in entries:
+        latest[entity, object_id] = op
+
+    changes = {}
+    for entity in entities:
+        model, scoped, represent = ENTITIES[entity]
+        upserted = [object_id for (name, object_id), op in latest.items() if name == entity and op == ChangeOp.UPSERT]
+        deleted = {object_id for (name, object_id), op in latest.items() if name == entity and op == ChangeOp.DELETE}
+        if not upserted and not deleted:
+            continue
+
+        rows = model.objects.filter(pk__in=upserted).order_by('pk')
+        if scoped and branch is not None:
+            rows = rows.filter(location=branch)
+        upserts = represent(rows) if upserted else []
+        visible = {row['id'] for row in upserts}
+        deleted.update(object_id for object_id in upserted if object_id not in visible)
+        changes[entity] = {'upserts': upserts, 'deletes': sorted(deleted)}
+
+    next_since = entries[-1][0] if entries else since
+    return changes, next_since, has_more
@@ -0,0 +1,30 @@
+import datetime
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from core.models import Checkpoint
+from sync.feed import PRUNED_CHECKPOINT
+from sync.models import ChangeLog
+
+
+class Command(BaseCommand):
+    help = 'Delete sync change log entries older than --days; devices behind them must do a full sync'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=30)
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - datetime.timedelta(days=options['days'])
+        with transaction.atomic():
+            last_id = ChangeLog.objects.filter(changed_at__lt=cutoff).aggregate(last=Max('id'))['last']
+            if last_id is None:
+                self.stdout.write('Nothing to prune')
+                return
+            deleted, _ = ChangeLog.objects.filter(id__lte=last_id).delete()
+            checkpoint = Checkpoint.get(PRUNED_CHECKPOINT)
+            checkpoint.position = max(checkpoint.position, last_id)
+            checkpoint.save()
+        self.stdout.write(self.style.SUCCESS(f'Pruned {deleted} change log entries up to #{last_id}'))
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.1 on 2026-10-19 19:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity', models.CharField(max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('op', models.CharField(choices=[('U', 'Created or updated'), ('D', 'Deleted')], max_length=1)),
+                ('location_id', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('previous_location_id', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('changed_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['changed_at'], name='changelog_changed_at_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.db import models
+
+
+class ChangeOp(models.TextChoices):
+    UPSERT = 'U', 'Created or updated'
+    DELETE = 'D', 'Deleted'
+
+
+class ChangeLog(models.Model):
+    """
+    One row per change to a synced row, written as the row is saved (inside
+    the save's transaction when there is one). The auto-increment id is the
+    change sequence clients use as their sync watermark.
+    """
+    entity = models.CharField(max_length=20)
+    object_id = models.PositiveBigIntegerField()
+    op = models.CharField(max_length=1, choices=ChangeOp.choices)
+    # Branch before and after the change, so a branch device also hears
+    # about rows leaving its branch
+    location_id = models.PositiveBigIntegerField(null=True, blank=True)
+    previous_location_id = models.PositiveBigIntegerField(null=True, blank=True)
+    changed_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['changed_at'], name='changelog_changed_at_idx'),
+        ]
+
+    def __str__(self):
+        return f"#{self.pk} {self.op} {self.entity}:{self.object_id}"
+
+    @classmethod
+    def record(cls, entity, changes, op=ChangeOp.UPSERT, using=None):
+        """``changes`` is an iterable of (object_id, location_id, previous_location_id)."""
+        cls.objects.using(using).bulk_create(
+            (cls(entity=entity, object_id=object_id, op=op, location_id=location_id,
+                 previous_location_id=previous_location_id)
+             for object_id, location_id, previous_location_id in changes),
+            batch_size=1000,
+        )
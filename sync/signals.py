@@ -0,0 +1,57 @@
+from django.db.models.signals import post_delete, post_save
+
+from asset.models import Asset
+from assetitem.models import AssetItem
+from category.models import Category
+from core.bulk import post_bulk_create
+from core.deletion import pre_bulk_delete
+from core.tracking import track_location
+from location.models import Location
+from vendor.models import Vendor
+
+from .feed import ENTITY_FOR_MODEL
+from .models import ChangeLog, ChangeOp
+
+SYNCED_MODELS = (Asset, AssetItem, Category, Location, Vendor)
+
+
+def _location_id(instance):
+    return getattr(instance, 'location_id', None)
+
+
+# A row moving branches is also a change for the branch it left
+track_location(Asset, AssetItem)
+
+
+def record_save(sender, instance, raw=False, using=None, **kwargs):
+    if raw:  # loaddata
+        return
+    ChangeLog.record(ENTITY_FOR_MODEL[sender], [(
+        instance.pk, _location_id(instance), getattr(instance, '_previous_location_id', None),
+    )], using=using)
+
+
+def record_bulk_create(sender, instances, using=None, **kwargs):
+    ChangeLog.record(ENTITY_FOR_MODEL[sender], ((instance.pk, _location_id(instance), None) for instance in instances),
+                     using=using)
+
+
+def record_delete(sender, instance, using=None, **kwargs):
+    ChangeLog.record(ENTITY_FOR_MODEL[sender], [(instance.pk, _location_id(instance), None)],
+                     op=ChangeOp.DELETE, using=using)
+
+
+def record_bulk_delete(sender, queryset, using=None, **kwargs):
+    if hasattr(sender, 'location_id'):
+        rows = queryset.values_list('pk', 'location')
+    else:
+        rows = ((pk, None) for pk in queryset.values_list('pk', flat=True))
+    ChangeLog.record(ENTITY_FOR_MODEL[sender], ((pk, location_id, None) for pk, location_id in rows),
+                     op=ChangeOp.DELETE, using=using)
+
+
+for model in SYNCED_MODELS:
+    post_save.connect(record_save, sender=model, dispatch_uid=f'sync-save-{model._meta.label}')
+    post_bulk_create.connect(record_bulk_create, sender=model, dispatch_uid=f'sync-bulk-create-{model._meta.label}')
+    post_delete.connect(record_delete, sender=model, dispatch_uid=f'sync-delete-{model._meta.label}')
+    pre_bulk_delete.connect(record_bulk_delete, sender=model, dispatch_uid=f'sync-bulk-delete-{model._meta.label}')
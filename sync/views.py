@@ -0,0 +1,54 @@
+from rest_framework import permissions, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .feed import ENTITIES, changes_since, head, pruned_through
+
+DEFAULT_LIMIT = 500
+MAX_LIMIT = 5000
+
+
+class SyncView(APIView):
+    """
+    Incremental sync for offline devices.
+
+    Without ?since= the response only carries ``next``, the current end of
+    the change log: download the full lists, then sync from that value.
+    With ?since=<watermark> it returns the rows created, updated or deleted
+    after it, grouped by entity, and the ``next`` watermark; keep calling
+    while ``has_more`` is true. A watermark older than the retained log
+    gets 410 Gone and the device must download the full lists again.
+
+    ?entities=  comma-separated subset of assets, assetitems, vendors,
+                categories, locations (default: all)
+    ?limit=     change log entries per page, default 500
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        params = request.query_params
+        entities = [entity for entity in params.get('entities', '').split(',') if entity] or list(ENTITIES)
+        unknown = set(entities) - set(ENTITIES)
+        if unknown:
+            raise ValidationError({'entities': [f'Unknown entity: {", ".join(sorted(unknown))}.']})
+
+        if 'since' not in params:
+            return Response({'next': head(), 'has_more': False, 'changes': {}})
+
+        try:
+            since = int(params['since'])
+            limit = min(max(int(params.get('limit', DEFAULT_LIMIT)), 1), MAX_LIMIT)
+        except ValueError:
+            raise ValidationError({'since': ['since and limit must be integers.']})
+        if since < 0:
+            raise ValidationError({'since': ['Must not be negative.']})
+
+        if since < pruned_through():
+            return Response(
+                {'error': 'The change log no longer reaches back to this watermark; run a full sync.'},
+                status=status.HTTP_410_GONE
+            )
+
+        changes, next_since, has_more = changes_since(request.user, since, entities, limit)
+        return Response({'since': since, 'next': next_since, 'has_more': has_more, 'changes': changes})
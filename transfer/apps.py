@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class TransferConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'transfer'
+
+    def ready(self):
+        # Keep the TransferListing read model up to date
+        from . import signals  # noqa: F401
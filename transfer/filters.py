@@ -0,0 +1,23 @@
+from core.filters import FilterSet, Filter, RANGE, SET
+from .models import Transfer, TransferListing
+
+
+class TransferFilterSet(FilterSet):
+    model = Transfer
+    filters = {
+        'status': Filter('status', SET),
+        'asset_item': Filter('asset_item'),
+        'from_location': Filter('from_location'),
+        'to_location': Filter('to_location'),
+        'requested_by': Filter('requested_by'),
+        'request_date': Filter('request_date', RANGE),
+    }
+    ordering_fields = ['request_date', 'status']
+
+
+class TransferListingFilterSet(FilterSet):
+    """TransferFilterSet over the read model, always queried for one location."""
+    model = TransferListing
+    scope = ('location',)
+    filters = TransferFilterSet.filters
+    ordering_fields = TransferFilterSet.ordering_fields
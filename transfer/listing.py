@@ -0,0 +1,106 @@
+"""
+Keeping the TransferListing read model in step with the rows it copies.
+
+sync() rewrites the listing rows of some transfers from one joined read of
+Transfer; the rename_* helpers fix a denormalised name in place with one
+UPDATE, touching only the rows still carrying the old value. Writes reach
+them through transfer.signals; rebuild() re-derives the whole table.
+"""
+from django.db import transaction
+from django.db.models import Subquery
+
+from asset.models import Asset
+from assetitem.models import AssetItem
+
+from .models import Transfer, TransferListing
+from .projections import _full_name
+
+LISTING_BATCH_SIZE = 1000
+
+SOURCE_COLUMNS = (
+    'id', 'asset_item', 'asset_item__asset__name', 'asset_item__serial_number',
+    'from_location', 'from_location__name', 'to_location', 'to_location__name',
+    'requested_by', 'requested_by__first_name', 'requested_by__last_name',
+    'approved_by', 'approved_by__first_name', 'approved_by__last_name',
+    'status', 'request_date', 'approval_date', 'completion_date', 'notes', 'reason',
+)
+
+
+def _listings(transfers):
+    for (pk, asset_item_id, asset_name, asset_serial, from_location_id, from_location_name,
+         to_location_id, to_location_name, requested_by_id, requested_by_first, requested_by_last,
+         approved_by_id, approved_by_first, approved_by_last, status, request_date,
+         approval_date, completion_date, notes, reason) in transfers.values_list(*SOURCE_COLUMNS):
+        fields = {
+            'transfer_id': pk, 'asset_item_id': asset_item_id,
+            'asset_name': asset_name, 'asset_serial': asset_serial,
+            'from_location_id': from_location_id, 'from_location_name': from_location_name,
+            'to_location_id': to_location_id, 'to_location_name': to_location_name,
+            'requested_by_id': requested_by_id,
+            'requested_by_name': _full_name(requested_by_first, requested_by_last),
+            'approved_by_id': approved_by_id,
+            'approved_by_name': _full_name(approved_by_first, approved_by_last) if approved_by_id else '',
+            'status': status, 'request_date': request_date, 'approval_date': approval_date,
+            'completion_date': completion_date, 'notes': notes, 'reason': reason,
+        }
+        # A transfer within one location is listed there once
+        for location_id in dict.fromkeys((from_location_id, to_location_id)):
+            yield TransferListing(location_id=location_id, **fields)
+
+
+def sync(transfer_ids, using=None):
+    """Rewrite the listing rows of ``transfer_ids``; returns the rows written."""
+    transfer_ids = list(transfer_ids)
+    with transaction.atomic(using=using):
+        TransferListing.objects.using(using).filter(transfer_id__in=transfer_ids).delete()
+        listings = list(_listings(Transfer.objects.using(using).filter(pk__in=transfer_ids)))
+        TransferListing.objects.using(using).bulk_create(listings, batch_size=LISTING_BATCH_SIZE)
+    return len(listings)
+
+
+def rebuild(batch_size=LISTING_BATCH_SIZE):
+    """Re-derive every listing row, ``batch_size`` transfers per transaction."""
+    transfers = Transfer.objects.order_by('pk').values_list('pk', flat=True)
+    written, last_pk = 0, 0
+    while ids := list(transfers.filter(pk__gt=last_pk)[:batch_size]):
+        written += sync(ids)
+        last_pk = ids[-1]
+    return written
+
+
+def rename_asset(asset_id, name):
+    items = AssetItem.all_objects.filter(asset_id=asset_id).values('pk')
+    return TransferListing.objects.filter(asset_item_id__in=items).exclude(asset_name=name).update(asset_name=name)
+
+
+def rename_asset_item(asset_item_id, serial, asset_id):
+    # The asset's name is read by the UPDATE itself, not fetched first
+    asset_name = Subquery(Asset.objects.filter(pk=asset_id).values('name')[:1])
+    return (
+        TransferListing.objects.filter(asset_item_id=asset_item_id)
+        .exclude(asset_serial=serial, asset_name=asset_name)
+        .update(asset_serial=serial, asset_name=asset_name)
+    )
+
+
+def rename_location(location_id, name):
+    return (
+        TransferListing.objects.filter(from_location_id=location_id).exclude(from_location_name=name)
+        .update(from_location_name=name)
+        + TransferListing.objects.filter(to_location_id=location_id).exclude(to_location_name=name)
+        .update(to_location_name=name)
+    )
+
+
+def rename_user(user_id, name):
+    return (
+        TransferListing.objects.filter(requested_by_id=user_id).exclude(requested_by_name=name)
+        .update(requested_by_name=name)
+        + TransferListing.objects.filter(approved_by_id=user_id).exclude(approved_by_name=name)
+        .update(approved_by_name=name)
+    )
+
+
+def forget_approver(user_ids):
+    """Deleting a user nulls Transfer.approved_by without a save; follow suit."""
+    return TransferListing.objects.filter(approved_by_id__in=user_ids).update(approved_by=None, approved_by_name='')
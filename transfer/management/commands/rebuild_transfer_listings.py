@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from transfer.listing import LISTING_BATCH_SIZE, rebuild
+
+
+class Command(BaseCommand):
+    help = 'Re-derive the TransferListing read model from the transfers (e.g. after loaddata or bulk writes)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=LISTING_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        written = rebuild(options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Wrote {written} transfer listing rows'))
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.1 on 2026-10-19 19:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assetitem', '0002_filter_indexes'),
+        ('location', '0001_initial'),
+        ('transfer', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transfer',
+            index=models.Index(fields=['status', 'request_date'], name='transfer_status_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transfer',
+            index=models.Index(fields=['request_date'], name='transfer_request_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transfer',
+            index=models.Index(fields=['to_location', 'status', 'request_date'], name='transfer_to_status_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transfer',
+            index=models.Index(fields=['from_location', 'status', 'request_date'], name='transfer_from_status_date_idx'),
+        ),
+    ]
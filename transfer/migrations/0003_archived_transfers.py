@@ -0,0 +1,38 @@
+# Generated by Django 5.2.1 on 2026-10-19 19:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assetitem', '0006_retirement'),
+        ('location', '0001_initial'),
+        ('transfer', '0002_filter_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedTransfer',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('APPROVED', 'Approved'), ('DECLINED', 'Declined'), ('IN_TRANSIT', 'In Transit'), ('COMPLETED', 'Completed')], max_length=20)),
+                ('request_date', models.DateTimeField()),
+                ('approval_date', models.DateTimeField(blank=True, null=True)),
+                ('completion_date', models.DateTimeField(blank=True, null=True)),
+                ('notes', models.TextField(blank=True, null=True)),
+                ('reason', models.TextField(blank=True, null=True)),
+                ('approved_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('asset_item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transfers', to='assetitem.archivedassetitem')),
+                ('from_location', models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='location.location')),
+                ('requested_by', models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('to_location', models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='location.location')),
+            ],
+            options={
+                'ordering': ['-request_date'],
+            },
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.2.1 on 2026-10-19 19:50
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fill_listings(apps, schema_editor):
+    Transfer = apps.get_model('transfer', 'Transfer')
+    TransferListing = apps.get_model('transfer', 'TransferListing')
+
+    def full_name(user):
+        return f'{user.first_name} {user.last_name}'.strip() if user else ''
+
+    transfers = Transfer.objects.select_related(
+        'asset_item__asset', 'from_location', 'to_location', 'requested_by', 'approved_by',
+    ).order_by('pk')
+    last_pk = 0
+    while batch := list(transfers.filter(pk__gt=last_pk)[:1000]):
+        TransferListing.objects.bulk_create(
+            TransferListing(
+                transfer=transfer, location_id=location_id, asset_item_id=transfer.asset_item_id,
+                asset_name=transfer.asset_item.asset.name, asset_serial=transfer.asset_item.serial_number,
+                from_location_id=transfer.from_location_id, from_location_name=transfer.from_location.name,
+                to_location_id=transfer.to_location_id, to_location_name=transfer.to_location.name,
+                requested_by_id=transfer.requested_by_id, requested_by_name=full_name(transfer.requested_by),
+                approved_by_id=transfer.approved_by_id, approved_by_name=full_name(transfer.approved_by),
+                status=transfer.status, request_date=transfer.request_date,
+                approval_date=transfer.approval_date, completion_date=transfer.completion_date,
+                notes=transfer.notes, reason=transfer.reason,
+            )
+            for transfer in batch
+            for location_id in dict.fromkeys((transfer.from_location_id, transfer.to_location_id))
+        )
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assetitem', '0008_location_warranty_index'),
+        ('location', '0001_initial'),
+        ('transfer', '0003_archived_transfers'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TransferListing',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('asset_name', models.CharField(max_length=255)),
+                ('asset_serial', models.CharField(blank=True, max_length=50, null=True)),
+                ('from_location_name', models.CharField(max_length=255)),
+                ('to_location_name', models.CharField(max_length=255)),
+                ('requested_by_name', models.CharField(max_length=301)),
+                ('approved_by_name', models.CharField(blank=True, max_length=301)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('APPROVED', 'Approved'), ('DECLINED', 'Declined'), ('IN_TRANSIT', 'In Transit'), ('COMPLETED', 'Completed')], max_length=20)),
+                ('request_date', models.DateTimeField()),
+                ('approval_date', models.DateTimeField(blank=True, null=True)),
+                ('completion_date', models.DateTimeField(blank=True, null=True)),
+                ('notes', models.TextField(blank=True, null=True)),
+                ('reason', models.TextField(blank=True, null=True)),
+                ('approved_by', models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('asset_item', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='assetitem.assetitem')),
+                ('from_location', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='location.location')),
+                ('location', models.ForeignKey(db_constraint=False, db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='location.location')),
+                ('requested_by', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('to_location', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='location.location')),
+                ('transfer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='listings', to='transfer.transfer')),
+            ],
+            options={
+                'ordering': ['-request_date'],
+                'indexes': [models.Index(fields=['location', 'status', 'request_date'], name='listing_loc_status_date_idx'), models.Index(fields=['location', 'request_date'], name='listing_loc_date_idx')],
+                'constraints': [models.UniqueConstraint(fields=('transfer', 'location'), name='transfer_listing_uniq')],
+            },
+        ),
+        migrations.RunPython(fill_listings, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,8 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 
-from assetitem.models import AssetItem
+from assetitem.models import AssetItem, EventSource
 from location.models import Location
 
 User = get_user_model()
@@ -57,10 +57,18 @@ class Transfer(models.Model):
 
     class Meta:
         ordering = ['-request_date']
+        # Back the filters and orderings declared in transfer/filters.py
+        indexes = [
+            models.Index(fields=['status', 'request_date'], name='transfer_status_date_idx'),
+            models.Index(fields=['request_date'], name='transfer_request_date_idx'),
+            models.Index(fields=['to_location', 'status', 'request_date'], name='transfer_to_status_date_idx'),
+            models.Index(fields=['from_location', 'status', 'request_date'], name='transfer_from_status_date_idx'),
+        ]
         
     def __str__(self):
         return f"Transfer: {self.asset_item} from {self.from_location} to {self.to_location} ({self.status})"
     
+    @transaction.atomic
     def approve(self, approved_by_user):
         """Approve the transfer and update asset item location"""
         self.status = TransferStatus.IN_TRANSIT
@@ -68,9 +76,9 @@ class Transfer(models.Model):
         self.approval_date = timezone.now()
         self.save()
         
-        # Update asset item location
+        # Update asset item location (logged as an AssetItemEvent)
         self.asset_item.location = self.to_location
-        self.asset_item.save()
+        self.asset_item.save(event_source=EventSource.TRANSFER, transfer=self)
         
         # Mark as completed
         self.status = TransferStatus.COMPLETED
@@ -83,3 +91,78 @@ class Transfer(models.Model):
         self.approved_by = declined_by_user
         self.approval_date = timezone.now()
         self.save()
+
+
+class ArchivedTransfer(models.Model):
+    """
+    A Transfer of an archived asset item, moved out of the live table with it
+    (see assetitem.archive). Relations don't constrain the live tables.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    asset_item = models.ForeignKey('assetitem.ArchivedAssetItem', on_delete=models.CASCADE, related_name='transfers')
+    from_location = models.ForeignKey(Location, null=True, on_delete=models.DO_NOTHING, db_constraint=False,
+                                      related_name='+')
+    to_location = models.ForeignKey(Location, null=True, on_delete=models.DO_NOTHING, db_constraint=False,
+                                    related_name='+')
+    requested_by = models.ForeignKey(User, null=True, on_delete=models.DO_NOTHING, db_constraint=False,
+                                     related_name='+')
+    approved_by = models.ForeignKey(User, null=True, blank=True, on_delete=models.DO_NOTHING, db_constraint=False,
+                                    related_name='+')
+    status = models.CharField(max_length=20, choices=TransferStatus.choices)
+    request_date = models.DateTimeField()
+    approval_date = models.DateTimeField(null=True, blank=True)
+    completion_date = models.DateTimeField(null=True, blank=True)
+    notes = models.TextField(blank=True, null=True)
+    reason = models.TextField(blank=True, null=True)
+
+    class Meta:
+        ordering = ['-request_date']
+
+    def __str__(self):
+        return f"Archived transfer {self.pk} of item {self.asset_item_id}"
+
+
+class TransferListing(models.Model):
+    """
+    Read model of the transfer list endpoints: one row per transfer and
+    location it involves, carrying the names the listings show, so a
+    location's transfers are one range scan of one table. Written only by
+    transfer.listing; relations don't constrain, the transfer cascade
+    removes the rows.
+    """
+    transfer = models.ForeignKey(Transfer, on_delete=models.CASCADE, related_name='listings')
+    location = models.ForeignKey(Location, on_delete=models.DO_NOTHING, db_constraint=False, db_index=False,
+                                 related_name='+')
+    asset_item = models.ForeignKey(AssetItem, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    asset_name = models.CharField(max_length=255)
+    asset_serial = models.CharField(max_length=50, blank=True, null=True)
+    from_location = models.ForeignKey(Location, on_delete=models.DO_NOTHING, db_constraint=False,
+                                      related_name='+')
+    from_location_name = models.CharField(max_length=255)
+    to_location = models.ForeignKey(Location, on_delete=models.DO_NOTHING, db_constraint=False,
+                                    related_name='+')
+    to_location_name = models.CharField(max_length=255)
+    requested_by = models.ForeignKey(User, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    requested_by_name = models.CharField(max_length=301)
+    approved_by = models.ForeignKey(User, null=True, on_delete=models.DO_NOTHING, db_constraint=False,
+                                    related_name='+')
+    approved_by_name = models.CharField(max_length=301, blank=True)
+    status = models.CharField(max_length=20, choices=TransferStatus.choices)
+    request_date = models.DateTimeField()
+    approval_date = models.DateTimeField(null=True, blank=True)
+    completion_date = models.DateTimeField(null=True, blank=True)
+    notes = models.TextField(blank=True, null=True)
+    reason = models.TextField(blank=True, null=True)
+
+    class Meta:
+        ordering = ['-request_date']
+        constraints = [
+            models.UniqueConstraint(fields=['transfer', 'location'], name='transfer_listing_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['location', 'status', 'request_date'], name='listing_loc_status_date_idx'),
+            models.Index(fields=['location', 'request_date'], name='listing_loc_date_idx'),
+        ]
+
+    def __str__(self):
+        return f"Listing of transfer {self.transfer_id} at location {self.location_id}"
@@ -0,0 +1,86 @@
+from core.projections import Projection
+
+
+def _full_name(first_name, last_name):
+    # Same as AbstractUser.get_full_name()
+    return f'{first_name} {last_name}'.strip()
+
+
+class TransferProjection(Projection):
+    """values_list()-based equivalent of TransferSerializer(many=True).data."""
+    columns = (
+        'id', 'asset_item', 'asset_item__asset__name', 'asset_item__serial_number',
+        'from_location', 'from_location__name', 'to_location', 'to_location__name',
+        'requested_by', 'requested_by__first_name', 'requested_by__last_name',
+        'approved_by', 'approved_by__first_name', 'approved_by__last_name',
+        'status', 'request_date', 'approval_date', 'completion_date', 'notes', 'reason',
+    )
+
+    def build(self, row):
+        (pk, asset_item_id, asset_name, asset_serial, from_location_id, from_location_name,
+         to_location_id, to_location_name, requested_by_id, requested_by_first, requested_by_last,
+         approved_by_id, approved_by_first, approved_by_last, status, request_date,
+         approval_date, completion_date, notes, reason) = row
+
+        data = {
+            'id': pk,
+            'asset_item': asset_item_id,
+            'asset_name': asset_name,
+            'asset_serial': asset_serial,
+            'from_location': from_location_id,
+            'from_location_name': from_location_name,
+            'to_location': to_location_id,
+            'to_location_name': to_location_name,
+            'requested_by': requested_by_id,
+            'requested_by_name': _full_name(requested_by_first, requested_by_last),
+            'approved_by': approved_by_id,
+        }
+        # TransferSerializer skips approved_by_name until someone acted on it.
+        if approved_by_id is not None:
+            data['approved_by_name'] = _full_name(approved_by_first, approved_by_last)
+        data['status'] = status
+        data['request_date'] = self.datetime_repr(request_date)
+        data['approval_date'] = self.datetime_repr(approval_date)
+        data['completion_date'] = self.datetime_repr(completion_date)
+        data['notes'] = notes
+        data['reason'] = reason
+        return data
+
+
+class TransferListingProjection(Projection):
+    """TransferProjection read from TransferListing rows, names included."""
+    columns = (
+        'transfer', 'asset_item', 'asset_name', 'asset_serial',
+        'from_location', 'from_location_name', 'to_location', 'to_location_name',
+        'requested_by', 'requested_by_name', 'approved_by', 'approved_by_name',
+        'status', 'request_date', 'approval_date', 'completion_date', 'notes', 'reason',
+    )
+
+    def build(self, row):
+        (pk, asset_item_id, asset_name, asset_serial, from_location_id, from_location_name,
+         to_location_id, to_location_name, requested_by_id, requested_by_name,
+         approved_by_id, approved_by_name, status, request_date,
+         approval_date, completion_date, notes, reason) = row
+
+        data = {
+            'id': pk,
+            'asset_item': asset_item_id,
+            'asset_name': asset_name,
+            'asset_serial': asset_serial,
+            'from_location': from_location_id,
+            'from_location_name': from_location_name,
+            'to_location': to_location_id,
+            'to_location_name': to_location_name,
+            'requested_by': requested_by_id,
+            'requested_by_name': requested_by_name,
+            'approved_by': approved_by_id,
+        }
+        if approved_by_id is not None:
+            data['approved_by_name'] = approved_by_name
+        data['status'] = status
+        data['request_date'] = self.datetime_repr(request_date)
+        data['approval_date'] = self.datetime_repr(approval_date)
+        data['completion_date'] = self.datetime_repr(completion_date)
+        data['notes'] = notes
+        data['reason'] = reason
+        return data
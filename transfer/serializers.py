@@ -1,10 +1,11 @@
 from rest_framework import serializers
-from .models import Transfer, TransferStatus
+from .models import ArchivedTransfer, Transfer, TransferStatus
 from assetitem.models import AssetItem
 from location.models import Location
 from asset.serializers import AssetSerializer
 from location.serializers import LocationSerializer
 from users.serializers import UserSerializer
+from core.sparse import SparseFieldsetSerializerMixin
 
 
 class TransferCreateSerializer(serializers.ModelSerializer):
@@ -20,7 +21,7 @@ class TransferCreateSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class TransferSerializer(serializers.ModelSerializer):
+class TransferSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     asset_name = serializers.CharField(source='asset_item.asset.name', read_only=True)
     asset_serial = serializers.CharField(source='asset_item.serial_number', read_only=True)
     from_location_name = serializers.CharField(source='from_location.name', read_only=True)
@@ -63,3 +64,18 @@ class TransferSerializer(serializers.ModelSerializer):
 class TransferActionSerializer(serializers.Serializer):
     action = serializers.ChoiceField(choices=['approve', 'decline'])
     notes = serializers.CharField(required=False, allow_blank=True)
+
+
+class ArchivedTransferSerializer(serializers.ModelSerializer):
+    from_location_name = serializers.CharField(source='from_location.name', read_only=True)
+    to_location_name = serializers.CharField(source='to_location.name', read_only=True)
+    requested_by_name = serializers.CharField(source='requested_by.get_full_name', read_only=True)
+    approved_by_name = serializers.CharField(source='approved_by.get_full_name', read_only=True)
+
+    class Meta:
+        model = ArchivedTransfer
+        fields = [
+            'id', 'from_location', 'from_location_name', 'to_location', 'to_location_name',
+            'requested_by', 'requested_by_name', 'approved_by', 'approved_by_name', 'status',
+            'request_date', 'approval_date', 'completion_date', 'notes', 'reason',
+        ]
@@ -0,0 +1,73 @@
+"""
+Maintains the TransferListing read model (see transfer.listing): a transfer's
+rows are rewritten when it is saved, and renames of the rows it copies names
+from are pushed into the listings in the same transaction.
+"""
+from django.db.models import DEFERRED
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from asset.models import Asset
+from assetitem.models import AssetItem
+from core.deletion import pre_bulk_delete
+from location.models import Location
+from users.models import User
+
+from . import listing
+from .models import Transfer
+
+# model -> fields the listings copy
+LISTED_FIELDS = {
+    Asset: {'name'},
+    AssetItem: {'serial_number', 'asset'},
+    Location: {'name'},
+    User: {'first_name', 'last_name'},
+}
+
+
+def _touches_listing(sender, update_fields):
+    return update_fields is None or not LISTED_FIELDS[sender].isdisjoint(update_fields)
+
+
+def _item_renamed(instance):
+    # Compared with what the item was loaded with; unknown counts as renamed
+    saved_serial_number = getattr(instance, '_saved_serial_number', DEFERRED)
+    return (
+        getattr(instance, '_saved_asset_id', None) != instance.asset_id
+        or saved_serial_number is DEFERRED or saved_serial_number != instance.serial_number
+    )
+
+
+@receiver(post_save, sender=Transfer)
+def sync_listing(sender, instance, raw=False, **kwargs):
+    if raw:  # loaddata; run rebuild_transfer_listings afterwards
+        return
+    listing.sync([instance.pk], using=kwargs.get('using'))
+
+
+@receiver(post_save, sender=Asset)
+@receiver(post_save, sender=AssetItem)
+@receiver(post_save, sender=Location)
+@receiver(post_save, sender=User)
+def rename_in_listings(sender, instance, created=False, raw=False, update_fields=None, **kwargs):
+    if created or raw or not _touches_listing(sender, update_fields):
+        return
+    if sender is Asset:
+        listing.rename_asset(instance.pk, instance.name)
+    elif sender is AssetItem:
+        if _item_renamed(instance):
+            listing.rename_asset_item(instance.pk, instance.serial_number, instance.asset_id)
+    elif sender is Location:
+        listing.rename_location(instance.pk, instance.name)
+    else:
+        listing.rename_user(instance.pk, instance.get_full_name())
+
+
+@receiver(post_delete, sender=User)
+def forget_deleted_approver(sender, instance, **kwargs):
+    listing.forget_approver([instance.pk])
+
+
+@receiver(pre_bulk_delete, sender=User)
+def forget_bulk_deleted_approvers(sender, queryset, **kwargs):
+    listing.forget_approver(list(queryset.values_list('pk', flat=True)))
@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import TransferViewSet
+from .views import TransferViewSet, IncomingTransfersAsyncView, OutgoingTransfersAsyncView
 
 app_name = 'transfers'
 
@@ -8,5 +8,7 @@ router = DefaultRouter()
 router.register(r'', TransferViewSet, basename='transfer')
 
 urlpatterns = [
+    path('async/incoming/', IncomingTransfersAsyncView.as_view(), name='transfer-incoming-async'),
+    path('async/outgoing/', OutgoingTransfersAsyncView.as_view(), name='transfer-outgoing-async'),
     path('', include(router.urls)),
 ]
@@ -4,31 +4,60 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.db.models import Q
 
-from .models import Transfer, TransferStatus
+from .filters import TransferFilterSet, TransferListingFilterSet
+from .models import Transfer, TransferListing, TransferStatus
+from .projections import TransferListingProjection, TransferProjection
 from .serializers import TransferSerializer, TransferCreateSerializer, TransferActionSerializer
+from core.async_views import AsyncAPIView
+from core.idempotency import IdempotencyMixin
+from core.sparse import SparseFieldsetMixin
 
 
-class TransferViewSet(viewsets.ModelViewSet):
+def transfers_for_location(user_location):
+    """Transfers involving a location, with everything TransferSerializer reads."""
+    # Users can see transfers involving their location
+    return Transfer.objects.filter(
+        Q(from_location=user_location) | Q(to_location=user_location)
+    ).select_related(
+        'asset_item__asset',
+        'from_location',
+        'to_location',
+        'requested_by',
+        'approved_by'
+    )
+
+
+def listings_for_location(user_location):
+    """
+    The same transfers from the TransferListing read model: a range scan of
+    one index on (location, ...), no OR and no joins.
+    """
+    return TransferListing.objects.filter(location=user_location)
+
+
+INCOMING_STATUSES = [TransferStatus.PENDING, TransferStatus.IN_TRANSIT]
+
+
+class TransferViewSet(IdempotencyMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     serializer_class = TransferSerializer
     permission_classes = [IsAuthenticated]
+    filterset_class = TransferFilterSet
     
     def get_queryset(self):
-        user = self.request.user
-        user_location = user.branch
-        
-        # Users can see transfers involving their location
-        queryset = Transfer.objects.filter(
-            Q(from_location=user_location) | Q(to_location=user_location)
-        ).select_related(
-            'asset_item__asset',
-            'from_location',
-            'to_location',
-            'requested_by',
-            'approved_by'
-        )
-        
-        return queryset
+        return transfers_for_location(self.request.user.branch)
     
+    def list(self, request, *args, **kwargs):
+        # Read-only listing is built from values_list() rows; output is
+        # identical to TransferSerializer(many=True).data.
+        if self.sparse_fieldset_requested():
+            return self.list_response(self.filter_queryset(self.get_queryset()), TransferProjection)
+        return self.listing_response(listings_for_location(request.user.branch))
+
+    def listing_response(self, listings):
+        """Full rows of a location's transfers, read from TransferListing."""
+        listings = TransferListingFilterSet.apply(listings, self.request.query_params)
+        return Response(TransferListingProjection().project(listings))
+
     def get_serializer_class(self):
         if self.action == 'create':
             return TransferCreateSerializer
@@ -38,20 +67,24 @@ class TransferViewSet(viewsets.ModelViewSet):
     def incoming(self, request):
         """Get incoming transfers for the user's location"""
         user_location = request.user.branch
-        transfers = self.get_queryset().filter(
-            to_location=user_location,
-            status__in=[TransferStatus.PENDING, TransferStatus.IN_TRANSIT]
-        )
-        serializer = self.get_serializer(transfers, many=True)
-        return Response(serializer.data)
+        if self.sparse_fieldset_requested():
+            transfers = self.filter_queryset(self.get_queryset()).filter(
+                to_location=user_location,
+                status__in=INCOMING_STATUSES
+            )
+            return self.list_response(transfers, TransferProjection)
+        return self.listing_response(listings_for_location(user_location).filter(
+            to_location=user_location, status__in=INCOMING_STATUSES,
+        ))
     
     @action(detail=False, methods=['get'])
     def outgoing(self, request):
         """Get outgoing transfers from the user's location"""
         user_location = request.user.branch
-        transfers = self.get_queryset().filter(from_location=user_location)
-        serializer = self.get_serializer(transfers, many=True)
-        return Response(serializer.data)
+        if self.sparse_fieldset_requested():
+            transfers = self.filter_queryset(self.get_queryset()).filter(from_location=user_location)
+            return self.list_response(transfers, TransferProjection)
+        return self.listing_response(listings_for_location(user_location).filter(from_location=user_location))
     
     @action(detail=True, methods=['post'])
     def approve(self, request, pk=None):
@@ -114,3 +147,24 @@ class TransferViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_200_OK
             )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class IncomingTransfersAsyncView(AsyncAPIView):
+    """Async equivalent of TransferViewSet.incoming for ASGI deployments."""
+
+    async def get(self, request):
+        user_location = request.user.branch
+        listings = listings_for_location(user_location).filter(
+            to_location=user_location,
+            status__in=INCOMING_STATUSES
+        )
+        return self.render(await TransferListingProjection().aproject(listings))
+
+
+class OutgoingTransfersAsyncView(AsyncAPIView):
+    """Async equivalent of TransferViewSet.outgoing for ASGI deployments."""
+
+    async def get(self, request):
+        user_location = request.user.branch
+        listings = listings_for_location(user_location).filter(from_location=user_location)
+        return self.render(await TransferListingProjection().aproject(listings))
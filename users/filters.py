@@ -0,0 +1,13 @@
+from core.filters import FilterSet, Filter, RANGE
+from .models import User
+
+
+class UserFilterSet(FilterSet):
+    model = User
+    filters = {
+        'role': Filter('role'),
+        'branch': Filter('branch'),
+        'is_active': Filter('is_active'),
+        'date_joined': Filter('date_joined', RANGE),
+    }
+    ordering_fields = ['username', 'date_joined', 'last_activity']
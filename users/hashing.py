@@ -0,0 +1,9 @@
+"""
+Password hashing for the provisioning process pool. Imported by spawned
+workers, so nothing here may need Django to be set up: the parent passes
+the configured hasher, which only needs hashlib (or its own library).
+"""
+
+
+def hash_passwords(passwords, hasher):
+    return [hasher.encode(password, hasher.salt()) for password in passwords]
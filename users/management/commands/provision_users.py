@@ -0,0 +1,47 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from users.models import User
+from users.provisioning import parse_csv, provision, validate_rows
+
+
+class Command(BaseCommand):
+    help = 'Create users in bulk from a CSV or JSON file, hashing passwords on a process pool'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='.csv with a header line, or .json with a list of user objects')
+        parser.add_argument('--created-by', help='Username recorded as creator of the new users')
+        parser.add_argument('--dry-run', action='store_true', help='Only validate the file')
+
+    def handle(self, *args, **options):
+        with open(options['path'], encoding='utf-8-sig') as source:
+            text = source.read()
+        rows = json.loads(text) if options['path'].lower().endswith('.json') else parse_csv(text)
+        if isinstance(rows, dict):
+            rows = rows.get('users')
+
+        created_by = None
+        if options['created_by']:
+            created_by = User.objects.filter(username=options['created_by']).first()
+            if created_by is None:
+                raise CommandError(f'No user "{options["created_by"]}".')
+
+        try:
+            users, errors = validate_rows(rows, created_by=created_by)
+        except ValidationError as exc:
+            raise CommandError(exc.detail)
+        for index, row_errors in errors.items():
+            for field, messages in row_errors.items():
+                self.stdout.write(self.style.ERROR(f'row {index + 1} {field}: {" ".join(map(str, messages))}'))
+        if errors:
+            raise CommandError(f'{len(errors)} invalid rows, nothing created')
+        if options['dry_run']:
+            self.stdout.write(self.style.SUCCESS(f'{len(users)} users are valid'))
+            return
+
+        started = time.perf_counter()
+        users = provision(users)
+        self.stdout.write(self.style.SUCCESS(f'Created {len(users)} users in {time.perf_counter() - started:.1f}s'))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-19 19:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='profile_image_digest',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64),
+        ),
+    ]
@@ -29,6 +29,8 @@ class User(AbstractUser):
     is_active = models.BooleanField(default=True)  # For soft delete
     last_activity = models.DateTimeField(default=timezone.now)
     profile_image = models.ImageField(upload_to='profile_images/', null=True, blank=True)
+    # SHA-256 of the image, set by images.signals; names its resized variants
+    profile_image_digest = models.CharField(max_length=64, blank=True, default='', editable=False)
 
     # Additional fields
     created_by = models.ForeignKey('self', on_delete=models.SET_NULL, null=True, blank=True, related_name='created_users')
@@ -38,6 +40,13 @@ class User(AbstractUser):
     class Meta:
         verbose_name = 'User'
         verbose_name_plural = 'Users'
+        # Back the filters and orderings declared in users/filters.py
+        indexes = [
+            models.Index(fields=['is_active'], name='user_is_active_idx'),
+            models.Index(fields=['date_joined'], name='user_date_joined_idx'),
+            models.Index(fields=['last_activity'], name='user_last_activity_idx'),
+            models.Index(fields=['branch', 'is_active'], name='user_branch_active_idx'),
+        ]
 
     def __str__(self):
         return self.username
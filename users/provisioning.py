@@ -0,0 +1,184 @@
+"""
+Bulk user provisioning.
+
+Rows (from JSON or CSV) are checked as a batch: field formats row by row,
+then usernames, roles and branches with one query each, and passwords
+against AUTH_PASSWORD_VALIDATORS. If any row fails nothing is created.
+Passwords are hashed on a process pool (PBKDF2 at Django's iteration
+count is the dominant cost, and scales with cores), and the users are
+inserted with ``bulk_create``, ``created_by``, ``role`` and ``branch``
+included. A row without a password gets an unusable one; the user sets it
+through the password reset flow.
+"""
+import csv
+import io
+import json
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, make_password
+from django.contrib.auth.password_validation import validate_password
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from rest_framework import serializers
+
+from core.pools import chunked, ordered_map, pool_size
+
+from location.models import Location
+
+from .hashing import hash_passwords
+from .models import User, UserRole
+
+HASH_CHUNK_SIZE = 8
+FIELDS = ('username', 'email', 'password', 'first_name', 'last_name', 'phone_number', 'role', 'branch', 'is_active')
+
+
+class ProvisionRowSerializer(serializers.Serializer):
+    """Format checks only; everything needing the database is checked per batch."""
+    username = serializers.CharField(max_length=150, validators=[User.username_validator])
+    email = serializers.EmailField(required=False, allow_blank=True, default='')
+    password = serializers.CharField(required=False, allow_blank=True, default='', trim_whitespace=False)
+    first_name = serializers.CharField(required=False, allow_blank=True, default='', max_length=150)
+    last_name = serializers.CharField(required=False, allow_blank=True, default='', max_length=150)
+    phone_number = serializers.CharField(required=False, allow_blank=True, allow_null=True, default=None, max_length=15)
+    # A role id or name (super_admin, branch_admin)
+    role = serializers.CharField(required=False, allow_blank=True, allow_null=True, default=None)
+    branch = serializers.IntegerField(required=False, allow_null=True, default=None)
+    is_active = serializers.BooleanField(required=False, default=True)
+
+
+def parse_csv(text):
+    """Rows of a CSV with a header line; empty cells are left out."""
+    reader = csv.DictReader(io.StringIO(text))
+    return [{key.strip(): value for key, value in row.items() if key and value not in (None, '')}
+            for row in reader]
+
+
+def parse_upload(upload):
+    """Rows of an uploaded .json (a list of objects) or .csv file."""
+    try:
+        text = upload.read().decode('utf-8-sig')
+    except UnicodeDecodeError:
+        raise serializers.ValidationError({'file': ['The file must be UTF-8 encoded.']})
+    if upload.name.lower().endswith('.json') or text.lstrip().startswith(('[', '{')):
+        try:
+            data = json.loads(text)
+        except ValueError as exc:
+            raise serializers.ValidationError({'file': [f'Invalid JSON: {exc}']})
+        return data.get('users') if isinstance(data, dict) else data
+    return parse_csv(text)
+
+
+def _resolve_role(value, roles):
+    if value in (None, ''):
+        return None
+    return roles.get(value) or roles.get(str(value).strip().lower())
+
+
+def validate_rows(rows, created_by=None):
+    """
+    Check ``rows`` as a batch. Returns (users, errors): unsaved User
+    instances with plain passwords still in ``_provision_password``, and
+    {row index: {field: [messages]}}.
+    """
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise serializers.ValidationError({'detail': ['Expected a list of user objects.']})
+    if not rows:
+        raise serializers.ValidationError({'detail': ['No users given.']})
+    if len(rows) > settings.PROVISION_MAX_ROWS:
+        raise serializers.ValidationError({'detail': [f'At most {settings.PROVISION_MAX_ROWS} users per batch.']})
+
+    errors, cleaned = {}, {}
+    for index, row in enumerate(rows):
+        serializer = ProvisionRowSerializer(data={key: row[key] for key in FIELDS if key in row})
+        if serializer.is_valid():
+            cleaned[index] = serializer.validated_data
+        else:
+            errors[index] = serializer.errors
+
+    # One query each for usernames, roles and branches
+    usernames = [data['username'] for data in cleaned.values()]
+    taken = set(User.objects.filter(username__in=usernames).values_list('username', flat=True))
+    roles = {}
+    for role in UserRole.objects.all():
+        roles[str(role.pk)] = roles[role.name] = role
+    branch_ids = {data['branch'] for data in cleaned.values() if data['branch'] is not None}
+    branches = Location.objects.in_bulk(branch_ids)
+
+    # Anyone but a super admin provisions their own branch only, and no
+    # super admins; without a branch they can't provision at all.
+    restricted = created_by is not None and not created_by.is_super_admin
+    own_branch = created_by.branch if restricted else None
+
+    seen, users = set(), {}
+    for index, data in cleaned.items():
+        row_errors = {}
+        username = data['username']
+        if username in taken:
+            row_errors['username'] = ['A user with that username already exists.']
+        elif username in seen:
+            row_errors['username'] = ['Username repeated in this batch.']
+        seen.add(username)
+
+        role = _resolve_role(data['role'], roles)
+        if data['role'] not in (None, '') and role is None:
+            row_errors['role'] = [f'Unknown role "{data["role"]}".']
+        elif restricted and role is not None and role.name == UserRole.SUPER_ADMIN:
+            row_errors['role'] = ['Only super admins can create super admins.']
+
+        branch = branches.get(data['branch']) if data['branch'] is not None else None
+        if data['branch'] is not None and branch is None:
+            row_errors['branch'] = [f'Location {data["branch"]} does not exist.']
+        if restricted:
+            if own_branch is None:
+                row_errors['branch'] = ['Only super admins can add users without a branch of their own.']
+            elif branch is not None and branch.pk != own_branch.pk:
+                row_errors['branch'] = ['Branch admins can only add users to their own branch.']
+            branch = own_branch
+
+        user = User(
+            username=username, email=data['email'], first_name=data['first_name'],
+            last_name=data['last_name'], phone_number=data['phone_number'], role=role,
+            branch=branch, is_active=data['is_active'],
+            created_by=created_by if created_by is not None and created_by.pk else None,
+        )
+        if data['password']:
+            try:
+                validate_password(data['password'], user)
+            except DjangoValidationError as exc:
+                row_errors['password'] = exc.messages
+        user._provision_password = data['password']
+
+        if row_errors:
+            errors[index] = row_errors
+        else:
+            users[index] = user
+    return [users[index] for index in sorted(users)], dict(sorted(errors.items()))
+
+
+def hash_all(users):
+    """Set every user's password hash, hashing on the provisioning pool."""
+    with_password = [user for user in users if user._provision_password]
+    hasher = get_hasher()
+    chunks = chunked([user._provision_password for user in with_password], HASH_CHUNK_SIZE)
+    hashes = (encoded for batch in ordered_map(
+        'passwords', pool_size(settings.PROVISION_WORKERS), hash_passwords, chunks, hasher,
+    ) for encoded in batch)
+    for user, encoded in zip(with_password, hashes):
+        user.password = encoded
+    for user in users:
+        if not user._provision_password:
+            user.password = make_password(None)
+        del user._provision_password
+
+
+def provision(users):
+    """Hash and insert validated users; returns them with their ids."""
+    hash_all(users)
+    with transaction.atomic():
+        User.objects.bulk_create(users, batch_size=500)
+        # Not every backend returns ids from a bulk insert
+        ids = dict(User.objects.filter(username__in=[user.username for user in users])
+                   .values_list('username', 'pk'))
+    for user in users:
+        user.pk = ids[user.username]
+    return users
@@ -1,6 +1,8 @@
 from rest_framework import serializers
 from django.contrib.auth.password_validation import validate_password
 from .models import User, UserRole, UserActivity
+from core.sparse import SparseFieldsetSerializerMixin
+from images.fields import ImageVariantsField
 
 class UserRoleSerializer(serializers.ModelSerializer):
     class Meta:
@@ -14,19 +16,27 @@ class UserActivitySerializer(serializers.ModelSerializer):
         fields = ['id', 'action', 'action_time', 'ip_address', 'user_agent']
         read_only_fields = ['id', 'action_time']
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     role_name = serializers.SerializerMethodField()
     branch_name = serializers.SerializerMethodField()
+    profile_image_variants = ImageVariantsField(source='profile_image_digest')
 
     class Meta:
         model = User
         fields = [
             'id', 'username', 'email', 'first_name', 'last_name',
             'phone_number', 'role', 'role_name', 'branch', 'branch_name',
-            'is_active', 'last_login', 'last_activity', 'profile_image',
+            'is_active', 'last_login', 'last_activity', 'profile_image', 'profile_image_variants',
             'date_joined', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'last_login', 'last_activity', 'date_joined', 'created_at', 'updated_at']
+        # Lists show the resized variants, never the original upload
+        extra_kwargs = {'profile_image': {'write_only': True}}
+        # Columns the method fields read, so sparse fieldsets can narrow the query
+        sparse_sources = {
+            'role_name': ['role.name'],
+            'branch_name': ['branch.name'],
+        }
 
     def get_role_name(self, obj):
         return obj.role.get_name_display() if obj.role else None
@@ -1,3 +1,47 @@
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from location.models import Location
+from .models import User, UserRole
+
+
+class ProvisionPermissionTests(TestCase):
+    url = '/api/users/users/bulk/'
+    payload = {'users': [{'username': 'evil1', 'role': UserRole.SUPER_ADMIN, 'password': 'Xy7!long-enough-pass'}]}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.super_admin_role = UserRole.objects.create(name=UserRole.SUPER_ADMIN)
+        cls.branch_admin_role = UserRole.objects.create(name=UserRole.BRANCH_ADMIN)
+        cls.branch = Location.objects.create(name='Branch', type='branch')
+
+    def post_as(self, user, payload=None):
+        client = APIClient()
+        client.force_authenticate(user)
+        return client.post(self.url, payload or self.payload, format='json')
+
+    def test_plain_user_is_forbidden(self):
+        user = User.objects.create_user(username='plain', password='x')
+        response = self.post_as(user)
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(User.objects.filter(username='evil1').exists())
+
+    def test_branchless_branch_admin_is_forbidden(self):
+        user = User.objects.create_user(username='admin', password='x', role=self.branch_admin_role)
+        response = self.post_as(user)
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(User.objects.filter(username='evil1').exists())
+
+    def test_branch_admin_cannot_create_super_admins(self):
+        user = User.objects.create_user(username='admin', password='x', role=self.branch_admin_role,
+                                        branch=self.branch)
+        response = self.post_as(user)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('role', response.data['errors'][0])
+
+    def test_branch_admin_provisions_own_branch(self):
+        user = User.objects.create_user(username='admin', password='x', role=self.branch_admin_role,
+                                        branch=self.branch)
+        response = self.post_as(user, {'users': [{'username': 'staff1', 'password': 'Xy7!long-enough-pass'}]})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(User.objects.get(username='staff1').branch, self.branch)
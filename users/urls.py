@@ -8,6 +8,7 @@ router.register(r'roles', views.UserRoleViewSet)
 router.register(r'activities', views.UserActivityViewSet)
 
 urlpatterns = [
+    path('users/async/me/', views.MeAsyncView.as_view(), name='user-me-async'),
     path('', include(router.urls)),
     path('auth/login/', views.CustomAuthToken.as_view(), name='auth-login'),
     path('auth/change-password/', views.ChangePasswordView.as_view(), name='auth-change-password'),
@@ -3,6 +3,7 @@ from django.contrib.auth import get_user_model
 from django.utils import timezone
 from rest_framework import viewsets, permissions, status, generics
 from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.authtoken.views import ObtainAuthToken
@@ -12,8 +13,15 @@ from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.utils.encoding import force_bytes
 from django.core.mail import send_mail
 from django.conf import settings
+from django.db import IntegrityError
 
+from core.async_views import AsyncAPIView
+from core.deletion import is_dry_run
+from core.sparse import SparseFieldsetMixin
+from core.throttling import AUTH, BULK, TokenBucketThrottle
+from .filters import UserFilterSet
 from .models import User, UserRole, UserActivity
+from .provisioning import parse_upload, provision, validate_rows
 from .serializers import (
     UserSerializer, UserCreateSerializer, UserUpdateSerializer,
     UserRoleSerializer, UserActivitySerializer,
@@ -35,8 +43,10 @@ class IsBranchAdmin(permissions.BasePermission):
             return obj.branch == request.user.branch
         return False
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = User.objects.all()
+    filterset_class = UserFilterSet
+    throttle_scopes = {'provision': BULK}
 
     def get_serializer_class(self):
         if self.action == 'create':
@@ -48,7 +58,7 @@ class UserViewSet(viewsets.ModelViewSet):
     def get_permissions(self):
         if self.action in ['list', 'retrieve']:
             permission_classes = [permissions.IsAuthenticated]
-        elif self.action in ['create', 'destroy']:
+        elif self.action in ['create', 'destroy', 'provision']:
             permission_classes = [IsSuperAdmin | IsBranchAdmin]
         elif self.action in ['update', 'partial_update']:
             permission_classes = [IsSuperAdmin | IsBranchAdmin]
@@ -73,6 +83,36 @@ class UserViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
 
+    @action(detail=False, methods=['post'], url_path='bulk', permission_classes=[IsSuperAdmin | IsBranchAdmin])
+    def provision(self, request):
+        """
+        Create many users at once from a JSON list (or {"users": [...]}) or an
+        uploaded .csv/.json ``file``; see users.provisioning for the columns.
+        All rows are validated first and nothing is created if any fails.
+        ?dry_run=1 only validates.
+        """
+        if not request.user.is_super_admin and request.user.branch is None:
+            raise PermissionDenied('Only super admins can provision users without a branch of their own.')
+        upload = request.FILES.get('file')
+        if upload is not None:
+            rows = parse_upload(upload)
+        else:
+            rows = request.data.get('users') if isinstance(request.data, dict) else request.data
+        users, errors = validate_rows(rows, created_by=request.user)
+        if errors:
+            return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+        if is_dry_run(request):
+            return Response({'dry_run': True, 'valid': len(users)})
+        try:
+            users = provision(users)
+        except IntegrityError:
+            return Response({'detail': 'Some usernames were taken while the batch was processed; retry it.'},
+                            status=status.HTTP_409_CONFLICT)
+        return Response({
+            'created': len(users),
+            'users': [{'id': user.pk, 'username': user.username} for user in users],
+        }, status=status.HTTP_201_CREATED)
+
     @action(detail=True, methods=['post'], permission_classes=[IsSuperAdmin])
     def deactivate(self, request, pk=None):
         user = self.get_object()
@@ -133,6 +173,10 @@ class UserActivityViewSet(viewsets.ModelViewSet):
         return UserActivity.objects.all().order_by('-action_time')
 
 class CustomAuthToken(ObtainAuthToken):
+    # ObtainAuthToken disables throttling; login gets its own small budget
+    throttle_classes = [TokenBucketThrottle]
+    throttle_scope = AUTH
+
     def post(self, request, *args, **kwargs):
         serializer = self.serializer_class(data=request.data,
                                            context={'request': request})
@@ -164,6 +208,7 @@ class CustomAuthToken(ObtainAuthToken):
 class ChangePasswordView(generics.UpdateAPIView):
     serializer_class = PasswordChangeSerializer
     permission_classes = [permissions.IsAuthenticated]
+    throttle_scope = AUTH
 
     def update(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -191,6 +236,7 @@ class ChangePasswordView(generics.UpdateAPIView):
 
 class PasswordResetRequestView(generics.GenericAPIView):
     serializer_class = PasswordResetSerializer
+    throttle_scope = AUTH
 
     def post(self, request):
         serializer = self.get_serializer(data=request.data)
@@ -230,6 +276,8 @@ class PasswordResetRequestView(generics.GenericAPIView):
         return Response({"status": "password reset email has been sent"})
 
 class PasswordResetConfirmView(generics.GenericAPIView):
+    throttle_scope = AUTH
+
     def post(self, request, uidb64, token):
         try:
             # Decode user id
@@ -264,3 +312,10 @@ class PasswordResetConfirmView(generics.GenericAPIView):
             return Response({"error": "Invalid reset link"},
                           status=status.HTTP_400_BAD_REQUEST)
 
+
+class MeAsyncView(AsyncAPIView):
+    """Async equivalent of UserViewSet.me for ASGI deployments."""
+
+    async def get(self, request):
+        serializer = UserSerializer(request.user, context={'request': request})
+        return self.render(serializer.data)
@@ -0,0 +1,140 @@
+"""
+Warranties about to run out: asset items by ``warranty_expiry_date`` and
+assets by their own ``warranty_date``.
+
+Every read is one range scan of an index on the expiry column:
+``assetitem_loc_warranty_idx`` (location, warranty_expiry_date) for a
+branch's items, ``assetitem_warranty_idx`` across branches, and
+``asset_warranty_date_idx`` for assets. Retired items are excluded by
+AssetItem's default manager.
+"""
+import datetime
+
+from django.db.models import Count, Max, Min
+
+from asset.models import Asset
+from assetitem.models import AssetItem
+
+from .models import WarrantyDigest
+
+ITEM_FIELDS = ('id', 'serial_number', 'asset_id', 'asset__name', 'location_id', 'location__name',
+               'vendor_id', 'vendor__name', 'status', 'warranty_expiry_date')
+ASSET_FIELDS = ('id', 'name', 'location_id', 'location__name', 'vendor_id', 'vendor__name', 'warranty_date')
+
+
+def window(start, days):
+    return start, start + datetime.timedelta(days=days)
+
+
+def expiring(start, days, location_id=None):
+    """Items whose warranty expires within ``days`` of ``start`` (inclusive)."""
+    items = AssetItem.objects.filter(warranty_expiry_date__range=window(start, days))
+    if location_id is not None:
+        items = items.filter(location_id=location_id)
+    return items
+
+
+def expiring_assets(start, days, location_id=None):
+    """Assets whose own warranty expires within ``days`` of ``start`` (inclusive)."""
+    assets = Asset.objects.filter(warranty_date__range=window(start, days))
+    if location_id is not None:
+        assets = assets.filter(location_id=location_id)
+    return assets
+
+
+def _group(groups, vendor_id, vendor_name):
+    return groups.setdefault(vendor_id, {
+        'vendor': vendor_id, 'vendor_name': vendor_name, 'count': 0, 'asset_count': 0,
+        'earliest_expiry': None, 'items': [], 'assets': [],
+    })
+
+
+def _earliest(group, date):
+    if group['earliest_expiry'] is None or date < group['earliest_expiry']:
+        group['earliest_expiry'] = date
+
+
+def by_vendor(start, days, location_id=None, limit=None):
+    """
+    The expiring items and assets grouped by vendor, soonest expiry first:
+    one aggregate over each range for the counts, one read of up to
+    ``limit`` rows each for the lists. Returns (groups, truncated).
+    """
+    items = expiring(start, days, location_id)
+    assets = expiring_assets(start, days, location_id)
+    groups = {}
+    for vendor_id, vendor_name, count, earliest in (
+            items.values_list('vendor_id', 'vendor__name')
+            .annotate(count=Count('id'), earliest=Min('warranty_expiry_date'))
+            .order_by()):
+        group = _group(groups, vendor_id, vendor_name)
+        group['count'] = count
+        _earliest(group, earliest)
+    for vendor_id, vendor_name, count, earliest in (
+            assets.values_list('vendor_id', 'vendor__name')
+            .annotate(count=Count('id'), earliest=Min('warranty_date'))
+            .order_by()):
+        group = _group(groups, vendor_id, vendor_name)
+        group['asset_count'] = count
+        _earliest(group, earliest)
+
+    item_rows = items.order_by('warranty_expiry_date', 'id').values(*ITEM_FIELDS)
+    listed = 0
+    for row in item_rows[:limit] if limit is not None else item_rows:
+        groups[row['vendor_id']]['items'].append({
+            'id': row['id'],
+            'serial_number': row['serial_number'],
+            'asset': row['asset_id'],
+            'asset_name': row['asset__name'],
+            'location': row['location_id'],
+            'location_name': row['location__name'],
+            'status': row['status'],
+            'warranty_expiry_date': row['warranty_expiry_date'],
+        })
+        listed += 1
+    asset_rows = assets.order_by('warranty_date', 'id').values(*ASSET_FIELDS)
+    for row in asset_rows[:limit] if limit is not None else asset_rows:
+        groups[row['vendor_id']]['assets'].append({
+            'id': row['id'],
+            'name': row['name'],
+            'location': row['location_id'],
+            'location_name': row['location__name'],
+            'warranty_date': row['warranty_date'],
+        })
+        listed += 1
+    total = sum(group['count'] + group['asset_count'] for group in groups.values())
+    ordered = sorted(groups.values(), key=lambda group: (group['earliest_expiry'], group['vendor'] or 0))
+    return ordered, listed < total
+
+
+def build_digest(date, days):
+    """
+    Replace ``date``'s digest rows: one aggregate over each expiry range,
+    grouped by (location, vendor). Returns the rows written.
+    """
+    rows = {}
+    for location_id, vendor_id, count, earliest, latest in (
+            expiring(date, days).values_list('location_id', 'vendor_id')
+            .annotate(count=Count('id'), earliest=Min('warranty_expiry_date'),
+                      latest=Max('warranty_expiry_date'))
+            .order_by()):
+        rows[location_id, vendor_id] = WarrantyDigest(
+            date=date, days=days, location_id=location_id, vendor_id=vendor_id,
+            item_count=count, earliest_expiry=earliest, latest_expiry=latest,
+        )
+    for location_id, vendor_id, count, earliest, latest in (
+            expiring_assets(date, days).values_list('location_id', 'vendor_id')
+            .annotate(count=Count('id'), earliest=Min('warranty_date'), latest=Max('warranty_date'))
+            .order_by()):
+        row = rows.get((location_id, vendor_id))
+        if row is None:
+            rows[location_id, vendor_id] = WarrantyDigest(
+                date=date, days=days, location_id=location_id, vendor_id=vendor_id,
+                item_count=0, asset_count=count, earliest_expiry=earliest, latest_expiry=latest,
+            )
+        else:
+            row.asset_count = count
+            row.earliest_expiry = min(row.earliest_expiry, earliest)
+            row.latest_expiry = max(row.latest_expiry, latest)
+    WarrantyDigest.objects.filter(date=date).delete()
+    return WarrantyDigest.objects.bulk_create(rows.values())
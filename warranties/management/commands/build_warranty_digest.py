@@ -0,0 +1,39 @@
+import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from warranties.expiry import build_digest
+from warranties.notifications import queue_digest
+
+
+class Command(BaseCommand):
+    help = (
+        'Precompute the daily warranty expiry digest and queue it for the admins '
+        '(run daily, e.g. from cron, before send_queued_mail)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', help='Digest date as YYYY-MM-DD (default: today)')
+        parser.add_argument('--days', type=int, default=None,
+                            help='Look-ahead in days (default: WARRANTY_EXPIRY_DAYS)')
+        parser.add_argument('--no-notify', action='store_true', help='Build the digest without queueing mail')
+
+    def handle(self, *args, **options):
+        try:
+            date = datetime.date.fromisoformat(options['date']) if options['date'] else timezone.localdate()
+        except ValueError:
+            raise CommandError('--date must be YYYY-MM-DD')
+        days = options['days'] if options['days'] is not None else settings.WARRANTY_EXPIRY_DAYS
+
+        with transaction.atomic():
+            rows = build_digest(date, days)
+            queued = 0 if options['no_notify'] else queue_digest(date)
+        items = sum(row.item_count for row in rows)
+        assets = sum(row.asset_count for row in rows)
+        self.stdout.write(self.style.SUCCESS(
+            f'{date}: {items} items and {assets} assets expiring within {days} days in {len(rows)} digest rows, '
+            f'{queued} emails queued'
+        ))
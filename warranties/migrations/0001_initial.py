@@ -0,0 +1,35 @@
+# Generated by Django 5.2.1 on 2026-10-19 19:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('location', '0001_initial'),
+        ('vendor', '0002_updated_at_auto_now'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WarrantyDigest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('days', models.PositiveSmallIntegerField()),
+                ('item_count', models.PositiveIntegerField()),
+                ('earliest_expiry', models.DateField()),
+                ('latest_expiry', models.DateField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('location', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='location.location')),
+                ('vendor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='vendor.vendor')),
+            ],
+            options={
+                'ordering': ['date', 'location', 'earliest_expiry'],
+                'indexes': [models.Index(fields=['date', 'location'], name='warranty_digest_date_loc_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-19 20:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('warranties', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='warrantydigest',
+            name='asset_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import models
+
+from location.models import Location
+from vendor.models import Vendor
+
+
+class WarrantyDigest(models.Model):
+    """
+    One line of the daily warranty expiry digest: the asset items and assets
+    of a (location, vendor) whose warranty runs out between ``date`` and
+    ``date + days``. Built by ``build_warranty_digest``; a rebuild of a day
+    replaces its rows.
+    """
+    date = models.DateField()
+    days = models.PositiveSmallIntegerField()
+    location = models.ForeignKey(Location, null=True, blank=True, on_delete=models.CASCADE, related_name='+')
+    vendor = models.ForeignKey(Vendor, null=True, blank=True, on_delete=models.CASCADE, related_name='+')
+    item_count = models.PositiveIntegerField()
+    asset_count = models.PositiveIntegerField(default=0)
+    earliest_expiry = models.DateField()
+    latest_expiry = models.DateField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['date', 'location', 'earliest_expiry']
+        indexes = [
+            models.Index(fields=['date', 'location'], name='warranty_digest_date_loc_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.date}: {self.item_count} items, {self.asset_count} assets at {self.location_id} from {self.vendor_id}"
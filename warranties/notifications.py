@@ -0,0 +1,42 @@
+from django.db.models import Q
+
+from core import mailer
+from users.models import User, UserRole
+
+from .expiry import window
+from .models import WarrantyDigest
+
+
+def _body(date, days, rows):
+    lines = [f'Warranties expiring between {date} and {window(date, days)[1]}:', '']
+    location = object()
+    for row in rows:
+        if row.location_id != location:
+            location = row.location_id
+            lines.append(row.location.name if row.location else 'No location')
+        vendor = row.vendor.name if row.vendor else 'No vendor'
+        lines.append(f'  {vendor}: {row.item_count} items, {row.asset_count} assets, first on {row.earliest_expiry}')
+    return '\n'.join(lines)
+
+
+def queue_digest(date):
+    """
+    Queue ``date``'s digest for mailing: super admins get every branch,
+    branch admins their own. Returns the number of messages queued.
+    """
+    rows = list(WarrantyDigest.objects.filter(date=date).select_related('location', 'vendor')
+                .order_by('location__name', 'location_id', 'earliest_expiry'))
+    if not rows:
+        return 0
+    days = rows[0].days
+
+    recipients = User.objects.filter(is_active=True).exclude(email='').filter(
+        Q(role__name=UserRole.SUPER_ADMIN) | Q(role__name=UserRole.BRANCH_ADMIN, branch__isnull=False),
+    ).select_related('role')
+    subject = f'Warranties expiring in the next {days} days'
+    messages = []
+    for user in recipients:
+        mine = rows if user.is_super_admin else [row for row in rows if row.location_id == user.branch_id]
+        if mine:
+            messages.append((f'warranty-digest:{date}:{user.pk}', [user.email], subject, _body(date, days, mine)))
+    return mailer.queue(messages)
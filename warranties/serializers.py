@@ -0,0 +1,13 @@
+from rest_framework import serializers
+
+from .models import WarrantyDigest
+
+
+class WarrantyDigestSerializer(serializers.ModelSerializer):
+    location_name = serializers.CharField(source='location.name', read_only=True, default=None)
+    vendor_name = serializers.CharField(source='vendor.name', read_only=True, default=None)
+
+    class Meta:
+        model = WarrantyDigest
+        fields = ['id', 'date', 'days', 'location', 'location_name', 'vendor', 'vendor_name',
+                  'item_count', 'asset_count', 'earliest_expiry', 'latest_expiry']
@@ -0,0 +1,44 @@
+import datetime
+
+from django.test import TestCase
+
+from asset.models import Asset
+from assetitem.models import AssetItem
+from category.models import Category
+from location.models import Location
+from vendor.models import Vendor
+
+from .expiry import build_digest, by_vendor
+
+TODAY = datetime.date(2026, 1, 1)
+
+
+class ExpiryTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.branch = Location.objects.create(name='Branch')
+        cls.vendor = Vendor.objects.create(name='Vendor')
+        category = Category.objects.create(name='Chairs')
+        soon, later = TODAY + datetime.timedelta(days=3), TODAY + datetime.timedelta(days=20)
+        cls.asset = Asset.objects.create(name='Wheelchair', category=category, location=cls.branch,
+                                         vendor=cls.vendor, warranty_date=soon)
+        Asset.objects.create(name='Old stock', category=category, location=cls.branch, warranty_date=later)
+        AssetItem.objects.create(asset=cls.asset, location=cls.branch, vendor=cls.vendor, warranty_expiry_date=later)
+        AssetItem.objects.create(asset=cls.asset, location=cls.branch, vendor=cls.vendor,
+                                 warranty_expiry_date=TODAY + datetime.timedelta(days=90))
+
+    def test_groups_include_assets_by_their_own_warranty(self):
+        groups, truncated = by_vendor(TODAY, 30, self.branch.pk)
+        self.assertFalse(truncated)
+        self.assertEqual(
+            [(group['vendor'], group['count'], group['asset_count'], group['earliest_expiry']) for group in groups],
+            [(self.vendor.pk, 1, 1, self.asset.warranty_date), (None, 0, 1, TODAY + datetime.timedelta(days=20))],
+        )
+        self.assertEqual(groups[0]['assets'][0]['name'], 'Wheelchair')
+
+    def test_digest_counts_items_and_assets(self):
+        rows = {row.vendor_id: row for row in build_digest(TODAY, 30)}
+        self.assertEqual((rows[self.vendor.pk].item_count, rows[self.vendor.pk].asset_count), (1, 1))
+        self.assertEqual(rows[self.vendor.pk].earliest_expiry, self.asset.warranty_date)
+        self.assertEqual((rows[None].item_count, rows[None].asset_count), (0, 1))
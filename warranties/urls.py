@@ -0,0 +1,10 @@
+from django.urls import path
+
+from .views import ExpiringWarrantiesView, WarrantyDigestView
+
+app_name = 'warranties'
+
+urlpatterns = [
+    path('expiring/', ExpiringWarrantiesView.as_view(), name='expiring'),
+    path('digest/', WarrantyDigestView.as_view(), name='digest'),
+]
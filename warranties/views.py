@@ -0,0 +1,99 @@
+import datetime
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .expiry import by_vendor, window
+from .models import WarrantyDigest
+from .serializers import WarrantyDigestSerializer
+
+MAX_DAYS = 366
+ITEM_LIMIT = 500
+MAX_ITEM_LIMIT = 5000
+
+
+def _int_param(params, name, default=None, low=None, high=None):
+    try:
+        value = int(params[name]) if params.get(name) else default
+    except ValueError:
+        raise ValidationError({name: ['A valid integer is required.']})
+    if value is not None and low is not None:
+        value = max(value, low)
+    if value is not None and high is not None:
+        value = min(value, high)
+    return value
+
+
+def _date_param(params, name):
+    try:
+        return datetime.date.fromisoformat(params[name]) if params.get(name) else None
+    except ValueError:
+        raise ValidationError({name: ['Enter a valid date (YYYY-MM-DD).']})
+
+
+def _branch(user):
+    return user.branch.pk if user.is_branch_admin and user.branch else None
+
+
+class ExpiringWarrantiesView(APIView):
+    """
+    Asset items and assets whose warranty expires in the next N days,
+    grouped by vendor.
+
+    ?days=      look-ahead (default WARRANTY_EXPIRY_DAYS, at most 366)
+    ?location=  location id; branch admins always get their branch
+    ?limit=     items, and assets, listed across all vendors (default 500, at
+                most 5000); vendor counts always cover the whole range
+
+    One range scan of a warranty expiry index per query.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        params = request.query_params
+        days = _int_param(params, 'days', settings.WARRANTY_EXPIRY_DAYS, 0, MAX_DAYS)
+        limit = _int_param(params, 'limit', ITEM_LIMIT, 1, MAX_ITEM_LIMIT)
+        location_id = _branch(request.user) or _int_param(params, 'location')
+
+        start, end = window(timezone.localdate(), days)
+        vendors, truncated = by_vendor(start, days, location_id, limit)
+        return Response({
+            'from': start,
+            'to': end,
+            'location': location_id,
+            'total': sum(group['count'] for group in vendors),
+            'asset_total': sum(group['asset_count'] for group in vendors),
+            'truncated': truncated,
+            'vendors': vendors,
+        })
+
+
+class WarrantyDigestView(APIView):
+    """
+    The precomputed daily digest written by build_warranty_digest.
+
+    ?date=      digest date (default: the latest one built)
+    ?location=  location id; branch admins always get their branch
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        params = request.query_params
+        date = _date_param(params, 'date') or WarrantyDigest.objects.order_by('-date').values_list(
+            'date', flat=True).first()
+        location_id = _branch(request.user) or _int_param(params, 'location')
+
+        rows = WarrantyDigest.objects.filter(date=date).select_related('location', 'vendor')
+        if location_id is not None:
+            rows = rows.filter(location_id=location_id)
+        rows = list(rows)
+        return Response({
+            'date': date,
+            'total': sum(row.item_count for row in rows),
+            'asset_total': sum(row.asset_count for row in rows),
+            'rows': WarrantyDigestSerializer(rows, many=True).data,
+        })